@@ -0,0 +1,6 @@
+import os
+
+from yaht import tracing
+
+if os.environ.get(tracing.ENV_VAR):
+    tracing.start_from_environment()
@@ -0,0 +1,102 @@
+# src/yaht/cache.py
+import threading
+from collections import Counter, OrderedDict
+from typing import Protocol
+
+from yaht.category import Category
+from yaht.dicetypes import DiceRoll, roll_index
+from yaht.scorecard import ScorecardLike
+from yaht.scorecheck import filled_mask
+
+DEFAULT_MAX_SIZE = 1 << 16
+
+# Decision stage: rolls left for reroll decisions, SCORE_STAGE for category choice
+SCORE_STAGE = 0
+
+# Packed reroll decisions hold the sorted dice positions to reroll in bits 0-4;
+# KEEP_ROLLING marks that the player may reroll again afterwards
+ALL_POSITIONS = 0b11111
+KEEP_ROLLING = 1 << 5
+
+
+def decision_key(roll: DiceRoll, card: ScorecardLike, stage: int) -> int:
+    """Pack (roll index, filled mask, stage, Yahtzee bonus flag) into one int.
+
+    Bit layout: roll index 16-23, filled category mask 3-15, stage 1-2 and
+    bonus flag 0. The joker rules are fully determined by the roll and mask.
+    """
+    bonus_flag = card.category_scores[Category.YAHTZEE] == 50
+    return roll_index(roll) << 16 | filled_mask(card) << 3 | stage << 1 | bonus_flag
+
+
+def roll_positions(roll: DiceRoll, positions: int) -> list[int]:
+    """Indices into roll holding the dice at the sorted positions in mask."""
+    wanted = Counter(n for i, n in enumerate(sorted(roll)) if positions >> i & 1)
+    indices = []
+    for index, number in enumerate(roll):
+        if wanted[number]:
+            wanted[number] -= 1
+            indices.append(index)
+    return indices
+
+
+class DecisionStore(Protocol):
+    """What players need from a decision cache; DecisionCache and SharedDecisionCache fit."""
+
+    def get(self, key: int) -> int | None:
+        raise NotImplementedError()
+
+    def put(self, key: int, decision: int) -> None:
+        raise NotImplementedError()
+
+
+class DecisionCache:
+    """Bounded least-recently-used map from packed keys to packed decisions.
+
+    Safe to share between threads; lookups and counters are updated under a lock.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        if max_size < 1:
+            raise ValueError("Cache size must be positive")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[int, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: int) -> int | None:
+        """Return the cached decision for key, or None on a miss."""
+        with self._lock:
+            decision = self._entries.get(key)
+            if decision is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return decision
+
+    def put(self, key: int, decision: int) -> None:
+        """Store decision, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = decision
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -26,29 +26,39 @@ class Category(Enum):
     YAHTZEE = CategoryValue("YAHTZEE", None, Section.LOWER)
     CHANCE = CategoryValue("CHANCE", None, Section.LOWER)
 
-    @property
-    def die_number(self) -> int | None:
-        return self.value.number
+    # Plain attributes copied out of the value so hot loops skip .value lookups
+    index: int
+    bit: int
+    die_number: int | None
+    section: Section
 
-    @property
-    def section(self) -> Section:
-        return self.value.section
+    def __init__(self, _name: str, number: int | None, section: Section):
+        self.die_number = number
+        self.section = section
 
     @classmethod
     def get_upper_categories(cls) -> list["Category"]:
-        return [c for c in cls if c.section == Section.UPPER]
+        return list(UPPER_CATEGORIES)
 
     @classmethod
     def get_lower_categories(cls) -> list["Category"]:
-        return [c for c in cls if c.section == Section.LOWER]
+        return list(LOWER_CATEGORIES)
 
     @classmethod
     def from_number(cls, die: int) -> "Category":
-        return {
-            1: cls.ACES,
-            2: cls.TWOS,
-            3: cls.THREES,
-            4: cls.FOURS,
-            5: cls.FIVES,
-            6: cls.SIXES,
-        }[die]
+        return _UPPER_BY_NUMBER[die]
+
+
+# Position in Category order and the matching bit in a 13-bit category mask
+for _index, _category in enumerate(Category):
+    _category.index = _index
+    _category.bit = 1 << _index
+
+CATEGORIES: tuple[Category, ...] = tuple(Category)
+UPPER_CATEGORIES = tuple(c for c in CATEGORIES if c.section is Section.UPPER)
+LOWER_CATEGORIES = tuple(c for c in CATEGORIES if c.section is Section.LOWER)
+UPPER_MASK = sum(c.bit for c in UPPER_CATEGORIES)
+LOWER_MASK = sum(c.bit for c in LOWER_CATEGORIES)
+FULL_MASK = UPPER_MASK | LOWER_MASK
+
+_UPPER_BY_NUMBER = {c.die_number: c for c in UPPER_CATEGORIES}
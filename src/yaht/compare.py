@@ -0,0 +1,138 @@
+# src/yaht/compare.py
+"""Paired strategy comparison on common dice.
+
+Each pair of games gives both strategies the same per-turn dice stream, so
+luck largely cancels out of the score difference and far fewer games are
+needed than when comparing independent runs.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from math import sqrt
+from statistics import NormalDist
+from typing import TYPE_CHECKING
+
+from yaht.simulation import play_common_dice_game
+
+if TYPE_CHECKING:
+    from yaht.player import Player
+
+
+@dataclass
+class Comparison:
+    """Paired score difference (player_a minus player_b) over common dice."""
+
+    games: int
+    mean_difference: float
+    standard_deviation: float
+    confidence_interval: tuple[float, float]
+    significant: bool
+
+    @property
+    def standard_error(self) -> float:
+        return self.standard_deviation / sqrt(self.games) if self.games else float("inf")
+
+
+class _RunningDifference:
+    """Mean and sum of squared deviations, merged a batch at a time."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.squares = 0.0
+
+    def merge(self, differences: list[int]) -> None:
+        count = len(differences)
+        if not count:
+            return
+        mean = sum(differences) / count
+        squares = sum((d - mean) ** 2 for d in differences)
+        total = self.count + count
+        delta = mean - self.mean
+        self.squares += squares + delta * delta * self.count * count / total
+        self.mean += delta * count / total
+        self.count = total
+
+    @property
+    def variance(self) -> float:
+        return self.squares / (self.count - 1) if self.count > 1 else 0.0
+
+
+def play_pairs(player_a: "Player", player_b: "Player", seeds: range) -> list[int]:
+    """Score differences of player_a over player_b on each seed's common dice."""
+    return [
+        play_common_dice_game(player_a, seed) - play_common_dice_game(player_b, seed)
+        for seed in seeds
+    ]
+
+
+def compare(
+    player_a: "Player",
+    player_b: "Player",
+    max_games: int = 100_000,
+    min_games: int = 200,
+    batch_size: int = 500,
+    confidence: float = 0.95,
+    processes: int | None = None,
+    seed: int = 0,
+) -> Comparison:
+    """Play paired games until the difference is significant or max_games is spent.
+
+    The confidence interval is checked after every batch once min_games have
+    been played. Batches run in a process pool (players must be picklable);
+    with processes=1 they run in this process. Results are folded in batch
+    order, so a given seed always yields the same comparison.
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    running = _RunningDifference()
+    batches = (
+        range(start, min(start + batch_size, seed + max_games))
+        for start in range(seed, seed + max_games, batch_size)
+    )
+
+    def done() -> bool:
+        if running.count >= max_games:
+            return True
+        return running.count >= min_games and abs(running.mean) > _half_width(running, z)
+
+    if processes == 1:
+        for seeds in batches:
+            running.merge(play_pairs(player_a, player_b, seeds))
+            if done():
+                break
+        return _summarize(running, z)
+
+    workers = processes or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        pending: deque[Future[list[int]]] = deque()
+        for seeds in batches:
+            pending.append(pool.submit(play_pairs, player_a, player_b, seeds))
+            if len(pending) < workers:
+                continue
+            running.merge(pending.popleft().result())
+            if done():
+                break
+        else:
+            while pending and not done():
+                running.merge(pending.popleft().result())
+        for future in pending:
+            future.cancel()
+
+    return _summarize(running, z)
+
+
+def _half_width(running: _RunningDifference, z: float) -> float:
+    return z * sqrt(running.variance / running.count)
+
+
+def _summarize(running: _RunningDifference, z: float) -> Comparison:
+    half_width = _half_width(running, z) if running.count else float("inf")
+    return Comparison(
+        games=running.count,
+        mean_difference=running.mean,
+        standard_deviation=sqrt(running.variance),
+        confidence_interval=(running.mean - half_width, running.mean + half_width),
+        significant=abs(running.mean) > half_width,
+    )
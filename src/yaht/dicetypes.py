@@ -1,7 +1,11 @@
 # src/yaht/dice.py
+import threading
+from array import array
+from bisect import bisect_right
 from collections import Counter
-from random import randint
-from typing import Any, Iterator
+from itertools import combinations_with_replacement, repeat
+from random import Random
+from typing import Any, Iterable, Iterator, Sequence
 
 from yaht.category import Category, Section
 from yaht.exceptions import (
@@ -12,11 +16,62 @@ from yaht.exceptions import (
 
 MAX_ROLL_COUNT = 3
 
+# Every distinct roll as a sorted tuple; a roll's position here is its index
+CANONICAL_ROLLS: tuple[tuple[int, ...], ...] = tuple(
+    combinations_with_replacement(range(1, 7), 5)
+)
+_ROLL_INDICES = {roll: index for index, roll in enumerate(CANONICAL_ROLLS)}
+
+
+_thread_state = threading.local()
+
+
+def thread_rng() -> Random:
+    """This thread's own generator, used by dice rolled without an explicit rng.
+
+    Keeping one per thread means no generator state is shared between threads.
+    """
+    rng = getattr(_thread_state, "rng", None)
+    if rng is None:
+        rng = _thread_state.rng = Random()
+    return rng
+
+
+def randint(a: int, b: int) -> int:
+    """Random integer in [a, b] from this thread's generator."""
+    return thread_rng().randint(a, b)
+
+
+def roll_index(numbers: Iterable[int]) -> int:
+    """Return the index (0-251) of the canonical roll holding numbers."""
+    return _ROLL_INDICES[tuple(sorted(numbers))]
+
+
+# A uniform 32-bit word w maps to die floor(6 * w / 2**32) + 1 by counting the
+# thresholds at or below it, which bisect does in C (bias below 1e-9)
+_DIE_THRESHOLDS = [-1] + [-(-k * 2**32 // 6) for k in range(1, 6)]
+
+
+def _dice_from_bytes(data: bytes) -> bytes:
+    words = array("I")
+    words.frombytes(data)
+    return bytes(map(bisect_right, repeat(_DIE_THRESHOLDS), words))
+
 
 class DiceCup:
-    def __init__(self):
+    __slots__ = ("_rng", "_roll_count", "_stored_roll", "_stored_batch")
+
+    def __init__(self, rng: Random | None = None):
+        self._rng = rng
         self._roll_count = 0
         self._stored_roll: DiceRoll | None = None
+        self._stored_batch: bytearray | None = None
+
+    def reset(self) -> None:
+        """Empty the cup for a new turn, as if newly created with the same rng."""
+        self._roll_count = 0
+        self._stored_roll = None
+        self._stored_batch = None
 
     def roll_dice(self, indices: list[int] | None = None) -> "DiceRoll":
         # Manage roll cup lifecycle
@@ -26,23 +81,64 @@ class DiceCup:
 
         # Do full dice rull first time through or if no indices specified
         if self._stored_roll is None or indices is None:
-            self._stored_roll = DiceRoll()
+            self._stored_roll = DiceRoll([self._roll_die() for _ in range(5)])
             return DiceRoll(self._stored_roll.numbers)  # copy for safety
 
         # On re-roll (with indices) do index-based reroll
         updated_numbers = self._stored_roll.numbers
         for index in indices:
-            updated_numbers[index] = randint(1, 6)
+            updated_numbers[index] = self._roll_die()
         self._stored_roll = DiceRoll(updated_numbers)
 
         return DiceRoll(self._stored_roll.numbers)  # copy for safety
 
+    def roll_many(self, count: int, keep_masks: Sequence[int] | None = None) -> memoryview:
+        """Roll count sets of five dice at once and return them as a (count, 5) array.
+
+        With keep_masks, row i keeps the positions set in the 5-bit mask
+        keep_masks[i] from the previous roll_many call and rerolls the rest.
+        All new dice come from one draw of random bytes.
+        """
+        if keep_masks is None or self._stored_batch is None:
+            if keep_masks is not None:
+                raise ValueError("Nothing to keep before the first roll_many")
+            self._stored_batch = bytearray(self._random_dice(5 * count))
+        else:
+            if len(keep_masks) != count or len(self._stored_batch) != 5 * count:
+                raise ValueError(f"Expected {len(self._stored_batch) // 5} keep masks")
+            positions = [
+                5 * row + die
+                for row, mask in enumerate(keep_masks)
+                for die in range(5)
+                if not mask >> die & 1
+            ]
+            batch = self._stored_batch
+            for position, number in zip(positions, self._random_dice(len(positions))):
+                batch[position] = number
+
+        return memoryview(bytes(self._stored_batch)).cast("B", (count, 5))
+
+    def _random_dice(self, count: int) -> bytes:
+        randbytes = (thread_rng() if self._rng is None else self._rng).randbytes
+        return _dice_from_bytes(randbytes(4 * count))
+
+    def _roll_die(self) -> int:
+        # Fall back to this thread's generator when no rng was supplied
+        return randint(1, 6) if self._rng is None else self._rng.randint(1, 6)
+
+    @property
+    def roll_count(self) -> int:
+        """Number of times the cup has been rolled this turn."""
+        return self._roll_count
+
     @property
     def current_role(self) -> "DiceRoll | None":
         return None if self._stored_roll is None else DiceRoll(self._stored_roll.numbers)
 
 
 class DiceRoll:
+    __slots__ = ("_numbers",)
+
     def __init__(self, numbers: list[int] | None = None):
         """Validate dice_list in accord with Yahtzee rules and initialize class."""
         if numbers is None:
@@ -56,12 +152,12 @@ class DiceRoll:
         if any(d < 1 or d > 6 for d in numbers):
             raise DieValueError("The value of all dice must be between 1 and 6.")
 
-        # Copy to avoid risk that dice_list argument is later mutated by caller
-        self._numbers = numbers.copy()
+        # Stored as bytes, which also copies the caller's list
+        self._numbers = bytes(numbers)
 
     def __repr__(self) -> str:
         """Return string representation of the dice roll."""
-        return f"DiceRoll({self._numbers})"
+        return f"DiceRoll({list(self._numbers)})"
 
     def __len__(self) -> int:
         """Return the number of dice (always 5 for Yahtzee)."""
@@ -79,12 +175,12 @@ class DiceRoll:
 
     def __contains__(self, element: Any) -> bool:
         if isinstance(element, int):
-            return element in self._numbers
+            return 1 <= element <= 6 and element in self._numbers
 
         if not isinstance(element, Category):
             return False
 
-        if element.section == Section.UPPER or element == Category.CHANCE:
+        if element.section is Section.UPPER or element is Category.CHANCE:
             return True  # These categories are unconstrained (apart from joker rules)
 
         number_counts = Counter(self._numbers).values()
@@ -122,4 +218,4 @@ class DiceRoll:
     @property
     def numbers(self) -> list[int]:
         """Return a copy of the dice numbers list."""
-        return self._numbers.copy()
+        return list(self._numbers)
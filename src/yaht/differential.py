@@ -0,0 +1,224 @@
+# src/yaht/differential.py
+"""Differential checks of optimized engine paths against the reference code.
+
+Each check runs a reference implementation and a candidate over the same
+exhaustive inputs, records every case where their outputs differ, and times
+both. Scoring checks cover all 252 rolls in all 13 categories on a set of
+representative scorecards (joker rules live or not, upper bonus near or
+not); game checks play seeded games through both engine paths.
+
+Run ``python -m yaht.differential`` for a report; it exits non-zero on any
+mismatch.
+"""
+
+import gc
+import sys
+from dataclasses import dataclass, field
+from random import Random
+from time import perf_counter
+from typing import Callable, Iterable, Sequence
+
+from yaht.category import CATEGORIES, FULL_MASK, Category
+from yaht.dicetypes import CANONICAL_ROLLS, DiceRoll, roll_index
+from yaht.game import Game
+from yaht.packing import pack_card, solver_state, unpack_card
+from yaht.player import BasicBotPlayer
+from yaht.scorecard import Scorecard
+from yaht.scorecheck import is_combo_scoreable
+from yaht.solver import card_state, score_move
+
+_MAX_REPORTED = 10
+
+
+@dataclass
+class DifferentialResult:
+    """Outcome of running a reference and a candidate over the same cases."""
+
+    name: str
+    cases: int
+    reference_seconds: float
+    candidate_seconds: float
+    # (case, reference output, candidate output), first few only
+    mismatches: list[tuple[object, object, object]] = field(default_factory=list)
+    mismatch_count: int = 0
+
+    @property
+    def identical(self) -> bool:
+        return self.mismatch_count == 0
+
+    @property
+    def speedup(self) -> float:
+        if not self.candidate_seconds:
+            return 0.0
+        return self.reference_seconds / self.candidate_seconds
+
+    def summary(self) -> str:
+        status = "ok" if self.identical else f"{self.mismatch_count} MISMATCHES"
+        return (
+            f"{self.name:<28}{self.cases:>9} cases  {self.reference_seconds:8.3f}s ref"
+            f"  {self.candidate_seconds:8.3f}s new  {self.speedup:6.2f}x  {status}"
+        )
+
+
+def differential(
+    name: str,
+    cases: Sequence[object],
+    reference: Callable[[object], object],
+    candidate: Callable[[object], object],
+) -> DifferentialResult:
+    """Run reference and candidate over cases and compare outputs case by case.
+
+    As with timeit, garbage collection is paused while each side runs so the
+    outputs kept from the first run do not slow the second.
+    """
+    expected, reference_seconds = _timed(reference, cases)
+    actual, candidate_seconds = _timed(candidate, cases)
+
+    result = DifferentialResult(name, len(cases), reference_seconds, candidate_seconds)
+    for case, want, got in zip(cases, expected, actual):
+        if want != got:
+            result.mismatch_count += 1
+            if len(result.mismatches) < _MAX_REPORTED:
+                result.mismatches.append((case, want, got))
+    return result
+
+
+def representative_cards(random_masks: int = 24, seed: int = 0) -> list[int]:
+    """Packed scorecards covering the states where scoring rules branch.
+
+    Masks include the empty and nearly full cards, every single open
+    category and some random masks. Each is filled with zeros or with
+    three of each upper number (so the upper bonus is in reach), and with
+    YAHTZEE open, zeroed or scored 50 (joker rules and Yahtzee bonuses).
+    """
+    rng = Random(seed)
+    masks = {0, FULL_MASK & ~Category.CHANCE.bit}
+    masks.update(FULL_MASK & ~category.bit for category in CATEGORIES)
+    masks.update(rng.randrange(FULL_MASK) for _ in range(random_masks))
+
+    cards = set()
+    for mask in masks:
+        for threes in (False, True):
+            for yahtzee in (None, 0, 50):
+                card = Scorecard()
+                for category in CATEGORIES:
+                    if mask & category.bit and category is not Category.YAHTZEE:
+                        number = category.die_number
+                        full = threes and number is not None
+                        card.category_scores[category] = 3 * number if full else 0
+                if mask & Category.YAHTZEE.bit or yahtzee is not None:
+                    card.category_scores[Category.YAHTZEE] = yahtzee or 0
+                if card.get_unscored_categories():
+                    cards.add(pack_card(card))
+    return sorted(cards)
+
+
+def scoring_cases(cards: Iterable[int]) -> list[tuple[int, tuple[int, ...], Category]]:
+    """Every (packed card, roll, open category) combination for cards."""
+    return [
+        (packed, roll, category)
+        for packed in cards
+        for category in unpack_card(packed).get_unscored_categories()
+        for roll in CANONICAL_ROLLS
+    ]
+
+
+def reference_score(case: tuple[int, tuple[int, ...], Category]) -> tuple[int, int, int]:
+    """Score a move as Game's reference path does; returns box, bonus count, card total."""
+    packed, numbers, category = case
+    card = unpack_card(packed)
+    roll = DiceRoll(list(numbers))
+    if is_combo_scoreable(category, roll, card):
+        card.set_category_score(category, roll)
+    else:
+        card.zero_category(category, roll)
+    return _outcome(card, category)
+
+
+def single_check_score(case: tuple[int, tuple[int, ...], Category]) -> tuple[int, int, int]:
+    """Score a move with Scorecard.score_category."""
+    packed, numbers, category = case
+    card = unpack_card(packed)
+    card.score_category(category, DiceRoll(list(numbers)))
+    return _outcome(card, category)
+
+
+def reference_move(case: tuple[int, tuple[int, ...], Category]) -> tuple[int, int]:
+    """(points, solver state) after a move, derived from the reference scorecard."""
+    packed, numbers, category = case
+    card = unpack_card(packed)
+    before = card.get_card_score()
+    roll = DiceRoll(list(numbers))
+    if is_combo_scoreable(category, roll, card):
+        card.set_category_score(category, roll)
+    else:
+        card.zero_category(category, roll)
+    return card.get_card_score() - before, card_state(card)
+
+
+def solver_move(case: tuple[int, tuple[int, ...], Category]) -> tuple[int, int]:
+    """(points, solver state) after a move, from the solver's precomputed tables."""
+    packed, numbers, category = case
+    return score_move(solver_state(packed), roll_index(numbers), category.index)
+
+
+def check_scoring(cards: Sequence[int] | None = None) -> list[DifferentialResult]:
+    """Compare score_category and the solver's score_move with reference scoring."""
+    cases = scoring_cases(cards if cards is not None else representative_cards())
+    score_move(0, 0, 0)  # build the solver tables outside the timed run
+    return [
+        differential("Scorecard.score_category", cases, reference_score, single_check_score),
+        differential("solver.score_move", cases, reference_move, solver_move),
+    ]
+
+
+def check_games(seeds: Iterable[int] = range(200), player_count: int = 3) -> DifferentialResult:
+    """Compare seeded games played by the reference and fast-path engines."""
+    players = [BasicBotPlayer(f"Bot{i}") for i in range(player_count)]
+
+    def play(fast_path: bool) -> Callable[[object], object]:
+        def run(seed: object) -> bytes:
+            game = Game(players, Random(seed), fast_path=fast_path)
+            game.play_game()
+            return game.snapshot()
+
+        return run
+
+    return differential("Game(fast_path=True)", list(seeds), play(False), play(True))
+
+
+def run_all() -> list[DifferentialResult]:
+    return [*check_scoring(), check_games()]
+
+
+def main() -> int:
+    results = run_all()
+    for result in results:
+        print(result.summary())
+        for case, want, got in result.mismatches:
+            print(f"    {case}: reference {want}, candidate {got}")
+    return 0 if all(result.identical for result in results) else 1
+
+
+def _timed(
+    function: Callable[[object], object], cases: Sequence[object]
+) -> tuple[list[object], float]:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = perf_counter()
+        outputs = [function(case) for case in cases]
+        return outputs, perf_counter() - started
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _outcome(card: Scorecard, category: Category) -> tuple[int, int, int]:
+    score = card.category_scores[category]
+    assert score is not None
+    return score, card.yahtzee_bonus_count, card.get_card_score()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+# src/yaht/distribution.py
+"""Distribution of the score still to come from any solitaire state.
+
+Tables are built by backward induction like the solver: the remaining-score
+distribution of a state is the mixture, over one turn's exact outcomes under
+a policy, of the successor's distribution shifted by the points scored. Each
+distribution is stored trimmed to its non-negligible span as zlib-compressed
+float32, so a query is one small decompression and a shift.
+"""
+
+import os
+import struct
+import zlib
+from array import array
+from functools import lru_cache
+from operator import add
+
+from yaht.policy import TurnPolicy, turn_outcomes
+from yaht.scorecard import MAX_CARD_SCORE, Scorecard, ScorecardLike, ScorecardView
+from yaht.solver import CATEGORIES, FULL_MASK, card_state, layer_states
+
+MAX_SCORE = MAX_CARD_SCORE
+DEFAULT_TOLERANCE = 1e-12
+
+# First stored score offset, number of stored points
+_SPAN = struct.Struct("<HH")
+# State index, blob length
+_ENTRY = struct.Struct("<II")
+_POINT_MASS = (0, array("d", [1.0]))
+
+
+def _compress(offset: int, probs: list[float]) -> bytes:
+    return _SPAN.pack(offset, len(probs)) + zlib.compress(array("f", probs).tobytes())
+
+
+def _decompress(blob: bytes) -> tuple[int, array]:
+    offset, _ = _SPAN.unpack_from(blob)
+    probs = array("f")
+    probs.frombytes(zlib.decompress(blob[_SPAN.size :]))
+    return offset, probs
+
+
+class DistributionTable:
+    """Compressed remaining-score distributions keyed by solver state index."""
+
+    def __init__(self, blobs: dict[int, bytes], cached_states: int = 4096):
+        self._blobs = blobs
+        self._decoded = lru_cache(maxsize=cached_states)(self._decode)
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def remaining(self, state: int) -> tuple[int, array]:
+        """Return (lowest remaining score, probabilities from that score up)."""
+        return self._decoded(state)
+
+    def remaining_distribution(self, card: ScorecardLike) -> list[float]:
+        """Histogram over 0-1575 of the points card will still score."""
+        offset, probs = self.remaining(card_state(card))
+        histogram = [0.0] * (MAX_SCORE + 1)
+        histogram[offset : offset + len(probs)] = probs
+        return histogram
+
+    def final_distribution(self, card: Scorecard | ScorecardView) -> list[float]:
+        """Histogram over 0-1575 of card's final score."""
+        offset, probs = self.remaining(card_state(card))
+        offset += card.get_card_score()
+        histogram = [0.0] * (MAX_SCORE + 1)
+        histogram[offset : offset + len(probs)] = probs
+        return histogram
+
+    def chance_to_beat(self, card: Scorecard | ScorecardView, target: int) -> float:
+        """Probability that card finishes with more than target points."""
+        offset, probs = self.remaining(card_state(card))
+        needed = target + 1 - card.get_card_score() - offset
+        return sum(probs[max(needed, 0) :])
+
+    def _decode(self, state: int) -> tuple[int, array]:
+        if state >> 7 == FULL_MASK:
+            return _POINT_MASS
+        return _decompress(self._blobs[state])
+
+    def save(self, path: str | os.PathLike) -> None:
+        with open(path, "wb") as f:
+            f.write(struct.pack("<I", len(self._blobs)))
+            for state, blob in self._blobs.items():
+                f.write(_ENTRY.pack(state, len(blob)))
+                f.write(blob)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "DistributionTable":
+        with open(path, "rb") as f:
+            data = f.read()
+        (count,) = struct.unpack_from("<I", data)
+        offset = 4
+        blobs = {}
+        for _ in range(count):
+            state, size = _ENTRY.unpack_from(data, offset)
+            offset += _ENTRY.size
+            blobs[state] = data[offset : offset + size]
+            offset += size
+        return cls(blobs)
+
+
+def build_distribution_table(
+    policy: TurnPolicy,
+    start_mask: int = 0,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> DistributionTable:
+    """Tabulate remaining-score distributions for states reachable from start_mask.
+
+    Probabilities below tolerance are trimmed from either end of each
+    distribution before it is stored.
+    """
+    layers: list[list[int]] = [[] for _ in range(len(CATEGORIES))]
+    for mask in range(FULL_MASK):
+        if mask & start_mask == start_mask:
+            layers[mask.bit_count()].append(mask)
+
+    table = DistributionTable({})
+    for masks in reversed(layers):
+        for mask in masks:
+            for state in layer_states(mask):
+                offset, probs = _mix(table, turn_outcomes(policy, state), tolerance)
+                table._blobs[state] = _compress(offset, probs)
+    table._decoded.cache_clear()
+    return table
+
+
+def _mix(
+    table: DistributionTable,
+    outcomes: dict[tuple[int, int], float],
+    tolerance: float,
+) -> tuple[int, list[float]]:
+    """Mix successor distributions shifted by the points each outcome scores."""
+    spans = []
+    for (points, next_state), p in outcomes.items():
+        offset, probs = table.remaining(next_state)
+        spans.append((points + offset, probs, p))
+
+    low = min(start for start, _, _ in spans)
+    high = max(start + len(probs) for start, probs, _ in spans)
+    mixed = [0.0] * (high - low)
+    for start, probs, p in spans:
+        start -= low
+        end = start + len(probs)
+        mixed[start:end] = map(add, mixed[start:end], map(p.__mul__, probs))
+
+    first = next(i for i, q in enumerate(mixed) if q >= tolerance)
+    last = next(i for i in range(len(mixed) - 1, -1, -1) if mixed[i] >= tolerance)
+    return low + first, mixed[first : last + 1]
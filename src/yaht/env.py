@@ -0,0 +1,151 @@
+# src/yaht/env.py
+"""Vectorized solitaire environment for reinforcement learning.
+
+VectorEnv runs n independent solitaire games in flat arrays: the dice, and
+each game's solver state index (see yaht.solver) and score. A step applies
+one action per game and rolls every game's dice with a single
+DiceCup.roll_many call. Scoring goes through solver.score_move, whose tables
+follow the same rules as scorecheck and Scorecard, so no Scorecard, Game or
+other per-game object is built on the step path.
+
+Actions are small ints:
+
+    ==========  ===========================================================
+    action      meaning
+    ==========  ===========================================================
+    0-30        keep mask; bit i keeps die i and the others are rerolled
+    32 + c      score the dice in the category with index c
+    ==========  ===========================================================
+
+Keeping all five dice (31) is never legal, and keep masks are only legal
+while rolls are left.
+"""
+
+from array import array
+from random import Random
+from typing import NamedTuple, Sequence
+
+from yaht.category import CATEGORIES, FULL_MASK
+from yaht.dicetypes import MAX_ROLL_COUNT, DiceCup, roll_index
+from yaht.solver import score_move
+
+CATEGORY_ACTION = 32
+ACTION_COUNT = CATEGORY_ACTION + len(CATEGORIES)
+
+_KEEP_ACTIONS = (1 << 31) - 1
+
+
+class Observation(NamedTuple):
+    """Per-game observation arrays; dice holds five entries per game, in roll order."""
+
+    dice: array
+    filled_mask: array
+    # Capped at the upper bonus threshold, which is all that matters for scoring
+    upper_subtotal: array
+    rolls_left: array
+    # 1 once a 50-point Yahtzee makes further Yahtzees worth a bonus
+    bonus_flag: array
+
+
+class StepResult(NamedTuple):
+    observation: Observation
+    rewards: array
+    # 1 where the step filled the card; that game has already been reset
+    dones: array
+
+
+class VectorEnv:
+    """n solitaire games stepped together.
+
+    Observations and legal action masks are updated in place by each step;
+    copy them to keep them. A game whose card fills up is reported done and
+    starts over within the same step.
+    """
+
+    def __init__(self, n: int, seed: int | None = None):
+        if n < 1:
+            raise ValueError("VectorEnv needs at least one game")
+        self.n = n
+        self._dice_cup = DiceCup(Random(seed))
+        self._states = array("I", bytes(4 * n))
+        self._scores = array("H", bytes(2 * n))
+        self._keep_masks = array("B", bytes(n))
+        self._legal = array("Q", bytes(8 * n))
+        self.observation = Observation(
+            dice=array("B", bytes(5 * n)),
+            filled_mask=array("H", bytes(2 * n)),
+            upper_subtotal=array("B", bytes(n)),
+            rolls_left=array("B", bytes(n)),
+            bonus_flag=array("B", bytes(n)),
+        )
+
+    @property
+    def legal_actions(self) -> array:
+        """Per game, an int whose bit a is set when action a is legal."""
+        return self._legal
+
+    @property
+    def scores(self) -> array:
+        """Card score of each game so far, bonuses included."""
+        return self._scores
+
+    def reset(self) -> Observation:
+        """Start every game over with an empty card and a fresh roll."""
+        for i in range(self.n):
+            self._states[i] = 0
+            self._scores[i] = 0
+            self._observe(i)
+        self._roll(None)
+        return self.observation
+
+    def step(self, actions: Sequence[int]) -> StepResult:
+        """Apply one action per game, then roll the dice for every game."""
+        if len(actions) != self.n:
+            raise ValueError(f"Expected {self.n} actions, got {len(actions)}")
+        legal = self._legal
+        for i, action in enumerate(actions):
+            if not 0 <= action < ACTION_COUNT or not legal[i] >> action & 1:
+                raise ValueError(f"Action {action} is not legal in game {i}")
+
+        rewards = array("H", bytes(2 * self.n))
+        dones = array("B", bytes(self.n))
+        dice = self.observation.dice
+        rolls_left = self.observation.rolls_left
+        for i, action in enumerate(actions):
+            if action < CATEGORY_ACTION:
+                self._keep_masks[i] = action
+                rolls_left[i] -= 1
+            else:
+                roll = roll_index(dice[5 * i : 5 * i + 5])
+                points, state = score_move(self._states[i], roll, action - CATEGORY_ACTION)
+                rewards[i] = points
+                if state >> 7 == FULL_MASK:
+                    dones[i] = 1
+                    state = 0
+                    self._scores[i] = 0
+                else:
+                    self._scores[i] += points
+                self._states[i] = state
+                self._observe(i)
+
+        self._roll(self._keep_masks)
+        return StepResult(self.observation, rewards, dones)
+
+    def _observe(self, i: int) -> None:
+        """Refresh game i's observation after scoring, ahead of a fresh roll."""
+        state = self._states[i]
+        mask = state >> 7
+        self.observation.filled_mask[i] = mask
+        self.observation.upper_subtotal[i] = state & 63
+        self.observation.bonus_flag[i] = state >> 6 & 1
+        self.observation.rolls_left[i] = MAX_ROLL_COUNT - 1
+        self._keep_masks[i] = 0
+
+    def _roll(self, keep_masks: array | None) -> None:
+        rows = self._dice_cup.roll_many(self.n, keep_masks)
+        self.observation.dice[:] = array("B", rows.tobytes())
+        rolls_left = self.observation.rolls_left
+        filled = self.observation.filled_mask
+        for i in range(self.n):
+            categories = (FULL_MASK & ~filled[i]) << CATEGORY_ACTION
+            self._legal[i] = categories | _KEEP_ACTIONS if rolls_left[i] else categories
@@ -0,0 +1,149 @@
+# src/yaht/equity.py
+"""Monte Carlo equity of mid-game positions with variance reduction.
+
+Rollouts are played in antithetic pairs: the second game of a pair sees every
+die mirrored (7 minus the face), so lucky and unlucky dice largely cancel in
+the pair's mean. A cheap baseline player is then played on exactly the same
+dice as a control variate. Its score tracks the policy's closely, and the
+difference between its sample mean and its true mean is subtracted out.
+"""
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from math import sqrt
+from statistics import covariance, fmean, variance
+from typing import TYPE_CHECKING, Sequence
+
+from yaht.packing import pack_card, unpack_card
+from yaht.player import BasicBotPlayer
+from yaht.scorecard import Scorecard
+from yaht.simulation import play_common_dice_game
+
+if TYPE_CHECKING:
+    from yaht.player import Player
+
+
+@dataclass
+class Equity:
+    """Estimated final score of one position under a policy."""
+
+    rollouts: int
+    mean: float
+    # Spread of single rollout final scores
+    variance: float
+    # Of mean, after antithetic pairing and the control variate
+    standard_error: float
+    control_coefficient: float
+
+
+def rollout_pairs(player: "Player", packed_card: int, seeds: range) -> list[tuple[int, int]]:
+    """Final scores of an antithetic pair of games from packed_card for each seed."""
+    return [
+        (
+            play_common_dice_game(player, seed, unpack_card(packed_card)),
+            play_common_dice_game(player, seed, unpack_card(packed_card), antithetic=True),
+        )
+        for seed in seeds
+    ]
+
+
+def estimate(
+    card_states: Sequence[Scorecard],
+    policy: "Player",
+    n: int = 1000,
+    baseline: "Player | None" = None,
+    baseline_means: Sequence[float] | None = None,
+    baseline_rollouts: int | None = None,
+    processes: int | None = None,
+    seed: int = 0,
+    batch_size: int = 100,
+) -> list[Equity]:
+    """Estimate each card's expected final score when policy plays out the game.
+
+    n rollouts (rounded up to whole antithetic pairs) are played per card.
+    baseline, a BasicBotPlayer by default, is the control variate. Its true
+    mean from each card can be given in baseline_means. Otherwise it is
+    estimated from baseline_rollouts extra games (4 * n by default) and the
+    error of that estimate is included in the standard error. Rollouts run in
+    a process pool (players must be picklable); with processes=1 they run in
+    this process. The same seed always gives the same estimates.
+    """
+    if n < 4:
+        raise ValueError("At least 4 rollouts are needed to estimate a variance")
+    if baseline_means is not None and len(baseline_means) != len(card_states):
+        raise ValueError(f"{len(baseline_means)} baseline means for {len(card_states)} cards")
+
+    baseline = baseline if baseline is not None else BasicBotPlayer()
+    pairs = (n + 1) // 2
+    control_pairs = 0
+    if baseline_means is None:
+        control_pairs = max((baseline_rollouts or 4 * n) + 1, 4) // 2
+
+    packed_cards = [pack_card(card) for card in card_states]
+    jobs = []
+    for packed in packed_cards:
+        jobs.extend((policy, packed, s) for s in _batches(seed, pairs, batch_size))
+        jobs.extend((baseline, packed, s) for s in _batches(seed, pairs, batch_size))
+        control_seeds = _batches(seed + pairs, control_pairs, batch_size)
+        jobs.extend((baseline, packed, s) for s in control_seeds)
+
+    results = iter(_run(jobs, processes))
+    estimates = []
+    for i in range(len(packed_cards)):
+        played = _collect(results, pairs, batch_size)
+        control = _collect(results, pairs, batch_size)
+        extra = _collect(results, control_pairs, batch_size)
+        known_mean = None if baseline_means is None else baseline_means[i]
+        estimates.append(_combine(played, control, extra, known_mean))
+    return estimates
+
+
+def _batches(start: int, count: int, batch_size: int) -> list[range]:
+    stop = start + count
+    return [range(s, min(s + batch_size, stop)) for s in range(start, stop, batch_size)]
+
+
+def _run(jobs: list[tuple["Player", int, range]], processes: int | None) -> list:
+    if processes == 1:
+        return [rollout_pairs(*job) for job in jobs]
+
+    with ProcessPoolExecutor(processes or os.cpu_count() or 1) as pool:
+        futures: list[Future[list[tuple[int, int]]]] = [
+            pool.submit(rollout_pairs, *job) for job in jobs
+        ]
+        return [future.result() for future in futures]
+
+
+def _collect(results, pair_count: int, batch_size: int) -> list[tuple[int, int]]:
+    collected: list[tuple[int, int]] = []
+    for _ in range(-(-pair_count // batch_size)):
+        collected.extend(next(results))
+    return collected
+
+
+def _combine(
+    played: list[tuple[int, int]],
+    control: list[tuple[int, int]],
+    extra: list[tuple[int, int]],
+    known_mean: float | None,
+) -> Equity:
+    scores = [score for pair in played for score in pair]
+    x = [(a + b) / 2 for a, b in played]
+    y = [(a + b) / 2 for a, b in control]
+
+    control_variance = variance(y)
+    coefficient = covariance(x, y) / control_variance if control_variance else 0.0
+
+    if known_mean is None:
+        z = [(a + b) / 2 for a, b in extra]
+        control_mean = fmean(z)
+        mean_variance = variance(z) / len(z)
+    else:
+        control_mean = known_mean
+        mean_variance = 0.0
+
+    adjusted = [xi - coefficient * yi for xi, yi in zip(x, y)]
+    mean = fmean(x) - coefficient * (fmean(y) - control_mean)
+    error = sqrt(variance(adjusted) / len(x) + coefficient * coefficient * mean_variance)
+    return Equity(len(scores), mean, variance(scores), error, coefficient)
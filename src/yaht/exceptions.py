@@ -22,5 +22,9 @@ class GameNotOverError(GameError):
     """Raised when action requires current game to be over to be performed."""
 
 
+class HistoryEmptyError(GameError):
+    """Raised when undo or redo is requested on a scorecard with nothing to undo or redo."""
+
+
 class InvalidCategoryError(GameError):
     """Raised when an unknown or unsupported category is specified."""
@@ -0,0 +1,81 @@
+# src/yaht/footprint.py
+"""Memory footprint of engine objects.
+
+deep_sizeof() adds up sys.getsizeof over everything an object refers to,
+directly or not, counting each object once. Objects every game shares are
+skipped: classes, functions and modules, Category members, and the small
+ints, None, booleans and empty tuples and strings that CPython keeps one
+copy of.
+
+Run ``python -m yaht.footprint`` to print the footprint of finished games
+of 1 to 8 players.
+"""
+
+import gc
+import sys
+from enum import Enum
+from random import Random
+from types import BuiltinFunctionType, FunctionType, MethodDescriptorType, ModuleType
+from typing import Iterable
+
+from yaht.game import Game
+from yaht.player import BasicBotPlayer
+
+_SHARED_TYPES = (
+    type,
+    ModuleType,
+    FunctionType,
+    BuiltinFunctionType,
+    MethodDescriptorType,
+    Enum,
+)
+
+
+def deep_sizeof(obj: object, exclude: Iterable[object] = ()) -> int:
+    """Bytes held by obj and everything reachable from it, except exclude and shared objects."""
+    seen = {id(o) for o in exclude}
+    total = 0
+    pending = [obj]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or _is_shared(current):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        pending.extend(gc.get_referents(current))
+    return total
+
+
+def game_footprint(game: Game) -> int:
+    """Bytes held by game, not counting its players or a random generator passed in.
+
+    Players and a generator handed to Game are usually shared by many games
+    in a lobby; a generator the game made itself is counted.
+    """
+    shared = [*game._players]
+    if not game._owns_rng and game._rng is not None:
+        shared.append(game._rng)
+    return deep_sizeof(game, shared)
+
+
+def main() -> int:
+    rng = Random(0)
+    print(f"{'players':>8}{'bytes':>8}{'per player':>12}")
+    for count in range(1, 9):
+        game = Game([BasicBotPlayer(f"Bot{i}") for i in range(count)], rng)
+        game.play_game()
+        size = game_footprint(game)
+        print(f"{count:>8}{size:>8}{size // count:>12}")
+    return 0
+
+
+def _is_shared(obj: object) -> bool:
+    if obj is None or isinstance(obj, (bool, *_SHARED_TYPES)):
+        return True
+    if type(obj) is int:
+        return -5 <= obj <= 256
+    return type(obj) in (tuple, str, bytes) and not obj
+
+
+if __name__ == "__main__":
+    sys.exit(main())
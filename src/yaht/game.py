@@ -1,29 +1,110 @@
+import struct
 from dataclasses import dataclass
+from random import Random
 from typing import TYPE_CHECKING
 
-from yaht.dicetypes import DiceCup
+from yaht import snapshot
+from yaht.category import CATEGORIES, FULL_MASK, Category
+from yaht.dicetypes import DiceCup, DiceRoll
+from yaht.packing import pack_card
+from yaht.player import (
+    is_batch_player,
+    is_generator_player,
+    take_batch_turn,
+    take_generator_turn,
+)
 from yaht.scorecard import Scorecard, ScorecardView
-from yaht.scorecheck import is_combo_scoreable
+from yaht.scorecheck import filled_mask
+from yaht.standings import Standings
 
 if TYPE_CHECKING:
     from yaht.player import Player
 
 
-@dataclass
+SNAPSHOT_VERSION = 3
+
+# version, game over, player count, current player index, eliminated player count
+_SNAPSHOT_HEADER = struct.Struct("<BBHHH")
+# Index of an eliminated player, one per eliminated player after the cards
+_ELIMINATED_PLAYER = struct.Struct("<H")
+
+
+_PLAYER_SNAPSHOT_SIZE = snapshot.SCORECARD_SIZE + snapshot.DICE_CUP_SIZE
+# Written for players whose cups a finished game has released
+_EMPTY_DICE_CUP = snapshot.pack_dice_cup(DiceCup())
+# Written in place of a generator a finished game has released
+_RELEASED_RNG = snapshot.pack_rng(Random(0))
+
+
+@dataclass(slots=True)
 class PlayerGameState:
     dice_cup: DiceCup
     card: ScorecardView
 
 
 class Game:
-    def __init__(self, players: list["Player"]):
-        """Initialize game state."""
+    __slots__ = (
+        "_players",
+        "_rng",
+        "_owns_rng",
+        "_current_player_index",
+        "_game_over",
+        "_fast_path",
+        "_turn_states",
+        "_eliminated",
+        "_turns_played",
+        "_pending_turn",
+        "_standings",
+        "_final_scores",
+        "_scorecards",
+        "_dice_cups",
+        "_filled_masks",
+        "_open_boxes",
+    )
+
+    def __init__(
+        self,
+        players: list["Player"],
+        rng: Random | None = None,
+        fast_path: bool = False,
+        live_standings: bool = False,
+    ):
+        """Initialize game state.
+
+        With fast_path set, each player's dice cup, scorecard view and turn
+        state are created once and reset between turns rather than rebuilt,
+        and each move is validated once. Games play out identically either
+        way, but players must not modify the view they are handed.
+
+        Once the game is over it releases the dice cups and turn states, and
+        the random generator if it made its own, so an idle finished game
+        holds little beyond its scorecards. Snapshots of such a game carry a
+        placeholder generator state.
+
+        Players with a prepare_turn() method (see PreparingPlayer) are handed
+        their card whenever it is settled until their next turn.
+
+        With live_standings set, a Standings leaderboard of active players is
+        updated after every turn, for rank queries in large lobbies.
+        """
         if not players:
             raise ValueError("At least one player is required")
 
         self._players = players
+        self._rng: Random | None = rng if rng is not None else Random()
+        # Only a generator the game made itself is released once the game is over
+        self._owns_rng = rng is None
         self._current_player_index = 0
         self._game_over = False
+        self._fast_path = fast_path
+        # Created by the first fast-path turn
+        self._turn_states: dict["Player", PlayerGameState] | None = None
+        # Rarely more than a player or two, so a tuple is smaller than a set
+        self._eliminated: tuple["Player", ...] = ()
+        self._turns_played = 0
+        self._pending_turn: PlayerGameState | None = None
+        self._standings = Standings() if live_standings else None
+        self._final_scores: dict["Player", int] | None = None
 
         # Create scorecard and dice cup for each player
         self._scorecards: dict["Player", Scorecard] = {}
@@ -31,16 +112,191 @@ class Game:
 
         for player in players:
             self._scorecards[player] = Scorecard()
-            self._dice_cups[player] = DiceCup()
+            self._dice_cups[player] = DiceCup(self._rng)
+
+        # Filled categories per player and open boxes across active players,
+        # kept up to date as moves are scored
+        self._filled_masks: dict["Player", int] = {}
+        self._open_boxes = 0
+        self._rebuild_tracking()
+
+    @classmethod
+    def from_scorecards(
+        cls,
+        players: list["Player"],
+        scorecards: list[Scorecard],
+        rng: Random | None = None,
+        fast_path: bool = False,
+        live_standings: bool = False,
+    ) -> "Game":
+        """Start a game part way through, with each player holding the given card.
+
+        The cards are used in place, not copied. Play resumes with the first
+        player holding an open category; players whose cards are full are skipped.
+        """
+        if len(scorecards) != len(players):
+            raise ValueError(f"{len(scorecards)} scorecards given for {len(players)} players")
+        game = cls(players, rng, fast_path, live_standings)
+        for player, card in zip(players, scorecards):
+            game._scorecards[player] = card
+        game._rebuild_tracking()
+        game._update_game_over()
+        if not game._game_over and not game._has_turns_left(game._current_player()):
+            game._next_player()
+        return game
 
     def play_game(self) -> None:
         """Run the full game loop until completion."""
-        while not self._is_game_over():
-            current_player = self._current_player()
-            self._play_turn(current_player)
+        while not self.is_over:
+            self.play_turn()
+
+    def play_turn(self) -> None:
+        """Play the current player's turn and pass the dice to the next player."""
+        if self._is_game_over():
+            self._update_game_over()
+            return
+
+        player = self._current_player()
+        game_state = self.begin_turn()
+        if is_batch_player(player):
+            category = take_batch_turn(player, game_state, self.packed_card(player))
+        elif is_generator_player(player):
+            category = take_generator_turn(player, game_state)
+        else:
+            category = player.take_turn(game_state)
+        self.end_turn(category)
+
+    def begin_turn(self) -> PlayerGameState:
+        """Start the current player's turn with an empty cup; end_turn() scores it.
+
+        play_turn() runs the player's own decisions in between. Calling the
+        two halves directly lets a runner make those decisions itself, such
+        as for many games at once.
+        """
+        if self._game_over:
+            raise ValueError("Game is over")
+        player = self._current_player()
+        scorecard = self._scorecards[player]
+        if self._turns_played == 0:
+            for other in self._players:
+                if other is not player and self._has_turns_left(other):
+                    self._prepare_turn(other)
+
+        if self._fast_path:
+            if self._turn_states is None:
+                self._turn_states = {}
+            game_state = self._turn_states.get(player)
+            if game_state is None:
+                # The view holds its own copy, so a player writing to it cannot touch the card
+                game_state = PlayerGameState(self._dice_cups[player], scorecard.view)
+                self._turn_states[player] = game_state
+            game_state.dice_cup.reset()
+        else:
+            # Reset the dice cup for this turn
+            dice_cup = DiceCup(self._rng)
+            self._dice_cups[player] = dice_cup
+            game_state = PlayerGameState(dice_cup=dice_cup, card=scorecard.view)
+
+        self._pending_turn = game_state
+        return game_state
+
+    def end_turn(self, category: Category, roll: DiceRoll | None = None) -> None:
+        """Score the final roll of the turn begun by begin_turn() and pass the dice on.
+
+        roll is the final roll when the dice were rolled outside the player's
+        cup, as by a scheduler batching rolls across games.
+        """
+        game_state = self._pending_turn
+        if game_state is None:
+            raise ValueError("No turn in progress")
+        self._pending_turn = None
+
+        player = self._current_player()
+        self._score_turn(player, game_state, category, roll)
+        self._filled_masks[player] |= category.bit
+        self._open_boxes -= 1
+        self._turns_played += 1
+        if self._standings is not None:
+            self._standings.update(player, self._scorecards[player].get_card_score())
+
+        self._next_player()
+        self._update_game_over()
+        if self._has_turns_left(player):
+            self._prepare_turn(player)
+
+    def packed_card(self, player: "Player") -> int:
+        """Player's scorecard packed into an int (see yaht.packing.pack_card)."""
+        return pack_card(self._scorecards[player])
+
+    def eliminate_player(self, player: "Player") -> None:
+        """Drop player from the rest of the game, e.g. after a disconnect.
+
+        The player takes no further turns and cannot win, but their card and
+        score are kept. Eliminating the player whose turn it is passes the turn on.
+        """
+        if player in self._eliminated:
+            return
+        if player not in self._scorecards:
+            raise ValueError(f"{player.name} is not playing this game")
+
+        self._eliminated += (player,)
+        if self._standings is not None:
+            self._standings.remove(player)
+        self._open_boxes -= len(CATEGORIES) - self._filled_masks[player].bit_count()
+        self._update_game_over()
+        if not self._game_over and player is self._current_player():
             self._next_player()
 
-        self._game_over = True
+    @property
+    def is_over(self) -> bool:
+        """True once every active player has filled all 13 categories."""
+        return self._game_over
+
+    @property
+    def current_player(self) -> "Player | None":
+        """The player due to take the next turn, or None once the game is over."""
+        return None if self._game_over else self._current_player()
+
+    @property
+    def round_number(self) -> int:
+        """Round (1-13) of the current player's next turn; 14 once the game is over."""
+        if self._game_over:
+            return len(CATEGORIES) + 1
+        return self._filled_masks[self._current_player()].bit_count() + 1
+
+    @property
+    def turns_played(self) -> int:
+        """Turns played in this game object (not counting turns before a restore)."""
+        return self._turns_played
+
+    @property
+    def remaining_turns(self) -> int:
+        """Turns still to be played by active players."""
+        return self._open_boxes
+
+    @property
+    def standings(self) -> Standings | None:
+        """Live leaderboard of active players when live_standings is set, else None."""
+        return self._standings
+
+    def rank(self, player: "Player") -> int:
+        """Player's current rank among active players, 1 being best; ties share a rank.
+
+        O(log MAX_CARD_SCORE) with live_standings, otherwise O(players).
+        """
+        if self._standings is not None:
+            return self._standings.rank(player)
+        if player in self._eliminated:
+            raise KeyError(player)
+        score = self._scorecards[player].get_card_score()
+        return 1 + sum(
+            self._scorecards[other].get_card_score() > score for other in self.active_players
+        )
+
+    @property
+    def active_players(self) -> list["Player"]:
+        """Players that have not been eliminated, in turn order."""
+        return [player for player in self._players if player not in self._eliminated]
 
     @property
     def winning_players(self) -> list["Player"] | None:
@@ -48,27 +304,104 @@ class Game:
         if not self._game_over:
             return None
 
-        # Find the highest score
-        max_score = max(self._scorecards[player].get_card_score() for player in self._players)
+        # Find the highest score among players still in the game
+        final_scores = self._final_card_scores()
+        contenders = self.active_players
+        if not contenders:
+            return []
+        max_score = max(final_scores[player] for player in contenders)
 
         # Return all players with the highest score
-        winners = [
-            player
-            for player in self._players
-            if self._scorecards[player].get_card_score() == max_score
-        ]
+        winners = [player for player in contenders if final_scores[player] == max_score]
 
         return winners
 
+    def get_scores(self) -> list[int]:
+        """Returns each player's current card score, in player order."""
+        return [self._scorecards[player].get_card_score() for player in self._players]
+
+    def snapshot(self) -> bytes:
+        """Serialize scorecards, dice cups, turn position and RNG state.
+
+        Players are not serialized; pass the same players, in the same order,
+        to restore().
+        """
+        parts = [
+            _SNAPSHOT_HEADER.pack(
+                SNAPSHOT_VERSION,
+                self._game_over,
+                len(self._players),
+                self._current_player_index,
+                len(self._eliminated),
+            )
+        ]
+        for player in self._players:
+            parts.append(snapshot.pack_scorecard(self._scorecards[player]))
+            dice_cup = self._dice_cups.get(player)
+            if dice_cup is None:
+                parts.append(_EMPTY_DICE_CUP)
+            else:
+                parts.append(snapshot.pack_dice_cup(dice_cup))
+        for i, player in enumerate(self._players):
+            if player in self._eliminated:
+                parts.append(_ELIMINATED_PLAYER.pack(i))
+        parts.append(_RELEASED_RNG if self._rng is None else snapshot.pack_rng(self._rng))
+        return b"".join(parts)
+
+    @classmethod
+    def restore(
+        cls,
+        players: list["Player"],
+        data: bytes,
+        fast_path: bool = False,
+        live_standings: bool = False,
+    ) -> "Game":
+        """Rebuild a game from snapshot() output for the given players.
+
+        A finished game is restored without its random generator, as one that
+        made its own generator releases it.
+        """
+        version, game_over, player_count, current_index, eliminated_count = (
+            _SNAPSHOT_HEADER.unpack_from(data)
+        )
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        if player_count != len(players):
+            raise ValueError(
+                f"Snapshot holds {player_count} players but {len(players)} were given"
+            )
+
+        view = memoryview(data)
+        offset = _SNAPSHOT_HEADER.size
+        eliminated_offset = offset + player_count * _PLAYER_SNAPSHOT_SIZE
+        rng_offset = eliminated_offset + eliminated_count * _ELIMINATED_PLAYER.size
+        rng, _ = snapshot.unpack_rng(view[rng_offset:])
+
+        game = cls(players, rng, fast_path, live_standings)
+        # A finished game never rolls again, so it need not keep the generator
+        game._owns_rng = bool(game_over)
+        game._current_player_index = current_index
+        game._game_over = bool(game_over)
+        for player in players:
+            card_end = offset + snapshot.SCORECARD_SIZE
+            game._scorecards[player] = snapshot.unpack_scorecard(view[offset:card_end])
+            offset = card_end + snapshot.DICE_CUP_SIZE
+            game._dice_cups[player] = snapshot.unpack_dice_cup(view[card_end:offset], rng)
+        eliminated = _ELIMINATED_PLAYER.iter_unpack(view[eliminated_offset:rng_offset])
+        if eliminated_count:
+            game._eliminated = tuple(players[index] for (index,) in eliminated)
+        game._rebuild_tracking()
+        if game._game_over:
+            game._release_turn_state()
+        return game
+
     def get_final_scores(self) -> list[tuple[str, int]]:
         """Returns a list of (player_name, score) tuples sorted by score (highest first)."""
         if not self._game_over:
             raise ValueError("Game is not over yet")
 
-        scores = [
-            (player.name, self._scorecards[player].get_card_score())
-            for player in self._players
-        ]
+        final_scores = self._final_card_scores()
+        scores = [(player.name, final_scores[player]) for player in self._players]
         return sorted(scores, key=lambda x: x[1], reverse=True)
 
     def get_game_summary(self) -> str:
@@ -76,15 +409,22 @@ class Game:
         if not self._game_over:
             raise ValueError("Game is not over yet")
 
-        scores = self.get_final_scores()
+        final_scores = self._final_card_scores()
+        ranked = sorted(self.active_players, key=final_scores.__getitem__, reverse=True)
         winners = self.winning_players
 
         summary = "=== YAHTZEE GAME RESULTS ===\n"
-        for i, (name, score) in enumerate(scores, 1):
-            summary += f"{i}. {name}: {score} points\n"
+        for i, player in enumerate(ranked, 1):
+            summary += f"{i}. {player.name}: {final_scores[player]} points\n"
+        # Eliminated players cannot win, so they are listed unranked after the rest
+        for player in self._players:
+            if player in self._eliminated:
+                summary += f"-  {player.name}: {final_scores[player]} points (eliminated)\n"
 
         if winners is not None:
-            if len(winners) == 1:
+            if not winners:
+                summary += "\nNo winner: every player was eliminated."
+            elif len(winners) == 1:
                 summary += f"\n🏆 Winner: {winners[0].name}!"
             else:
                 winner_names = [player.name for player in winners]
@@ -138,48 +478,92 @@ class Game:
             player_data["YAHTZEE_BONUS_POINTS"] = scorecard.yahtzee_bonus_count * 100
 
             # Add grand total
-            player_data["GRAND_TOTAL"] = scorecard.get_card_score()
+            player_data["GRAND_TOTAL"] = self._final_card_scores()[player]
 
             results[player.name] = player_data
 
         return results
 
-    def _play_turn(self, player: "Player") -> None:
-        """Internal method to run a full turn for the given player."""
-        # Reset the dice cup for this turn
-        dice_cup = DiceCup()
-        self._dice_cups[player] = dice_cup
-
-        # Create the game state for the player
+    def _update_game_over(self) -> None:
+        self._game_over = self._is_game_over()
+        if self._game_over:
+            self._release_turn_state()
+
+    def _release_turn_state(self) -> None:
+        """Internal: drop the cups, turn states and own generator a finished game never uses."""
+        self._dice_cups.clear()
+        self._turn_states = None
+        self._pending_turn = None
+        if self._owns_rng:
+            self._rng = None
+
+    def _prepare_turn(self, player: "Player") -> None:
+        """Internal: let a PreparingPlayer start on its next turn while others play."""
+        prepare = getattr(player, "prepare_turn", None)
+        if prepare is not None:
+            prepare(self._scorecards[player].view)
+
+    def _score_turn(
+        self,
+        player: "Player",
+        game_state: PlayerGameState,
+        chosen_category: Category,
+        final_roll: DiceRoll | None = None,
+    ) -> None:
+        """Internal method to score the final roll of a turn in the chosen category."""
         scorecard = self._scorecards[player]
-        game_state = PlayerGameState(dice_cup=dice_cup, card=scorecard.view)
-
-        # Let the player take their turn and choose a category
-        chosen_category = player.take_turn(game_state)
 
         # Get the final dice roll from the cup
-        final_roll = dice_cup.current_role
+        if final_roll is None:
+            final_roll = game_state.dice_cup._stored_roll
         if final_roll is None:
             raise ValueError("Player must roll dice at least once during their turn")
 
-        # Score the chosen category - let exceptions propagate
-        if is_combo_scoreable(chosen_category, final_roll, scorecard):
-            scorecard.set_category_score(chosen_category, final_roll)
-        else:
-            scorecard.zero_category(chosen_category, final_roll)
+        # Validate once and score or zero the category - let exceptions propagate
+        scorecard.score_category(chosen_category, final_roll)
+        if self._fast_path:
+            # Refresh only the changed entry of the reused view
+            game_state.card.category_scores[chosen_category] = scorecard.category_scores[
+                chosen_category
+            ]
 
     def _is_game_over(self) -> bool:
-        """Internal: returns True if all players have completed all 13 turns."""
-        # Game is over when all players have filled all 13 categories
-        for player in self._players:
-            scorecard = self._scorecards[player]
-            if len(scorecard.get_unscored_categories()) > 0:
-                return False
-        return True
+        """Internal: returns True once active players have no categories left to fill."""
+        return self._open_boxes == 0
+
+    def _has_turns_left(self, player: "Player") -> bool:
+        return player not in self._eliminated and self._filled_masks[player] != FULL_MASK
+
+    def _final_card_scores(self) -> dict["Player", int]:
+        """Internal: every player's card score, computed once the game is over."""
+        if self._final_scores is None:
+            self._final_scores = {
+                player: self._scorecards[player].get_card_score() for player in self._players
+            }
+        return self._final_scores
+
+    def _rebuild_tracking(self) -> None:
+        """Internal: rebuild filled masks, open box count and standings from the cards."""
+        self._filled_masks = {
+            player: filled_mask(self._scorecards[player]) for player in self._players
+        }
+        self._open_boxes = sum(
+            len(CATEGORIES) - self._filled_masks[player].bit_count()
+            for player in self._players
+            if player not in self._eliminated
+        )
+        if self._standings is not None:
+            self._standings = Standings()
+            for player in self.active_players:
+                self._standings.add(player, self._scorecards[player].get_card_score())
 
     def _next_player(self) -> "Player":
-        """Internal method returns the next player in the turn."""
-        self._current_player_index = (self._current_player_index + 1) % len(self._players)
+        """Internal: pass the turn on, skipping eliminated players and full cards."""
+        player_count = len(self._players)
+        for _ in range(player_count):
+            self._current_player_index = (self._current_player_index + 1) % player_count
+            if self._open_boxes == 0 or self._has_turns_left(self._current_player()):
+                break
         return self._current_player()
 
     def _current_player(self) -> "Player":
@@ -0,0 +1,147 @@
+# src/yaht/packing.py
+"""Packed-integer encodings of dice, category sets and scorecards.
+
+Dice
+    Either a 15-bit value holding each die in three bits (first die in the
+    highest bits), which keeps dice order, or the 0-251 index of the sorted
+    roll in CANONICAL_ROLLS, which does not.
+
+Category sets
+    A 13-bit mask with bit i set for the i-th Category (ACES is bit 0,
+    CHANCE is bit 12).
+
+Scorecards
+    One 64-bit int holding everything a Scorecard records:
+
+    ======  =====================================================
+    bits    field
+    ======  =====================================================
+    0-12    filled category mask
+    13-30   dice counted in ACES..SIXES, three bits per category
+    31-35   THREE_OF_A_KIND points
+    36-40   FOUR_OF_A_KIND points
+    41-45   CHANCE points
+    46      FULL_HOUSE scored 25
+    47      SMALL_STRAIGHT scored 30
+    48      LARGE_STRAIGHT scored 40
+    49      YAHTZEE scored 50
+    50-53   Yahtzee bonus count
+    ======  =====================================================
+
+    Every category score the rules allow is representable, so packing is
+    lossless. The solver's (mask, upper subtotal, bonus flag) state is
+    derived with solver_state().
+"""
+
+from typing import Iterable
+
+from yaht.category import CATEGORIES, FULL_MASK, Category
+from yaht.dicetypes import CANONICAL_ROLLS, DiceRoll
+from yaht.scorecard import UPPER_BONUS_THRESHOLD, Scorecard
+
+_UPPER_SHIFT = 13
+_SUM_FIELDS = {
+    Category.THREE_OF_A_KIND: 31,
+    Category.FOUR_OF_A_KIND: 36,
+    Category.CHANCE: 41,
+}
+_FIXED_FIELDS = {
+    Category.FULL_HOUSE: (46, 25),
+    Category.SMALL_STRAIGHT: (47, 30),
+    Category.LARGE_STRAIGHT: (48, 40),
+    Category.YAHTZEE: (49, 50),
+}
+_BONUS_SHIFT = 50
+
+
+def pack_dice(numbers: Iterable[int]) -> int:
+    """Pack five dice, in order, three bits apiece."""
+    packed = 0
+    for number in numbers:
+        packed = packed << 3 | number
+    return packed
+
+
+def unpack_dice(packed: int) -> list[int]:
+    return [packed >> shift & 0b111 for shift in (12, 9, 6, 3, 0)]
+
+
+def roll_from_index(index: int) -> DiceRoll:
+    """Return the sorted DiceRoll with canonical index (see roll_index)."""
+    return DiceRoll(list(CANONICAL_ROLLS[index]))
+
+
+def pack_categories(categories: Iterable[Category]) -> int:
+    mask = 0
+    for category in categories:
+        mask |= category.bit
+    return mask
+
+
+def unpack_categories(mask: int) -> list[Category]:
+    return [c for i, c in enumerate(CATEGORIES) if mask >> i & 1]
+
+
+def pack_card(card: Scorecard) -> int:
+    """Pack a scorecard's scores and Yahtzee bonus count into 64 bits."""
+    packed = 0
+    for i, category in enumerate(CATEGORIES):
+        score = card.category_scores[category]
+        if score is None:
+            continue
+        packed |= 1 << i
+
+        number = category.die_number
+        if number is not None:
+            count, remainder = divmod(score, number)
+            if remainder or count > 5:
+                raise ValueError(f"Cannot pack {category.name} score {score}")
+            packed |= count << (_UPPER_SHIFT + 3 * i)
+        elif category in _SUM_FIELDS:
+            if not 0 <= score <= 30:
+                raise ValueError(f"Cannot pack {category.name} score {score}")
+            packed |= score << _SUM_FIELDS[category]
+        else:
+            bit, points = _FIXED_FIELDS[category]
+            if score not in (0, points):
+                raise ValueError(f"Cannot pack {category.name} score {score}")
+            packed |= (score == points) << bit
+
+    if not 0 <= card.yahtzee_bonus_count < 16:
+        raise ValueError(f"Cannot pack bonus count {card.yahtzee_bonus_count}")
+    return packed | card.yahtzee_bonus_count << _BONUS_SHIFT
+
+
+def unpack_card(packed: int) -> Scorecard:
+    """Rebuild a Scorecard from the output of pack_card."""
+    card = Scorecard()
+    for category, score in unpacked_scores(packed).items():
+        card.category_scores[category] = score
+    card.yahtzee_bonus_count = packed >> _BONUS_SHIFT & 0b1111
+    return card
+
+
+def unpacked_scores(packed: int) -> dict[Category, int | None]:
+    """Category scores held in a packed card, None where unfilled."""
+    scores: dict[Category, int | None] = {}
+    for i, category in enumerate(CATEGORIES):
+        if not packed >> i & 1:
+            scores[category] = None
+            continue
+        number = category.die_number
+        if number is not None:
+            scores[category] = number * (packed >> (_UPPER_SHIFT + 3 * i) & 0b111)
+        elif category in _SUM_FIELDS:
+            scores[category] = packed >> _SUM_FIELDS[category] & 0b11111
+        else:
+            bit, points = _FIXED_FIELDS[category]
+            scores[category] = points if packed >> bit & 1 else 0
+    return scores
+
+
+def solver_state(packed: int) -> int:
+    """Solver state index (mask, capped upper subtotal, bonus flag) of a packed card."""
+    mask = packed & FULL_MASK
+    upper = sum((i + 1) * (packed >> (_UPPER_SHIFT + 3 * i) & 0b111) for i in range(6))
+    bonus_flag = packed >> _FIXED_FIELDS[Category.YAHTZEE][0] & 1
+    return mask << 7 | bonus_flag << 6 | min(upper, UPPER_BONUS_THRESHOLD)
@@ -1,104 +1,375 @@
 # src/yaht/player.py
+from array import array
 from collections import Counter
-from typing import Protocol
+from concurrent.futures import Executor, Future
+from typing import TYPE_CHECKING, Generator, Protocol
 
-from yaht.category import Category
-from yaht.dicetypes import DiceRoll
-from yaht.game import PlayerGameState
+from yaht.cache import (
+    ALL_POSITIONS,
+    KEEP_ROLLING,
+    SCORE_STAGE,
+    DecisionCache,
+    DecisionStore,
+    decision_key,
+    roll_positions,
+)
+from yaht.category import CATEGORIES, UPPER_CATEGORIES, Category
+from yaht.dicetypes import CANONICAL_ROLLS, MAX_ROLL_COUNT, DiceRoll, roll_index
 from yaht.scorecard import ScorecardView
-from yaht.scorecheck import calculate_combo_score, is_combo_scoreable
+from yaht.scorecheck import category_scores_for, filled_mask, legal_categories
+
+if TYPE_CHECKING:
+    from yaht.game import PlayerGameState  # Needed to avoid circular dependency
+
+# Opening decisions plus the few later ones a single turn can add
+_TURN_CACHE_SIZE = 2 * len(CANONICAL_ROLLS)
+
+# Yields keep masks then the category; each reroll sends back (roll, rolls left)
+TurnSteps = Generator[int | Category, tuple[DiceRoll, int], None]
 
 
 class Player(Protocol):
     name: str
 
-    def take_turn(self, state: PlayerGameState) -> Category:
+    def take_turn(self, state: "PlayerGameState") -> Category:
         """Roll dice then choose category to score against."""
         raise NotImplementedError()
 
 
+class DeterministicPlayer(Protocol):
+    """A player whose choices depend only on the dice held and the card.
+
+    Decisions must be a function of the sorted roll, the filled categories,
+    the rolls left and whether Yahtzee bonuses are live, so they can be
+    shared through a DecisionCache.
+    """
+
+    name: str
+
+    def choose_reroll(
+        self, roll: DiceRoll, card: ScorecardView, rolls_left: int
+    ) -> tuple[list[int], bool]:
+        """Return indices to reroll (empty to stop) and whether to roll again after."""
+        raise NotImplementedError()
+
+    def choose_category(self, roll: DiceRoll, card: ScorecardView) -> Category:
+        """Choose category to score the final roll against."""
+        raise NotImplementedError()
+
+
+class BatchPlayer(Protocol):
+    """A player that makes one kind of decision for many games in a single call.
+
+    Requests arrive as parallel arrays: canonical roll indices (see
+    roll_index), scorecards packed with yaht.packing.pack_card and, for
+    rerolls, the rolls left. Game and the lockstep runner in
+    yaht.simulation use these methods in place of take_turn.
+    """
+
+    name: str
+
+    def choose_rerolls(self, rolls: array, cards: array, rolls_left: array) -> array:
+        """Return one packed reroll decision per request.
+
+        Each holds the sorted positions to reroll in bits 0-4 (0 stops) and
+        KEEP_ROLLING if the player may reroll again afterwards.
+        """
+        raise NotImplementedError()
+
+    def choose_categories(self, rolls: array, cards: array) -> array:
+        """Return the index of the category to score each final roll in."""
+        raise NotImplementedError()
+
+
+def is_batch_player(player: object) -> bool:
+    return callable(getattr(player, "choose_rerolls", None)) and callable(
+        getattr(player, "choose_categories", None)
+    )
+
+
+def take_batch_turn(
+    player: BatchPlayer, state: "PlayerGameState", packed_card: int
+) -> Category:
+    """Play a full turn for a single game from a BatchPlayer's decisions."""
+    dice_cup = state.dice_cup
+    cards = array("Q", [packed_card])
+
+    roll = dice_cup.roll_dice()
+    for rolls_left in (2, 1):
+        rolls = array("H", [roll_index(roll)])
+        decision = player.choose_rerolls(rolls, cards, array("B", [rolls_left]))[0]
+        positions = decision & ALL_POSITIONS
+        if not positions:
+            break
+        roll = dice_cup.roll_dice(roll_positions(roll, positions))
+        if not decision & KEEP_ROLLING:
+            break
+
+    return CATEGORIES[player.choose_categories(array("H", [roll_index(roll)]), cards)[0]]
+
+
+class GeneratorPlayer(Protocol):
+    """A player whose turn is a generator, so the engine rolls every die.
+
+    turn_steps() first yields 0, for the opening roll of all five dice. After
+    each roll the engine sends (roll, rolls left) and the generator yields a
+    keep mask, whose bit i keeps the die at position i of the roll while the
+    others are rerolled, or the Category to score the roll in. A suspended
+    turn is just a generator, so an engine can interleave many of them
+    without threads, or resume one when a remote player answers.
+    """
+
+    name: str
+
+    def turn_steps(self, card: ScorecardView) -> TurnSteps:
+        raise NotImplementedError()
+
+
+def is_generator_player(player: object) -> bool:
+    return callable(getattr(player, "turn_steps", None))
+
+
+def take_generator_turn(player: GeneratorPlayer, state: "PlayerGameState") -> Category:
+    """Play a full turn for a GeneratorPlayer, rolling its keep masks with the state's cup."""
+    dice_cup = state.dice_cup
+    steps = player.turn_steps(state.card)
+    try:
+        decision = next(steps)
+        roll = None
+        while not isinstance(decision, Category):
+            rerolled = None if roll is None else [i for i in range(5) if not decision >> i & 1]
+            roll = dice_cup.roll_dice(rerolled)
+            decision = steps.send((roll, MAX_ROLL_COUNT - dice_cup.roll_count))
+    finally:
+        steps.close()
+    return decision
+
+
+def deterministic_turn_steps(player: DeterministicPlayer, card: ScorecardView) -> TurnSteps:
+    """Turn steps making a DeterministicPlayer's decisions, as take_deterministic_turn does."""
+    roll, rolls_left = yield 0
+    while rolls_left:
+        indices, keep_rolling = player.choose_reroll(roll, card, rolls_left)
+        if not indices:
+            break
+        roll, rolls_left = yield ALL_POSITIONS & ~sum(1 << i for i in set(indices))
+        if not keep_rolling:
+            break
+    yield player.choose_category(roll, card)
+
+
+class SteppedPlayer:
+    """GeneratorPlayer driving an unmodified DeterministicPlayer."""
+
+    def __init__(self, player: DeterministicPlayer):
+        self.player = player
+        self.name = player.name
+
+    def turn_steps(self, card: ScorecardView) -> TurnSteps:
+        return deterministic_turn_steps(self.player, card)
+
+
+class PreparingPlayer(Protocol):
+    """A player that can get ready for its next turn while others play.
+
+    Game calls prepare_turn() with a copy of the player's card after each of
+    the player's turns, and for every other player before the first turn it
+    plays. The card does not change again before the player's next turn.
+    """
+
+    name: str
+
+    def prepare_turn(self, card: ScorecardView) -> None:
+        raise NotImplementedError()
+
+
+def opening_decisions(
+    player: DeterministicPlayer, card: ScorecardView
+) -> list[tuple[int, int]]:
+    """(decision_key, packed reroll decision) for all 252 opening rolls against card."""
+    rolls_left = MAX_ROLL_COUNT - 1
+    decisions = []
+    for numbers in CANONICAL_ROLLS:
+        roll = DiceRoll(list(numbers))
+        indices, keep_rolling = player.choose_reroll(roll, card, rolls_left)
+        # Canonical rolls are sorted, so indices are already sorted positions
+        decision = sum(1 << i for i in set(indices)) | (KEEP_ROLLING if keep_rolling else 0)
+        decisions.append((decision_key(roll, card, rolls_left), decision))
+    return decisions
+
+
+class SpeculativePlayer:
+    """Player precomputing a DeterministicPlayer's opening decisions between turns.
+
+    prepare_turn() submits opening_decisions() to executor and loads the
+    results into a fresh per-turn DecisionCache, which take_turn() plays
+    from. Work that has not finished when the turn starts is simply missed
+    and decided on the spot. A process pool executor needs a picklable
+    player; with no executor the work runs inside prepare_turn().
+    """
+
+    def __init__(self, player: DeterministicPlayer, executor: Executor | None = None):
+        self.player = player
+        self.name = player.name
+        self.executor = executor
+        self._cache: DecisionCache | None = None
+        self._pending: Future | None = None
+
+    def prepare_turn(self, card: ScorecardView) -> None:
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        cache = DecisionCache(_TURN_CACHE_SIZE)
+        self._cache = cache
+        if self.executor is None:
+            _load_decisions(cache, opening_decisions(self.player, card))
+            return
+
+        def load(future: Future) -> None:
+            # A failed job leaves the cache empty; the turn then raises the error itself
+            if not future.cancelled() and future.exception() is None:
+                _load_decisions(cache, future.result())
+
+        self._pending = self.executor.submit(opening_decisions, self.player, card)
+        self._pending.add_done_callback(load)
+
+    def take_turn(self, state: "PlayerGameState") -> Category:
+        cache = self._cache if self._cache is not None else DecisionCache(_TURN_CACHE_SIZE)
+        self._cache = None
+        if self._pending is not None:
+            # Only frees the worker if the job never started
+            self._pending.cancel()
+            self._pending = None
+        return take_deterministic_turn(self.player, state, cache)
+
+
+def _load_decisions(cache: DecisionCache, decisions: list[tuple[int, int]]) -> None:
+    for key, decision in decisions:
+        cache.put(key, decision)
+
+
+def take_deterministic_turn(
+    player: DeterministicPlayer,
+    state: "PlayerGameState",
+    cache: DecisionStore | None = None,
+) -> Category:
+    """Play a full turn from a DeterministicPlayer's decisions, memoized in cache."""
+    dice_cup = state.dice_cup
+    card = state.card
+
+    roll = dice_cup.roll_dice()
+    for rolls_left in (2, 1):
+        indices, keep_rolling = _decide_reroll(player, roll, card, rolls_left, cache)
+        if not indices:
+            break
+        roll = dice_cup.roll_dice(indices)
+        if not keep_rolling:
+            break
+
+    if cache is None:
+        return player.choose_category(roll, card)
+
+    key = decision_key(roll, card, SCORE_STAGE)
+    decision = cache.get(key)
+    if decision is None:
+        category = player.choose_category(roll, card)
+        cache.put(key, category.index)
+        return category
+    return CATEGORIES[decision]
+
+
+def _decide_reroll(
+    player: DeterministicPlayer,
+    roll: DiceRoll,
+    card: ScorecardView,
+    rolls_left: int,
+    cache: DecisionStore | None,
+) -> tuple[list[int], bool]:
+    if cache is None:
+        return player.choose_reroll(roll, card, rolls_left)
+
+    # Cached rerolls are stored against sorted dice positions
+    key = decision_key(roll, card, rolls_left)
+    decision = cache.get(key)
+    if decision is None:
+        indices, keep_rolling = player.choose_reroll(roll, card, rolls_left)
+        decision = _sorted_positions(roll, indices) | (KEEP_ROLLING if keep_rolling else 0)
+        cache.put(key, decision)
+        return indices, keep_rolling
+    return roll_positions(roll, decision), bool(decision & KEEP_ROLLING)
+
+
+def _sorted_positions(roll: DiceRoll, indices: list[int]) -> int:
+    """Mask of positions in the sorted roll holding the dice at indices."""
+    rerolled = Counter(roll[i] for i in indices)
+    positions = 0
+    for position, number in enumerate(sorted(roll)):
+        if rerolled[number]:
+            rerolled[number] -= 1
+            positions |= 1 << position
+    return positions
+
+
 class BasicBotPlayer:
-    def __init__(self, name: str = "BasicBot"):
+    def __init__(self, name: str = "BasicBot", cache: DecisionStore | None = None):
         self.name = name
+        self.cache = cache
 
-    def take_turn(self, state: PlayerGameState) -> Category:
+    def take_turn(self, state: "PlayerGameState") -> Category:
         """Roll dice then choose category to score against."""
-        # Roll dice up to 3 times with simple strategy
-        dice_cup = state.dice_cup
-        card = state.card
-
-        # First roll - always roll all dice
-        roll = dice_cup.roll_dice()
-
-        # Simple reroll strategy for rolls 2 and 3
-        for _ in range(2):  # Up to 2 more rolls
-            counts = Counter(roll.numbers)
-            max_count = max(counts.values())
-
-            # If we have 4+ of a kind, keep them and reroll the rest
-            if max_count >= 4:
-                most_common_value = counts.most_common(1)[0][0]
-                indices_to_reroll = [
-                    i for i, val in enumerate(roll.numbers) if val != most_common_value
-                ]
-                if indices_to_reroll:
-                    roll = dice_cup.roll_dice(indices_to_reroll)
-                break
-
-            # If we have 3 of a kind, try for Yahtzee if upper section available
-            elif max_count == 3:
-                most_common_value = counts.most_common(1)[0][0]
-                upper_category = Category.from_number(most_common_value)
-                if card.category_scores.get(upper_category) is None:
-                    # Keep the three and reroll the rest
-                    indices_to_reroll = [
-                        i for i, val in enumerate(roll.numbers) if val != most_common_value
-                    ]
-                    if indices_to_reroll:
-                        roll = dice_cup.roll_dice(indices_to_reroll)
-                    continue
-
-            # If we have a pair of 4s, 5s, or 6s, keep them
-            elif max_count == 2:
-                most_common_value = counts.most_common(1)[0][0]
-                if most_common_value >= 4:
-                    indices_to_reroll = [
-                        i for i, val in enumerate(roll.numbers) if val != most_common_value
-                    ]
-                    if indices_to_reroll:
-                        roll = dice_cup.roll_dice(indices_to_reroll)
-                    continue
-
-            # Otherwise, keep highest values and reroll lowest
-            sorted_dice = sorted(roll.numbers, reverse=True)
-            if sorted_dice[0] >= 4:  # Keep high values
-                indices_to_reroll = [i for i, val in enumerate(roll.numbers) if val < 4]
-                if indices_to_reroll:
-                    roll = dice_cup.roll_dice(indices_to_reroll)
-            else:
-                break  # Don't reroll if we don't have a clear strategy
-
-        # Choose category based on strategy
-        return self._choose_category(roll, card)
-
-    def _choose_category(self, roll: DiceRoll, card: ScorecardView) -> Category:
+        return take_deterministic_turn(self, state, self.cache)
+
+    def choose_reroll(
+        self, roll: DiceRoll, card: ScorecardView, rolls_left: int
+    ) -> tuple[list[int], bool]:
+        """Simple reroll strategy for rolls 2 and 3."""
+        counts = Counter(roll.numbers)
+        # Break count ties toward the higher number so only the dice held matter
+        most_common_value, max_count = max(counts.items(), key=lambda item: item[::-1])
+        others = [i for i, val in enumerate(roll.numbers) if val != most_common_value]
+
+        # If we have 4+ of a kind, keep them and reroll the rest one last time
+        if max_count >= 4:
+            return others, False
+
+        # If we have 3 of a kind, try for Yahtzee if upper section available
+        if max_count == 3:
+            upper_category = Category.from_number(most_common_value)
+            if card.category_scores.get(upper_category) is None:
+                return others, True
+
+        # If we have a pair of 4s, 5s, or 6s, keep them
+        elif max_count == 2 and most_common_value >= 4:
+            return others, True
+
+        # Otherwise, keep high values and reroll lowest
+        if max(roll.numbers) >= 4:
+            return [i for i, val in enumerate(roll.numbers) if val < 4], True
+
+        # Don't reroll if we don't have a clear strategy
+        return [], False
+
+    def choose_category(self, roll: DiceRoll, card: ScorecardView) -> Category:
         """Choose the best category for the given roll and card state."""
         counts = Counter(roll.numbers)
         max_count = max(counts.values())
         unscored = card.get_unscored_categories()
+        # Open categories the roll scores in and what it would score in each,
+        # looked up once for the whole decision
+        filled = filled_mask(card)
+        legal = legal_categories(roll, card, filled)
+        scores = category_scores_for(roll, card, filled)
 
         # Strategy 1: If we have 4+ of a kind with 4s, 5s, or 6s, use upper section first
         if max_count >= 4:
             most_common_value = counts.most_common(1)[0][0]
             if most_common_value >= 4:
                 upper_category = Category.from_number(most_common_value)
-                if upper_category in unscored and is_combo_scoreable(
-                    upper_category, roll, card
-                ):
+                if legal & upper_category.bit:
                     return upper_category
 
         # Strategy 2: Take Yahtzee if available
-        if Category.YAHTZEE in unscored and is_combo_scoreable(Category.YAHTZEE, roll, card):
+        if legal & Category.YAHTZEE.bit:
             return Category.YAHTZEE
 
         # Strategy 3: Take high-value combinations
@@ -109,17 +380,17 @@ class BasicBotPlayer:
         ]
 
         for category in high_value_categories:
-            if category in unscored and is_combo_scoreable(category, roll, card):
+            if legal & category.bit:
                 return category
 
         # Strategy 4: Fill upper section with good scores (aim for 63+ total)
         upper_scores = []
-        for category in Category.get_upper_categories():
-            if category in unscored and is_combo_scoreable(category, roll, card):
-                score = calculate_combo_score(category, roll)
+        for category in UPPER_CATEGORIES:
+            if legal & category.bit:
+                score = scores[category.index]
                 die_number = category.die_number
                 if (
-                    die_number is not None and score >= die_number * 3
+                    die_number is not None and score is not None and score >= die_number * 3
                 ):  # At least 3 of that number
                     upper_scores.append((category, score))
 
@@ -128,15 +399,11 @@ class BasicBotPlayer:
             return max(upper_scores, key=lambda x: x[1])[0]
 
         # Strategy 5: Take 4 of a kind or 3 of a kind if good score
-        if max_count >= 4 and Category.FOUR_OF_A_KIND in unscored:
-            if is_combo_scoreable(Category.FOUR_OF_A_KIND, roll, card):
-                return Category.FOUR_OF_A_KIND
-
-        if max_count >= 3 and Category.THREE_OF_A_KIND in unscored:
-            if (
-                is_combo_scoreable(Category.THREE_OF_A_KIND, roll, card)
-                and sum(roll.numbers) >= 15
-            ):
+        if max_count >= 4 and legal & Category.FOUR_OF_A_KIND.bit:
+            return Category.FOUR_OF_A_KIND
+
+        if max_count >= 3 and legal & Category.THREE_OF_A_KIND.bit:
+            if sum(roll.numbers) >= 15:
                 return Category.THREE_OF_A_KIND
 
         # Strategy 6: Use chance as fallback only if it's a decent score
@@ -0,0 +1,245 @@
+# src/yaht/policy.py
+"""Turn policies over solitaire states.
+
+A TurnPolicy makes the same decisions as a Player, but against solver state
+indices and canonical roll indices instead of live DiceCup and Scorecard
+objects, so a turn can be analysed exactly rather than by rolling dice.
+"""
+
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from math import sqrt, sumprod
+from typing import Protocol
+
+from yaht.cache import ALL_POSITIONS, KEEP_ROLLING, SCORE_STAGE
+from yaht.category import Category
+from yaht.dicetypes import CANONICAL_ROLLS, DiceRoll
+from yaht.packing import solver_state, unpack_categories
+from yaht.player import DeterministicPlayer
+from yaht.scorecard import Scorecard, ScorecardView
+from yaht.solver import (
+    CATEGORIES,
+    FULL_MASK,
+    StateValues,
+    best_roll_values,
+    final_roll_values,
+    score_move,
+    tables,
+)
+
+
+class TurnPolicy(Protocol):
+    def choose_reroll(self, state: int, roll: int, rolls_left: int) -> int:
+        """Return sorted positions to reroll in bits 0-4 (0 stops), plus KEEP_ROLLING."""
+        raise NotImplementedError()
+
+    def choose_category(self, state: int, roll: int) -> int:
+        """Return the index of the category to score the final roll in."""
+        raise NotImplementedError()
+
+
+class OptimalPolicy:
+    """Maximizes expected final score using solved state values."""
+
+    def __init__(self, values: StateValues, cached_states: int = 256):
+        self._values = values
+        self._widget = lru_cache(maxsize=cached_states)(self._solve_widget)
+
+    def choose_reroll(self, state: int, roll: int, rolls_left: int) -> int:
+        finals, keep_values = self._widget(state)
+        keeps = tables().reroll_keeps[roll]
+        by_keep = keep_values[rolls_left - 1]
+
+        # Stopping scores the roll as it stands
+        best_positions = 0
+        best_value = finals[roll]
+        for positions in range(1, ALL_POSITIONS + 1):
+            value = by_keep[keeps[positions]]
+            if value > best_value:
+                best_positions, best_value = positions, value
+        return best_positions | KEEP_ROLLING
+
+    def choose_category(self, state: int, roll: int) -> int:
+        best_category = -1
+        best_value = float("-inf")
+        for category in range(len(CATEGORIES)):
+            if not state >> (category + 7) & 1:
+                points, next_state = score_move(state, roll, category)
+                value = points + self._values[next_state]
+                if value > best_value:
+                    best_category, best_value = category, value
+        return best_category
+
+    def _solve_widget(self, state: int) -> tuple[list[float], tuple[list[float], ...]]:
+        """Final roll values, and partial keep values with 1 and 2 rolls left."""
+        t = tables()
+        finals = final_roll_values(self._values, state)
+        seconds = best_roll_values(finals)
+        last_keeps = [sumprod(probs, get(finals)) for get, probs in t.partial_keeps]
+        first_keeps = [sumprod(probs, get(seconds)) for get, probs in t.partial_keeps]
+        return finals, (last_keeps, first_keeps)
+
+
+class PolicyBatchPlayer:
+    """BatchPlayer making a TurnPolicy's decisions, for the lockstep runner."""
+
+    def __init__(self, policy: TurnPolicy, name: str = "Policy"):
+        self.name = name
+        self.policy = policy
+
+    def choose_rerolls(self, rolls: array, cards: array, rolls_left: array) -> array:
+        choose = self.policy.choose_reroll
+        return array(
+            "B",
+            [
+                choose(solver_state(card), roll, left)
+                for roll, card, left in zip(rolls, cards, rolls_left)
+            ],
+        )
+
+    def choose_categories(self, rolls: array, cards: array) -> array:
+        choose = self.policy.choose_category
+        return array(
+            "B", [choose(solver_state(card), roll) for roll, card in zip(rolls, cards)]
+        )
+
+
+class PlayerPolicy:
+    """TurnPolicy making a DeterministicPlayer's decisions, such as BasicBotPlayer's.
+
+    Such a player decides from the filled categories and whether Yahtzee
+    bonuses are live, never from the upper subtotal, so each decision is
+    made once per mask and bonus flag. The player sees the roll sorted, on
+    a card with every filled box zeroed (Yahtzee at 50 when bonuses are live).
+    """
+
+    ignores_upper_subtotal = True
+
+    def __init__(self, player: DeterministicPlayer):
+        self.player = player
+        self._decisions: dict[tuple[int, int, int], int] = {}
+
+    def choose_reroll(self, state: int, roll: int, rolls_left: int) -> int:
+        key = (state >> 6, roll, rolls_left)
+        decision = self._decisions.get(key)
+        if decision is None:
+            card = _representative_card(state >> 6)
+            indices, keep_rolling = self.player.choose_reroll(_dice(roll), card, rolls_left)
+            # The dice are sorted, so indices are already sorted positions
+            decision = sum(1 << i for i in set(indices)) | (KEEP_ROLLING if keep_rolling else 0)
+            self._decisions[key] = decision
+        return decision
+
+    def choose_category(self, state: int, roll: int) -> int:
+        key = (state >> 6, roll, SCORE_STAGE)
+        decision = self._decisions.get(key)
+        if decision is None:
+            card = _representative_card(state >> 6)
+            decision = self.player.choose_category(_dice(roll), card).index
+            self._decisions[key] = decision
+        return decision
+
+
+@dataclass
+class PolicyEvaluation:
+    """Exact moments of the points a policy still scores from a state."""
+
+    mean: float
+    variance: float
+    # Distinct states reachable under the policy, the start included
+    states: int
+
+    @property
+    def standard_deviation(self) -> float:
+        return sqrt(self.variance)
+
+
+def evaluate_policy(policy: TurnPolicy, state: int = 0) -> PolicyEvaluation:
+    """Expected points and their variance when policy plays out the game from state.
+
+    Works back from full cards over every state the policy can reach, so
+    the numbers are exact rather than sampled. Policies with a true
+    ignores_upper_subtotal attribute, such as PlayerPolicy, share one
+    final-roll distribution between states differing only in the subtotal.
+    """
+    share_rolls = getattr(policy, "ignores_upper_subtotal", False)
+    final_rolls: dict[int, list[tuple[int, float, int]]] = {}
+    moments: dict[int, tuple[float, float]] = {}
+
+    def outcomes(state: int) -> list[tuple[int, float, int]]:
+        key = state >> 6 if share_rolls else state
+        rolls = final_rolls.get(key)
+        if rolls is None:
+            rolls = [
+                (roll, p, policy.choose_category(state, roll))
+                for roll, p in final_roll_distribution(policy, state).items()
+            ]
+            final_rolls[key] = rolls
+        return rolls
+
+    def visit(state: int) -> tuple[float, float]:
+        if state >> 7 == FULL_MASK:
+            return 0.0, 0.0
+        found = moments.get(state)
+        if found is not None:
+            return found
+
+        # First and second moments of points still to come
+        first = second = 0.0
+        for roll, p, category in outcomes(state):
+            points, next_state = score_move(state, roll, category)
+            next_first, next_second = visit(next_state)
+            first += p * (points + next_first)
+            second += p * (points * points + 2 * points * next_first + next_second)
+        moments[state] = first, second
+        return first, second
+
+    mean, second = visit(state)
+    return PolicyEvaluation(mean, max(second - mean * mean, 0.0), max(len(moments), 1))
+
+
+def final_roll_distribution(policy: TurnPolicy, state: int) -> dict[int, float]:
+    """Exact distribution of the roll policy ends its turn in state with."""
+    t = tables()
+    indices, probs = t.keep_outcomes[0]
+    rolling = dict(zip(indices, probs))
+    final: defaultdict[int, float] = defaultdict(float)
+
+    for rolls_left in (2, 1):
+        next_rolling: defaultdict[int, float] = defaultdict(float)
+        for roll, p in rolling.items():
+            decision = policy.choose_reroll(state, roll, rolls_left)
+            rerolled = decision & ALL_POSITIONS
+            if not rerolled:
+                final[roll] += p
+                continue
+            target = next_rolling if rolls_left > 1 and decision & KEEP_ROLLING else final
+            outcome_indices, outcome_probs = t.keep_outcomes[t.reroll_keeps[roll][rerolled]]
+            for outcome, q in zip(outcome_indices, outcome_probs):
+                target[outcome] += p * q
+        rolling = next_rolling
+    return dict(final)
+
+
+def turn_outcomes(policy: TurnPolicy, state: int) -> dict[tuple[int, int], float]:
+    """Exact distribution of (points, next state) for one turn played by policy."""
+    outcomes: defaultdict[tuple[int, int], float] = defaultdict(float)
+    for roll, p in final_roll_distribution(policy, state).items():
+        outcomes[score_move(state, roll, policy.choose_category(state, roll))] += p
+    return dict(outcomes)
+
+
+def _dice(roll: int) -> DiceRoll:
+    return DiceRoll(list(CANONICAL_ROLLS[roll]))
+
+
+@lru_cache(maxsize=None)
+def _representative_card(mask_and_bonus: int) -> ScorecardView:
+    card = Scorecard()
+    for category in unpack_categories(mask_and_bonus >> 1):
+        card.category_scores[category] = 0
+    if mask_and_bonus & 1:
+        card.category_scores[Category.YAHTZEE] = 50
+    return card.view
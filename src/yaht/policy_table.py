@@ -0,0 +1,198 @@
+# src/yaht/policy_table.py
+"""Compressed on-disk policy tables with random access by state.
+
+Every decision a TurnPolicy makes in one solitaire state is packed into a
+16-bit word per canonical roll:
+
+    ======  ==========================================================
+    bits    field
+    ======  ==========================================================
+    0-5     reroll decision with 2 rolls left (positions, KEEP_ROLLING)
+    6-10    sorted positions to reroll with 1 roll left
+    11-14   category index to score the final roll in
+    ======  ==========================================================
+
+The 252 words of a state form one block, compressed with zlib against a
+dictionary shared by the whole file (the raw blocks of the first states
+written), which neighbouring states resemble closely. The file is
+
+    header | dictionary | blocks | pad | block offsets | state index
+
+and is memory mapped, so a lookup bisects the index, decompresses one
+block of about 500 bytes and leaves the rest of the file on disk.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from typing import TYPE_CHECKING, Sequence
+
+from yaht.cache import ALL_POSITIONS, KEEP_ROLLING, roll_positions
+from yaht.category import CATEGORIES, Category
+from yaht.dicetypes import CANONICAL_ROLLS, DiceRoll, roll_index
+from yaht.player import take_deterministic_turn
+from yaht.policy import TurnPolicy
+from yaht.scorecard import ScorecardView
+from yaht.solver import FULL_MASK, card_state, layer_states
+
+if TYPE_CHECKING:
+    from yaht.game import PlayerGameState
+
+POLICY_TABLE_VERSION = 1
+
+_MAGIC = b"YHPT"
+# magic, version, state count, dictionary size, index offset
+_HEADER = struct.Struct("<4sHIIQ")
+_DICTIONARY_STATES = 64
+_FIRST_REROLL_BITS = 0b111111
+_LAST_REROLL_SHIFT = 6
+_CATEGORY_SHIFT = 11
+
+
+def encode_state(policy: TurnPolicy, state: int) -> bytes:
+    """Raw (uncompressed) block of policy's decisions in state."""
+    words = array("H", bytes(2 * len(CANONICAL_ROLLS)))
+    for roll in range(len(CANONICAL_ROLLS)):
+        first = policy.choose_reroll(state, roll, 2) & _FIRST_REROLL_BITS
+        last = policy.choose_reroll(state, roll, 1) & ALL_POSITIONS
+        category = policy.choose_category(state, roll)
+        words[roll] = first | last << _LAST_REROLL_SHIFT | category << _CATEGORY_SHIFT
+    return _little_endian(words).tobytes()
+
+
+def write_policy_table(
+    path: str | os.PathLike, policy: TurnPolicy, start_mask: int = 0
+) -> None:
+    """Write policy's decisions for every state whose filled categories include start_mask."""
+    masks = (m for m in range(FULL_MASK) if m & start_mask == start_mask)
+    states = (state for mask in masks for state in layer_states(mask))
+
+    # Hold back the first blocks to build the shared dictionary from
+    first_blocks: list[tuple[int, bytes]] = []
+    for state in states:
+        first_blocks.append((state, encode_state(policy, state)))
+        if len(first_blocks) == _DICTIONARY_STATES:
+            break
+    dictionary = b"".join(block for _, block in first_blocks)[-32768:]
+
+    indexed = array("I")
+    offsets = array("Q")
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, POLICY_TABLE_VERSION, 0, len(dictionary), 0))
+        f.write(dictionary)
+
+        def write_block(state: int, raw: bytes) -> None:
+            compressor = zlib.compressobj(9, zdict=dictionary)
+            indexed.append(state)
+            offsets.append(f.tell())
+            f.write(compressor.compress(raw) + compressor.flush())
+
+        for state, raw in first_blocks:
+            write_block(state, raw)
+        for state in states:
+            write_block(state, encode_state(policy, state))
+        offsets.append(f.tell())
+
+        f.write(bytes(-f.tell() % 8))
+        index_offset = f.tell()
+        f.write(_little_endian(offsets).tobytes())
+        f.write(_little_endian(indexed).tobytes())
+        f.seek(0)
+        f.write(
+            _HEADER.pack(
+                _MAGIC, POLICY_TABLE_VERSION, len(indexed), len(dictionary), index_offset
+            )
+        )
+
+
+class PolicyTable:
+    """TurnPolicy read from a file written by write_policy_table."""
+
+    def __init__(self, path: str | os.PathLike, cached_states: int = 256):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, dictionary_size, index_offset = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC:
+            raise ValueError(f"{os.fspath(path)} is not a policy table")
+        if version != POLICY_TABLE_VERSION:
+            raise ValueError(f"Unsupported policy table version: {version}")
+
+        view = memoryview(self._map)
+        self._dictionary = view[_HEADER.size : _HEADER.size + dictionary_size]
+        states_offset = index_offset + 8 * (count + 1)
+        self._offsets: Sequence[int] = view[index_offset:states_offset].cast("Q")
+        self._states: Sequence[int] = view[states_offset : states_offset + 4 * count].cast("I")
+        if sys.byteorder != "little":
+            self._offsets = _little_endian(array("Q", self._offsets))
+            self._states = _little_endian(array("I", self._states))
+        self._decoded = lru_cache(maxsize=cached_states)(self._decode)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, state: int) -> bool:
+        i = bisect_left(self._states, state)
+        return i < len(self._states) and self._states[i] == state
+
+    def choose_reroll(self, state: int, roll: int, rolls_left: int) -> int:
+        word = self._decoded(state)[roll]
+        if rolls_left == 1:
+            return word >> _LAST_REROLL_SHIFT & ALL_POSITIONS | KEEP_ROLLING
+        return word & _FIRST_REROLL_BITS
+
+    def choose_category(self, state: int, roll: int) -> int:
+        return self._decoded(state)[roll] >> _CATEGORY_SHIFT
+
+    def close(self) -> None:
+        self._decoded.cache_clear()
+        for view in (self._dictionary, self._offsets, self._states):
+            if isinstance(view, memoryview):
+                view.release()
+        self._map.close()
+
+    def __enter__(self) -> "PolicyTable":
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    def _decode(self, state: int) -> array:
+        i = bisect_left(self._states, state)
+        if i == len(self._states) or self._states[i] != state:
+            raise KeyError(f"State {state} is not in the policy table")
+        block = self._map[self._offsets[i] : self._offsets[i + 1]]
+        words = array("H", zlib.decompressobj(zdict=self._dictionary).decompress(block))
+        return _little_endian(words)
+
+
+class PolicyTablePlayer:
+    """Player making the decisions stored in a PolicyTable."""
+
+    def __init__(self, table: PolicyTable, name: str = "PolicyTable"):
+        self.name = name
+        self.table = table
+
+    def take_turn(self, state: "PlayerGameState") -> Category:
+        return take_deterministic_turn(self, state)
+
+    def choose_reroll(
+        self, roll: DiceRoll, card: ScorecardView, rolls_left: int
+    ) -> tuple[list[int], bool]:
+        decision = self.table.choose_reroll(card_state(card), roll_index(roll), rolls_left)
+        return roll_positions(roll, decision & ALL_POSITIONS), bool(decision & KEEP_ROLLING)
+
+    def choose_category(self, roll: DiceRoll, card: ScorecardView) -> Category:
+        return CATEGORIES[self.table.choose_category(card_state(card), roll_index(roll))]
+
+
+def _little_endian(values: array) -> array:
+    """Convert values between native and file (little-endian) byte order in place."""
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
@@ -1,29 +1,88 @@
 # src/yaht/scorecard.py
 
+from array import array
+from collections.abc import Iterator, Mapping, MutableMapping
 from typing import Callable, Protocol
 
-from yaht.category import Category
+from yaht.category import CATEGORIES, LOWER_CATEGORIES, UPPER_CATEGORIES, Category
 from yaht.dicetypes import DiceRoll
 from yaht.exceptions import (
     CategoryAlreadyScored,
+    HistoryEmptyError,
     InvalidCategoryError,
 )
-from yaht.scorecheck import calculate_combo_score, is_combo_scoreable
+from yaht.scorecheck import calculate_combo_score, legal_categories
 
 UPPER_BONUS_SCORE = 35
 UPPER_BONUS_THRESHOLD = 63
 YAHTZEE_BONUS_SCORE = 100
+# Thirteen Yahtzees: upper section 105 + 35 bonus, lower section 235 with jokers
+# in full house and both straights, and 12 x 100 in Yahtzee bonuses
+MAX_CARD_SCORE = 1575
+
+# Stored in place of None for an open category
+_OPEN = -1
+_ALL_OPEN = array("h", [_OPEN]) * len(CATEGORIES)
+
+
+class CategoryScores(MutableMapping[Category, int | None]):
+    """Score of each category, None while open, stored as 13 small ints.
+
+    Behaves like the dict of every Category it replaces: iteration is in
+    Category order and categories cannot be removed.
+    """
+
+    __slots__ = ("_scores",)
+
+    def __init__(self, scores: Mapping[Category, int | None] | None = None):
+        self._scores = array("h", _ALL_OPEN)
+        if scores is not None:
+            self.update(scores)
+
+    def __getitem__(self, category: Category) -> int | None:
+        try:
+            score = self._scores[category.index]
+        except (AttributeError, TypeError):
+            raise KeyError(category) from None
+        return None if score == _OPEN else score
+
+    def __setitem__(self, category: Category, score: int | None) -> None:
+        if not isinstance(category, Category):
+            raise KeyError(category)
+        self._scores[category.index] = _OPEN if score is None else score
+
+    def __delitem__(self, category: Category) -> None:
+        raise TypeError("Categories cannot be removed from a scorecard")
+
+    def __contains__(self, category: object) -> bool:
+        return isinstance(category, Category)
+
+    def __iter__(self) -> Iterator[Category]:
+        return iter(CATEGORIES)
+
+    def __len__(self) -> int:
+        return len(CATEGORIES)
+
+    def __repr__(self) -> str:
+        return f"CategoryScores({dict(self.items())})"
+
+    def copy(self) -> "CategoryScores":
+        copied = CategoryScores.__new__(CategoryScores)
+        copied._scores = array("h", self._scores)
+        return copied
 
 
 class ScorecardLike(Protocol):
-    category_scores: dict[Category, int | None]
+    category_scores: Mapping[Category, int | None]
 
 
 class ScorecardView:
+    __slots__ = ("_card_get_score", "category_scores")
+
     def __init__(
         self,
         get_card_score: Callable[[], int],
-        category_scores: dict[Category, int | None],
+        category_scores: MutableMapping[Category, int | None],
     ):
         self._card_get_score = get_card_score
         self.category_scores = category_scores
@@ -38,12 +97,17 @@ class ScorecardView:
 class Scorecard:
     """Tracks the score for a single player."""
 
+    __slots__ = ("category_scores", "yahtzee_bonus_count", "_undo_stack", "_redo_stack")
+
     def __init__(self):
         # Initialize all categories to None (not scored yet)
-        self.category_scores: dict[Category, int | None] = {
-            category: None for category in Category
-        }
+        self.category_scores = CategoryScores()
         self.yahtzee_bonus_count = 0
+        # (category, previous score, bonus count change) per applied move;
+        # both histories are created on first use
+        self._undo_stack: list[tuple[Category, int | None, int]] | None = None
+        # (category, score, bonus count change) per undone move
+        self._redo_stack: list[tuple[Category, int | None, int]] | None = None
 
     def zero_category(self, category: Category, roll: DiceRoll) -> None:
         if self.category_scores[category] is not None:
@@ -66,7 +130,7 @@ class Scorecard:
             raise CategoryAlreadyScored(f"Category {category.name} has already been scored")
 
         # --- Validate playability ---
-        if not is_combo_scoreable(category, roll, self):
+        if not legal_categories(roll, self) >> category.index & 1:
             raise InvalidCategoryError(f"Unplayable {category.name} combination: {roll}")
 
         # --- Begin Scoring Dice ---
@@ -78,15 +142,73 @@ class Scorecard:
         # Call the appropriate scorer
         self.category_scores[category] = calculate_combo_score(category, roll)
 
+    def score_category(self, category: Category, roll: DiceRoll) -> None:
+        """Score roll in category, or zero category when roll does not fit it.
+
+        Equivalent to set_category_score or zero_category after checking
+        is_combo_scoreable, but checks playability only once, with a single
+        legal_categories lookup.
+        """
+        if category not in self.category_scores:
+            raise InvalidCategoryError(f"Unknown category: {category}")
+
+        if self.category_scores[category] is not None:
+            raise CategoryAlreadyScored(f"Category {category.name} has already been scored")
+
+        scoreable = legal_categories(roll, self) >> category.index & 1
+        if Category.YAHTZEE in roll and self.category_scores[Category.YAHTZEE] == 50:
+            self.yahtzee_bonus_count += 1
+        score = calculate_combo_score(category, roll) if scoreable else 0
+        self.category_scores[category] = score
+
+    def apply(self, category: Category, roll: DiceRoll) -> None:
+        """score_category, recording the change so undo() can reverse it.
+
+        Lets a search explore moves on one card instead of copying it. Only
+        moves made through apply() are recorded, and applying a move clears
+        the redo history.
+        """
+        previous = self.category_scores.get(category)
+        bonus_count = self.yahtzee_bonus_count
+        self.score_category(category, roll)
+        if self._undo_stack is None:
+            self._undo_stack = []
+        self._undo_stack.append((category, previous, self.yahtzee_bonus_count - bonus_count))
+        self._redo_stack = None
+
+    def undo(self) -> Category:
+        """Reverse the most recent apply() and return its category."""
+        if not self._undo_stack:
+            raise HistoryEmptyError("No move to undo")
+        category, previous, bonus_change = self._undo_stack.pop()
+        if self._redo_stack is None:
+            self._redo_stack = []
+        self._redo_stack.append((category, self.category_scores[category], bonus_change))
+        self.category_scores[category] = previous
+        self.yahtzee_bonus_count -= bonus_change
+        return category
+
+    def redo(self) -> Category:
+        """Reapply the most recently undone move and return its category."""
+        if not self._redo_stack:
+            raise HistoryEmptyError("No move to redo")
+        category, score, bonus_change = self._redo_stack.pop()
+        if self._undo_stack is None:
+            self._undo_stack = []
+        self._undo_stack.append((category, self.category_scores[category], bonus_change))
+        self.category_scores[category] = score
+        self.yahtzee_bonus_count += bonus_change
+        return category
+
+    @property
+    def undo_depth(self) -> int:
+        """Number of applied moves that undo() can reverse."""
+        return len(self._undo_stack) if self._undo_stack else 0
+
     def get_card_score(self) -> int:
         """Get the score across all categories including bonuses."""
-        upper_score = sum(
-            self.category_scores[cat] or 0 for cat in Category.get_upper_categories()
-        )
-
-        lower_score = sum(
-            self.category_scores[cat] or 0 for cat in Category.get_lower_categories()
-        )
+        upper_score = sum(self.category_scores[cat] or 0 for cat in UPPER_CATEGORIES)
+        lower_score = sum(self.category_scores[cat] or 0 for cat in LOWER_CATEGORIES)
 
         upper_bonus = UPPER_BONUS_SCORE if upper_score >= UPPER_BONUS_THRESHOLD else 0
         yahtzee_bonus = self.yahtzee_bonus_count * YAHTZEE_BONUS_SCORE
@@ -106,4 +228,4 @@ class Scorecard:
     @property
     def view(self) -> ScorecardView:
         """Return a read-only view of the scorecard."""
-        return ScorecardView(self.get_card_score, dict(self.category_scores))
+        return ScorecardView(self.get_card_score, self.category_scores.copy())
@@ -1,8 +1,16 @@
 # src/yaht/validate.py
+import threading
 from typing import TYPE_CHECKING
 
-from yaht.category import Category, Section
-from yaht.dicetypes import DiceRoll
+from yaht.category import (
+    CATEGORIES,
+    FULL_MASK,
+    LOWER_CATEGORIES,
+    LOWER_MASK,
+    Category,
+    Section,
+)
+from yaht.dicetypes import CANONICAL_ROLLS, DiceRoll, roll_index
 from yaht.exceptions import InvalidCategoryError
 
 if TYPE_CHECKING:
@@ -11,7 +19,7 @@ if TYPE_CHECKING:
 
 def calculate_combo_score(category: Category, roll: DiceRoll) -> int:
     """Determine value of combination based on absolute or relative score."""
-    if category.section == Section.UPPER:
+    if category.section is Section.UPPER:
         return _calculate_upper_score(category, roll)
     elif category is Category.FULL_HOUSE:
         return 25
@@ -69,13 +77,11 @@ def _is_scoreable_joker_rules(
         return category == matched_category
 
     # If upper matching category is scored then any lower category is playable
-    if category in Category.get_lower_categories():
+    if category.section is Section.LOWER:
         return True
 
     # Can only play a non-matching upper category if all lower categories scored
-    no_free_lower_categories = all(
-        _is_scored(c, card) for c in Category.get_lower_categories()
-    )
+    no_free_lower_categories = all(_is_scored(c, card) for c in LOWER_CATEGORIES)
     return True if no_free_lower_categories else False
 
 
@@ -87,3 +93,85 @@ def _is_scoreable_standard_rules(
         return True
     # Otherwise, roll combination requirements (if any) must be met
     return category in roll
+
+
+def filled_mask(card: "ScorecardLike") -> int:
+    """Mask of the categories card has filled."""
+    scores = card.category_scores
+    mask = 0
+    for i, category in enumerate(CATEGORIES):
+        if scores[category] is not None:
+            mask |= 1 << i
+    return mask
+
+
+def legal_categories(roll: DiceRoll, card: "ScorecardLike", filled: int | None = None) -> int:
+    """Bitmask (bit c.index) of the categories is_combo_scoreable accepts roll in.
+
+    filled is card's filled_mask(), for callers that already have it.
+    """
+    return _legal_mask(roll_index(roll), filled_mask(card) if filled is None else filled)
+
+
+def category_scores_for(
+    roll: DiceRoll, card: "ScorecardLike", filled: int | None = None
+) -> tuple[int | None, ...]:
+    """Points roll would score in each category, in CATEGORIES order.
+
+    Categories the roll cannot be scored in would be zeroed and show 0;
+    filled categories show None. Yahtzee bonuses are not included. filled
+    is as for legal_categories.
+    """
+    if filled is None:
+        filled = filled_mask(card)
+    index = roll_index(roll)
+    legal = _legal_mask(index, filled)
+    scores = _roll_tables()[1][index]
+    return tuple(
+        None if filled >> i & 1 else scores[i] if legal >> i & 1 else 0
+        for i in range(len(CATEGORIES))
+    )
+
+
+def _legal_mask(index: int, filled: int) -> int:
+    fits, _, faces = _roll_tables()
+    open_mask = FULL_MASK & ~filled
+    face = faces[index]
+    if face and filled & Category.YAHTZEE.bit:
+        # Joker rules: the matching upper box first, then lower boxes, then upper boxes
+        matched = Category.from_number(face)
+        if open_mask & matched.bit:
+            return matched.bit
+        return open_mask & LOWER_MASK or open_mask
+    return fits[index] & open_mask
+
+
+_RollTables = tuple[list[int], list[tuple[int, ...]], list[int]]
+
+_built_roll_tables: _RollTables | None = None
+_roll_tables_lock = threading.Lock()
+
+
+def _roll_tables() -> _RollTables:
+    """Per canonical roll: categories it fits, its combo scores and its Yahtzee face (or 0).
+
+    Built once on first use, even across threads, as solver.tables() is.
+    """
+    global _built_roll_tables
+    if _built_roll_tables is None:
+        with _roll_tables_lock:
+            if _built_roll_tables is None:
+                _built_roll_tables = _build_roll_tables()
+    return _built_roll_tables
+
+
+def _build_roll_tables() -> _RollTables:
+    fits = []
+    scores = []
+    faces = []
+    for numbers in CANONICAL_ROLLS:
+        roll = DiceRoll(list(numbers))
+        fits.append(sum(c.bit for c in CATEGORIES if c in roll))
+        scores.append(tuple(calculate_combo_score(c, roll) for c in CATEGORIES))
+        faces.append(numbers[0] if Category.YAHTZEE in roll else 0)
+    return fits, scores, faces
@@ -0,0 +1,191 @@
+# src/yaht/shared_cache.py
+"""Decision cache shared between processes.
+
+SharedDecisionCache stores the same packed keys and decisions as
+DecisionCache, in a fixed-size hash table inside a SharedMemory block, so
+many worker processes fill and read one set of entries instead of each
+building its own.
+
+The table is set associative: a key hashes to a bucket of WAYS slots and
+may sit in any of them. A full bucket evicts by the clock (second chance)
+policy: a hit marks its slot referenced, and the bucket's hand skips and
+clears referenced slots until it reaches one that was not. Each bucket is
+guarded by one of a fixed set of striped locks, and hit and miss counts are
+kept per stripe inside the block, so hit_rate covers every process.
+"""
+
+import multiprocessing
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+
+from yaht.cache import DEFAULT_MAX_SIZE
+
+WAYS = 4
+DEFAULT_STRIPES = 16
+
+_MAX_KEY = (1 << 64) - 2
+_MAX_DECISION = (1 << 32) - 1
+_MIX = 0x9E3779B97F4A7C15
+_MASK_64 = (1 << 64) - 1
+
+
+class SharedDecisionCache:
+    """Fixed-size map from packed keys to packed decisions, shared between processes.
+
+    A drop-in for DecisionCache wherever one is accepted. Keys are ints
+    below 2**64 - 1 and decisions ints below 2**32. Hand the cache to worker
+    processes when starting them, as a Process argument or in a pool's
+    initargs; the striped locks can only be passed on then. The process
+    that built the cache owns the block and should unlink() it when done.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        stripes: int = DEFAULT_STRIPES,
+        context: BaseContext | None = None,
+    ):
+        if max_size < 1:
+            raise ValueError("Cache size must be positive")
+        if stripes < 1:
+            raise ValueError("Stripe count must be positive")
+        context = context or multiprocessing.get_context()
+        buckets = -(-max_size // WAYS)
+        self._locks = [context.Lock() for _ in range(min(stripes, buckets))]
+        self._shm = SharedMemory(create=True, size=_block_size(buckets, len(self._locks)))
+        self._owner = True
+        self._attach(buckets)
+
+    def _attach(self, buckets: int) -> None:
+        """Lay the keys, decisions, counters, referenced flags and hands over the block."""
+        self._buckets = buckets
+        self.max_size = slots = buckets * WAYS
+        buffer = self._shm.buf
+        offset = 0
+        # Keys are stored plus one, so 0 marks an empty slot
+        self._keys = buffer[offset : offset + 8 * slots].cast("Q")
+        offset += 8 * slots
+        self._decisions = buffer[offset : offset + 4 * slots].cast("I")
+        offset += 4 * slots
+        # Hits then misses, per stripe
+        self._counters = buffer[offset : offset + 16 * len(self._locks)].cast("Q")
+        offset += 16 * len(self._locks)
+        self._referenced = buffer[offset : offset + slots]
+        offset += slots
+        self._hands = buffer[offset : offset + buckets]
+
+    def __len__(self) -> int:
+        """Number of stored entries; scans the whole table."""
+        return self.max_size - self._keys.tolist().count(0)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self._shm.name
+
+    def get(self, key: int) -> int | None:
+        """Return the cached decision for key, or None on a miss."""
+        _check_key(key)
+        bucket = self._bucket(key)
+        stripe = bucket % len(self._locks)
+        stored = key + 1
+        keys = self._keys
+        with self._locks[stripe]:
+            for slot in range(bucket * WAYS, (bucket + 1) * WAYS):
+                if keys[slot] == stored:
+                    self._referenced[slot] = 1
+                    self._counters[2 * stripe] += 1
+                    return self._decisions[slot]
+                if not keys[slot]:
+                    break
+            self._counters[2 * stripe + 1] += 1
+            return None
+
+    def put(self, key: int, decision: int) -> None:
+        """Store decision, evicting by the clock policy when key's bucket is full."""
+        _check_key(key)
+        if not 0 <= decision <= _MAX_DECISION:
+            raise ValueError(f"Decision {decision} does not fit in 32 bits")
+        bucket = self._bucket(key)
+        first = bucket * WAYS
+        stored = key + 1
+        keys = self._keys
+        with self._locks[bucket % len(self._locks)]:
+            for slot in range(first, first + WAYS):
+                if keys[slot] == stored or not keys[slot]:
+                    break
+            else:
+                slot = self._evict(bucket)
+            keys[slot] = stored
+            self._decisions[slot] = decision
+            self._referenced[slot] = 0
+
+    @property
+    def hits(self) -> int:
+        return sum(self._counters[0::2])
+
+    @property
+    def misses(self) -> int:
+        return sum(self._counters[1::2])
+
+    @property
+    def hit_rate(self) -> float:
+        hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return hits / lookups if lookups else 0.0
+
+    def close(self) -> None:
+        """Detach this process from the block; the cache is unusable afterwards."""
+        views = (self._keys, self._decisions, self._counters, self._referenced, self._hands)
+        for view in views:
+            view.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the block once every process is done with it; owner only."""
+        if not self._owner:
+            raise RuntimeError("Only the process that built the cache can unlink it")
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedDecisionCache":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __getstate__(self) -> dict:
+        return {"name": self.name, "buckets": self._buckets, "locks": self._locks}
+
+    def __setstate__(self, state: dict) -> None:
+        self._locks = state["locks"]
+        # The owner's resource tracker frees the block, not each worker's
+        self._shm = SharedMemory(state["name"], track=False)
+        self._owner = False
+        self._attach(state["buckets"])
+
+    def _bucket(self, key: int) -> int:
+        # Fibonacci hashing, scaled from the top bits so any bucket count works
+        return (key * _MIX & _MASK_64) * self._buckets >> 64
+
+    def _evict(self, bucket: int) -> int:
+        """Internal: advance bucket's clock hand to an unreferenced slot and return it."""
+        first = bucket * WAYS
+        hand = self._hands[bucket]
+        while self._referenced[first + hand]:
+            self._referenced[first + hand] = 0
+            hand = (hand + 1) % WAYS
+        self._hands[bucket] = (hand + 1) % WAYS
+        return first + hand
+
+
+def _check_key(key: int) -> None:
+    # Keys are stored plus one, so a negative key would match an empty slot
+    if not 0 <= key <= _MAX_KEY:
+        raise ValueError(f"Key {key} does not fit in 64 bits")
+
+
+def _block_size(buckets: int, stripes: int) -> int:
+    slots = buckets * WAYS
+    return 8 * slots + 4 * slots + 16 * stripes + slots + buckets
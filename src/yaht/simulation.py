@@ -0,0 +1,335 @@
+# src/yaht/simulation.py
+import os
+import struct
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from random import Random
+from typing import TYPE_CHECKING
+
+from yaht import snapshot
+from yaht.cache import ALL_POSITIONS, KEEP_ROLLING, roll_positions
+from yaht.category import CATEGORIES, Category
+from yaht.dicetypes import MAX_ROLL_COUNT, DiceCup, DiceRoll, roll_index
+from yaht.exceptions import DiceRollCountError
+from yaht.game import Game, PlayerGameState
+from yaht.player import TurnSteps, is_batch_player, is_generator_player
+from yaht.scorecard import Scorecard
+
+if TYPE_CHECKING:
+    from yaht.player import Player
+
+CHECKPOINT_VERSION = 1
+
+# version, player count, games played
+_CHECKPOINT_HEADER = struct.Struct("<BHQ")
+# score total, sum of squared scores, wins
+_CHECKPOINT_PLAYER = struct.Struct("<QQQ")
+
+
+@dataclass
+class BatchStats:
+    """Running per-player totals for a batch of games, in player order."""
+
+    games: int = 0
+    score_totals: list[int] = field(default_factory=list)
+    score_squares: list[int] = field(default_factory=list)
+    wins: list[int] = field(default_factory=list)
+
+    @classmethod
+    def empty(cls, player_count: int) -> "BatchStats":
+        return cls(0, [0] * player_count, [0] * player_count, [0] * player_count)
+
+    def mean_scores(self) -> list[float]:
+        return [total / self.games if self.games else 0.0 for total in self.score_totals]
+
+    def record(self, scores: list[int]) -> None:
+        """Fold the final scores of one game into the totals."""
+        self.games += 1
+        best = max(scores)
+        for i, score in enumerate(scores):
+            self.score_totals[i] += score
+            self.score_squares[i] += score * score
+            if score == best:
+                self.wins[i] += 1
+
+    def merge(self, other: "BatchStats") -> None:
+        """Fold the totals of another batch between the same players into these."""
+        self.games += other.games
+        for i in range(len(self.wins)):
+            self.score_totals[i] += other.score_totals[i]
+            self.score_squares[i] += other.score_squares[i]
+            self.wins[i] += other.wins[i]
+
+
+def run_games(
+    players: list["Player"],
+    game_count: int,
+    seed: int | None = None,
+    checkpoint_path: str | os.PathLike | None = None,
+    checkpoint_every: int = 1000,
+) -> BatchStats:
+    """Play game_count games between players and return aggregate stats.
+
+    With checkpoint_path set, stats and RNG state are written every
+    checkpoint_every games, and an existing checkpoint is resumed from, so a
+    preempted run continues where it stopped and yields the same result as an
+    uninterrupted one.
+    """
+    stats = BatchStats.empty(len(players))
+    rng = Random(seed)
+
+    if checkpoint_path is not None:
+        data = snapshot.read_checkpoint(checkpoint_path)
+        if data is not None:
+            stats, rng = _load_batch_checkpoint(data, len(players))
+
+    while stats.games < game_count:
+        game = Game(players, rng)
+        game.play_game()
+        stats.record(game.get_scores())
+
+        if checkpoint_path is not None and (
+            stats.games % checkpoint_every == 0 or stats.games == game_count
+        ):
+            snapshot.write_checkpoint(checkpoint_path, _dump_batch_checkpoint(stats, rng))
+
+    return stats
+
+
+def run_games_threaded(
+    players: list["Player"],
+    game_count: int,
+    seed: int | None = None,
+    threads: int | None = None,
+) -> BatchStats:
+    """Play game_count independent games on a thread pool and return aggregate stats.
+
+    Games share the players and the read-only scoring and solver tables, so
+    nothing is pickled or copied per worker; on a free-threaded interpreter
+    the games run in parallel. Players must be safe to call from several
+    threads at once (BasicBotPlayer is, with or without a DecisionCache).
+
+    Game i rolls its own Random seeded from (seed, i), so the result does not
+    depend on the thread count, though it differs from run_games with the
+    same seed.
+    """
+    base_seed = _base_seed(seed)
+    workers = threads or os.cpu_count() or 1
+    chunk = -(-game_count // workers) if game_count else 1
+
+    def play(first: int) -> BatchStats:
+        stats = BatchStats.empty(len(players))
+        for i in range(first, min(first + chunk, game_count)):
+            game = Game(players, _game_rng(base_seed, i), fast_path=True)
+            game.play_game()
+            stats.record(game.get_scores())
+        return stats
+
+    stats = BatchStats.empty(len(players))
+    with ThreadPoolExecutor(workers) as pool:
+        for batch in pool.map(play, range(0, game_count, chunk)):
+            stats.merge(batch)
+    return stats
+
+
+def run_lockstep_games(
+    players: list["Player"], game_count: int, seed: int | None = None
+) -> BatchStats:
+    """Play game_count games turn by turn in lockstep and return aggregate stats.
+
+    At each step every unfinished game plays one turn. Decisions for players
+    implementing BatchPlayer are grouped across games, so each such player
+    gets one choose_rerolls call per roll and one choose_categories call per
+    step, whatever the number of games. Other players take their turns as
+    usual. Games are seeded as in run_games_threaded, so the two runners
+    agree for the same seed.
+    """
+    base_seed = _base_seed(seed)
+    games = [Game(players, _game_rng(base_seed, i), fast_path=True) for i in range(game_count)]
+
+    stats = BatchStats.empty(len(players))
+    while games:
+        batches: dict[int, list[tuple[Game, PlayerGameState]]] = {}
+        for game in games:
+            player = game.current_player
+            game_state = game.begin_turn()
+            if is_batch_player(player):
+                batches.setdefault(id(player), []).append((game, game_state))
+            else:
+                game.end_turn(player.take_turn(game_state))
+
+        for turns in batches.values():
+            _play_batch_turns(turns)
+
+        for game in games:
+            if game.is_over:
+                stats.record(game.get_scores())
+        games = [game for game in games if not game.is_over]
+    return stats
+
+
+def _play_batch_turns(turns: list[tuple[Game, "PlayerGameState"]]) -> None:
+    """Play one turn in each game for the same BatchPlayer, deciding for all games at once."""
+    player = turns[0][0].current_player
+    assert player is not None
+    cards = array("Q", [game.packed_card(player) for game, _ in turns])
+    rolls = [game_state.dice_cup.roll_dice() for _, game_state in turns]
+
+    rolling = list(range(len(turns)))
+    for rolls_left in (2, 1):
+        if not rolling:
+            break
+        decisions = player.choose_rerolls(
+            array("H", [roll_index(rolls[i]) for i in rolling]),
+            array("Q", [cards[i] for i in rolling]),
+            array("B", [rolls_left]) * len(rolling),
+        )
+        still_rolling = []
+        for i, decision in zip(rolling, decisions):
+            positions = decision & ALL_POSITIONS
+            if positions:
+                dice_cup = turns[i][1].dice_cup
+                rolls[i] = dice_cup.roll_dice(roll_positions(rolls[i], positions))
+                if decision & KEEP_ROLLING:
+                    still_rolling.append(i)
+        rolling = still_rolling
+
+    categories = player.choose_categories(array("H", map(roll_index, rolls)), cards)
+    for (game, _), category in zip(turns, categories):
+        game.end_turn(CATEGORIES[category])
+
+
+def run_interleaved_games(
+    players: list["Player"], game_count: int, seed: int | None = None
+) -> BatchStats:
+    """Play game_count games with every GeneratorPlayer turn of a step suspended together.
+
+    At each step every unfinished game begins one turn. The turns of
+    generator players all advance side by side on one thread, and each of
+    their rolls is made for all of them at once with DiceCup.roll_many.
+    Other players take their turns as usual. Generator players' dice come
+    from the scheduler's own generator, so results are reproducible for a
+    seed but differ from the other runners'.
+    """
+    base_seed = _base_seed(seed)
+    dice_cup = DiceCup(Random(f"interleaved:{base_seed}"))
+    games = [Game(players, _game_rng(base_seed, i), fast_path=True) for i in range(game_count)]
+
+    stats = BatchStats.empty(len(players))
+    while games:
+        suspended: list[tuple[Game, TurnSteps]] = []
+        for game in games:
+            player = game.current_player
+            game_state = game.begin_turn()
+            if is_generator_player(player):
+                suspended.append((game, player.turn_steps(game_state.card)))
+            else:
+                game.end_turn(player.take_turn(game_state))
+
+        if suspended:
+            _play_interleaved_turns(dice_cup, suspended)
+
+        for game in games:
+            if game.is_over:
+                stats.record(game.get_scores())
+        games = [game for game in games if not game.is_over]
+    return stats
+
+
+def _play_interleaved_turns(dice_cup: DiceCup, turns: list[tuple[Game, TurnSteps]]) -> None:
+    """Advance suspended turns together, rolling all their dice in one batch per roll."""
+    # Opening keep masks; the first roll is always all five dice
+    decisions: list[int | Category] = [next(steps) for _, steps in turns]
+    if any(isinstance(decision, Category) for decision in decisions):
+        raise ValueError("Player must roll dice at least once during their turn")
+    rows = dice_cup.roll_many(len(turns)).tolist()
+    for rolls_left in range(MAX_ROLL_COUNT - 1, -1, -1):
+        for i, (_, steps) in enumerate(turns):
+            if not isinstance(decisions[i], Category):
+                decisions[i] = steps.send((DiceRoll(rows[i]), rolls_left))
+
+        # Finished turns keep all their dice
+        masks = [ALL_POSITIONS if isinstance(d, Category) else d for d in decisions]
+        if all(isinstance(d, Category) for d in decisions):
+            break
+        if not rolls_left:
+            raise DiceRollCountError()
+        rows = dice_cup.roll_many(len(turns), masks).tolist()
+
+    for (game, steps), category, numbers in zip(turns, decisions, rows):
+        steps.close()
+        assert isinstance(category, Category)
+        game.end_turn(category, DiceRoll(numbers))
+
+
+def play_common_dice_game(
+    player: "Player",
+    seed: int,
+    card: Scorecard | None = None,
+    antithetic: bool = False,
+) -> int:
+    """Play a solo game and return its score, drawing each turn's dice from (seed, turn).
+
+    The generator is reseeded at the start of every turn, so two strategies
+    played with the same seed see the same dice whenever they reroll the same
+    number of dice, however their earlier turns went. With card set, the game
+    continues from that card (which is filled in place). With antithetic set,
+    every die shows 7 minus the face it would otherwise have shown.
+    """
+    rng = AntitheticRandom() if antithetic else Random()
+    players = [player]
+    game = Game(players, rng) if card is None else Game.from_scorecards(players, [card], rng)
+    turn = 0
+    while not game.is_over:
+        rng.seed(seed << 4 | turn)
+        game.play_turn()
+        turn += 1
+    return game.get_scores()[0]
+
+
+class AntitheticRandom(Random):
+    """Random whose randint(a, b) mirrors the base generator's draw to a + b - x."""
+
+    def randint(self, a: int, b: int) -> int:
+        return a + b - super().randint(a, b)
+
+
+def _base_seed(seed: int | None) -> int:
+    return seed if seed is not None else Random().getrandbits(64)
+
+
+def _game_rng(base_seed: int, index: int) -> Random:
+    """Generator for the index-th game of a run seeded with base_seed."""
+    return Random(base_seed << 32 | index)
+
+
+def _dump_batch_checkpoint(stats: BatchStats, rng: Random) -> bytes:
+    parts = [_CHECKPOINT_HEADER.pack(CHECKPOINT_VERSION, len(stats.wins), stats.games)]
+    for total, squares, wins in zip(stats.score_totals, stats.score_squares, stats.wins):
+        parts.append(_CHECKPOINT_PLAYER.pack(total, squares, wins))
+    parts.append(snapshot.pack_rng(rng))
+    return b"".join(parts)
+
+
+def _load_batch_checkpoint(data: bytes, player_count: int) -> tuple[BatchStats, Random]:
+    version, stored_count, games = _CHECKPOINT_HEADER.unpack_from(data)
+    if version != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {version}")
+    if stored_count != player_count:
+        raise ValueError(
+            f"Checkpoint holds {stored_count} players but {player_count} were given"
+        )
+
+    stats = BatchStats.empty(player_count)
+    stats.games = games
+    offset = _CHECKPOINT_HEADER.size
+    for i in range(player_count):
+        total, squares, wins = _CHECKPOINT_PLAYER.unpack_from(data, offset)
+        stats.score_totals[i] = total
+        stats.score_squares[i] = squares
+        stats.wins[i] = wins
+        offset += _CHECKPOINT_PLAYER.size
+
+    rng, _ = snapshot.unpack_rng(memoryview(data)[offset:])
+    return stats, rng
@@ -0,0 +1,97 @@
+# src/yaht/snapshot.py
+"""Compact binary encoding of game state for checkpoint and resume.
+
+All values are little-endian. A scorecard is stored as its 64-bit packed
+form and a dice cup as its 15-bit packed dice plus the roll count (see
+yaht.packing), 11 bytes per player. Generator state is fixed size and
+independent of the number of players.
+"""
+
+import os
+import struct
+from random import Random
+
+from yaht.dicetypes import DiceCup, DiceRoll
+from yaht.packing import pack_card, pack_dice, unpack_card, unpack_dice
+from yaht.scorecard import Scorecard
+
+_SCORECARD = struct.Struct("<Q")
+_DICE_CUP = struct.Struct("<HB")
+_RNG_HEADER = struct.Struct("<iB")
+_RNG_STATE = struct.Struct("<625I")
+_RNG_GAUSS = struct.Struct("<d")
+
+SCORECARD_SIZE = _SCORECARD.size
+DICE_CUP_SIZE = _DICE_CUP.size
+
+
+def pack_scorecard(card: Scorecard) -> bytes:
+    """Encode filled categories, their scores and the Yahtzee bonus count."""
+    return _SCORECARD.pack(pack_card(card))
+
+
+def unpack_scorecard(data: bytes | memoryview) -> Scorecard:
+    """Rebuild a Scorecard from the output of pack_scorecard."""
+    (packed,) = _SCORECARD.unpack(data)
+    return unpack_card(packed)
+
+
+def pack_dice_cup(cup: DiceCup) -> bytes:
+    """Encode the current roll (zero when not yet rolled) and roll count."""
+    roll = cup.current_role
+    return _DICE_CUP.pack(0 if roll is None else pack_dice(roll), cup.roll_count)
+
+
+def unpack_dice_cup(data: bytes | memoryview, rng: Random | None = None) -> DiceCup:
+    """Rebuild a DiceCup from the output of pack_dice_cup."""
+    dice, roll_count = _DICE_CUP.unpack(data)
+    cup = DiceCup(rng)
+    cup._roll_count = roll_count
+    if dice:
+        cup._stored_roll = DiceRoll(unpack_dice(dice))
+    return cup
+
+
+def pack_rng(rng: Random) -> bytes:
+    """Encode the full Mersenne Twister state of rng."""
+    version, internal_state, gauss_next = rng.getstate()
+    data = _RNG_HEADER.pack(version, gauss_next is not None)
+    data += _RNG_STATE.pack(*internal_state)
+    if gauss_next is not None:
+        data += _RNG_GAUSS.pack(gauss_next)
+    return data
+
+
+def unpack_rng(data: bytes | memoryview) -> tuple[Random, int]:
+    """Rebuild a Random from pack_rng output; also returns bytes consumed."""
+    version, has_gauss = _RNG_HEADER.unpack_from(data)
+    offset = _RNG_HEADER.size
+    internal_state = _RNG_STATE.unpack_from(data, offset)
+    offset += _RNG_STATE.size
+    gauss_next = None
+    if has_gauss:
+        (gauss_next,) = _RNG_GAUSS.unpack_from(data, offset)
+        offset += _RNG_GAUSS.size
+
+    rng = Random()
+    rng.setstate((version, internal_state, gauss_next))
+    return rng, offset
+
+
+def write_checkpoint(path: str | os.PathLike, data: bytes) -> None:
+    """Atomically replace the checkpoint at path so a crash never leaves it torn."""
+    temp_path = f"{os.fspath(path)}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def read_checkpoint(path: str | os.PathLike) -> bytes | None:
+    """Return checkpoint contents, or None when no checkpoint has been written."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,344 @@
+# src/yaht/solver.py
+"""Backward-induction solver for optimal solitaire play.
+
+A solitaire state is the set of filled categories (a 13-bit mask in Category
+order), the upper-section subtotal capped at the bonus threshold, and whether
+a 50-point Yahtzee makes further Yahtzees worth a bonus. States are indexed
+as ``mask << 7 | bonus_flag << 6 | upper`` and valued by the expected score
+still to come under optimal play.
+
+Every state with n filled categories depends only on states with n + 1, so
+the solver works one layer at a time from full cards back to the empty card.
+Each layer is split across a process pool whose workers read the finished
+layers from, and write their own slice into, one value array held in shared
+memory.
+"""
+
+import os
+import threading
+from array import array
+from collections import Counter
+from itertools import combinations_with_replacement
+from math import factorial, prod, sumprod
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from operator import itemgetter
+
+from yaht.category import (
+    CATEGORIES,
+    FULL_MASK,
+    LOWER_MASK,
+    UPPER_CATEGORIES,
+    UPPER_MASK,
+    Category,
+)
+from yaht.dicetypes import CANONICAL_ROLLS, DiceRoll, roll_index
+from yaht.scorecard import (
+    UPPER_BONUS_SCORE,
+    UPPER_BONUS_THRESHOLD,
+    YAHTZEE_BONUS_SCORE,
+    ScorecardLike,
+)
+from yaht.scorecheck import calculate_combo_score
+
+STATE_COUNT = (FULL_MASK + 1) << 7
+
+_UPPER_INDICES = tuple(c.index for c in UPPER_CATEGORIES)
+_YAHTZEE_INDEX = Category.YAHTZEE.index
+_YAHTZEE_BIT = Category.YAHTZEE.bit
+
+
+def state_index(mask: int, upper: int, bonus_flag: bool | int) -> int:
+    """Pack a solitaire state into its index in the value array."""
+    return mask << 7 | bonus_flag << 6 | min(upper, UPPER_BONUS_THRESHOLD)
+
+
+def card_state(card: ScorecardLike) -> int:
+    """Return the solitaire state index of a scorecard."""
+    mask = 0
+    upper = 0
+    for i, category in enumerate(CATEGORIES):
+        score = card.category_scores[category]
+        if score is not None:
+            mask |= 1 << i
+            if UPPER_MASK >> i & 1:
+                upper += score
+    return state_index(mask, upper, card.category_scores[Category.YAHTZEE] == 50)
+
+
+class _Tables:
+    """Roll, keep and scoring tables shared by every widget evaluation."""
+
+    def __init__(self):
+        keeps = [k for n in range(5) for k in combinations_with_replacement(range(1, 7), n)]
+
+        # Outcome distribution of each keep that leaves dice to roll
+        self.keep_outcomes: list[tuple[tuple[int, ...], tuple[float, ...]]] = []
+        self.partial_keeps: list[tuple[itemgetter, tuple[float, ...]]] = []
+        for keep in keeps:
+            free = 5 - len(keep)
+            outcomes: Counter[int] = Counter()
+            for added in combinations_with_replacement(range(1, 7), free):
+                ways = factorial(free) // prod(factorial(n) for n in Counter(added).values())
+                outcomes[roll_index(keep + added)] += ways / 6**free
+            indices, probs = zip(*sorted(outcomes.items()))
+            self.keep_outcomes.append((indices, probs))
+            self.partial_keeps.append((itemgetter(*indices), probs))
+        self.first_roll = self.partial_keeps[0]
+
+        # Partial keeps available from each roll (the full keep is the roll itself)
+        keep_positions = {keep: i for i, keep in enumerate(keeps)}
+        self.roll_keeps: list[itemgetter] = []
+        for roll in CANONICAL_ROLLS:
+            subkeeps = {
+                tuple(sorted(roll[i] for i in range(5) if used >> i & 1))
+                for used in range(31)
+            }
+            self.roll_keeps.append(itemgetter(*sorted(keep_positions[k] for k in subkeeps)))
+
+        # Partial keep left by rerolling each set of sorted positions (0 is no reroll)
+        self.reroll_keeps: list[tuple[int, ...]] = [
+            (-1,)
+            + tuple(
+                keep_positions[tuple(roll[i] for i in range(5) if not rerolled >> i & 1)]
+                for rerolled in range(1, 32)
+            )
+            for roll in CANONICAL_ROLLS
+        ]
+
+        # Points each roll earns in each category under the standard rules
+        dice_rolls = [DiceRoll(list(roll)) for roll in CANONICAL_ROLLS]
+        self.scores = [
+            tuple(calculate_combo_score(c, d) if c in d else 0 for c in CATEGORIES)
+            for d in dice_rolls
+        ]
+        self.columns = [tuple(row[c] for row in self.scores) for c in range(len(CATEGORIES))]
+        self.face_counts = [
+            tuple(roll.count(CATEGORIES[c].die_number) for roll in CANONICAL_ROLLS)
+            for c in _UPPER_INDICES
+        ]
+        self.joker_scores = [
+            tuple(calculate_combo_score(c, d) for c in CATEGORIES) for d in dice_rolls
+        ]
+        self.yahtzee_faces = tuple(
+            roll[0] if roll.count(roll[0]) == 5 else 0 for roll in CANONICAL_ROLLS
+        )
+        self.yahtzee_rolls = tuple(r for r, face in enumerate(self.yahtzee_faces) if face)
+
+        # Upper subtotals reachable from each combination of filled upper boxes
+        self.upper_reachable: list[tuple[int, ...]] = []
+        for upper_mask in range(1 << len(_UPPER_INDICES)):
+            totals = {0}
+            for i in _UPPER_INDICES:
+                if upper_mask >> i & 1:
+                    totals = {t + n * (i + 1) for t in totals for n in range(6)}
+            self.upper_reachable.append(
+                tuple(sorted({min(t, UPPER_BONUS_THRESHOLD) for t in totals}))
+            )
+
+
+_built_tables: _Tables | None = None
+_tables_lock = threading.Lock()
+
+
+def tables() -> _Tables:
+    """The shared read-only tables, built once on first use even across threads."""
+    global _built_tables
+    if _built_tables is None:
+        with _tables_lock:
+            if _built_tables is None:
+                _built_tables = _Tables()
+    return _built_tables
+
+
+def score_move(state: int, roll: int, category: int) -> tuple[int, int]:
+    """Return (points, next state) for scoring canonical roll in category.
+
+    Points include the upper-section bonus when this move earns it and any
+    Yahtzee bonus. Rules mirror Game: a category the roll cannot be scored in
+    (including one the joker rules forbid) is zeroed.
+    """
+    mask = state >> 7
+    bonus_flag = state >> 6 & 1
+    upper = state & 63
+    if mask >> category & 1:
+        raise ValueError(f"Category {CATEGORIES[category].name} is already filled")
+
+    t = tables()
+    points = t.scores[roll][category]
+    bonus = 0
+    face = t.yahtzee_faces[roll]
+    if face and mask & _YAHTZEE_BIT:
+        # Joker rules: the matching upper box first, then any lower box at full value
+        matched = face - 1
+        if category == matched:
+            points = 5 * face
+        elif mask >> matched & 1 and LOWER_MASK >> category & 1:
+            points = t.joker_scores[roll][category]
+        else:
+            points = 0
+        if bonus_flag:
+            bonus = YAHTZEE_BONUS_SCORE
+
+    next_upper = upper
+    if UPPER_MASK >> category & 1:
+        next_upper = min(upper + points, UPPER_BONUS_THRESHOLD)
+        if upper < UPPER_BONUS_THRESHOLD <= upper + points:
+            bonus += UPPER_BONUS_SCORE
+    elif category == _YAHTZEE_INDEX and points == 50:
+        bonus_flag = 1
+
+    next_state = (mask | 1 << category) << 7 | bonus_flag << 6 | next_upper
+    return points + bonus, next_state
+
+
+def final_roll_values(values, state: int) -> list[float]:
+    """Value of holding each canonical roll once rolling is over."""
+    t = tables()
+    mask = state >> 7
+    bonus_flag = state >> 6 & 1
+    upper = state & 63
+
+    columns = []
+    for c in range(len(CATEGORIES)):
+        bit = 1 << c
+        if mask & bit:
+            continue
+        next_base = (mask | bit) << 7 | bonus_flag << 6
+        if UPPER_MASK >> c & 1:
+            by_count = []
+            for count in range(6):
+                points = count * (c + 1)
+                if upper < UPPER_BONUS_THRESHOLD <= upper + points:
+                    points += UPPER_BONUS_SCORE
+                next_upper = min(upper + count * (c + 1), UPPER_BONUS_THRESHOLD)
+                by_count.append(points + values[next_base | next_upper])
+            columns.append(list(map(by_count.__getitem__, t.face_counts[c])))
+        else:
+            columns.append(list(map(values[next_base | upper].__add__, t.columns[c])))
+
+    finals = columns[0] if len(columns) == 1 else list(map(max, *columns))
+
+    # Yahtzees may set the bonus flag, trigger joker rules or earn a bonus,
+    # so score them exactly
+    for r in t.yahtzee_rolls:
+        best = float("-inf")
+        for c in range(len(CATEGORIES)):
+            if not mask >> c & 1:
+                points, next_state = score_move(state, r, c)
+                best = max(best, points + values[next_state])
+        finals[r] = best
+    return finals
+
+
+def best_roll_values(roll_values: list[float]) -> list[float]:
+    """Value of each canonical roll with one reroll left, keeping optimally."""
+    t = tables()
+    keep_values = [sumprod(probs, get(roll_values)) for get, probs in t.partial_keeps]
+    return [max(v, *get(keep_values)) for v, get in zip(roll_values, t.roll_keeps)]
+
+
+def state_value(values, state: int) -> float:
+    """Expected remaining score from state, given solved successor states."""
+    get, probs = tables().first_roll
+    second = best_roll_values(best_roll_values(final_roll_values(values, state)))
+    return sumprod(probs, get(second))
+
+
+def layer_states(mask: int) -> list[int]:
+    """Reachable states for a mask of filled categories."""
+    upper_totals = tables().upper_reachable[mask & UPPER_MASK]
+    flags = (0, 1) if mask & _YAHTZEE_BIT else (0,)
+    return [state_index(mask, upper, flag) for flag in flags for upper in upper_totals]
+
+
+def _solve_masks(values, masks: list[int]) -> None:
+    for mask in masks:
+        for state in layer_states(mask):
+            values[state] = state_value(values, state)
+
+
+_worker_memory: SharedMemory | None = None
+_worker_values: memoryview | None = None
+
+
+def _attach_worker(name: str) -> None:
+    global _worker_memory, _worker_values
+    _worker_memory = SharedMemory(name=name, track=False)
+    _worker_values = _worker_memory.buf.cast("d")
+
+
+def _solve_chunk(masks: list[int]) -> int:
+    _solve_masks(_worker_values, masks)
+    return len(masks)
+
+
+class StateValues:
+    """Expected remaining score of every solitaire state under optimal play."""
+
+    def __init__(self, values: array, start_mask: int = 0):
+        self._values = values
+        self.start_mask = start_mask
+
+    def __getitem__(self, state: int) -> float:
+        return self._values[state]
+
+    def value(self, mask: int, upper: int = 0, bonus_flag: bool | int = False) -> float:
+        return self._values[state_index(mask, upper, bonus_flag)]
+
+    @property
+    def expected_score(self) -> float:
+        """Expected final score of optimal play from the starting card."""
+        return self._values[state_index(self.start_mask, 0, False)]
+
+    def save(self, path: str | os.PathLike) -> None:
+        with open(path, "wb") as f:
+            self._values.tofile(f)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, start_mask: int = 0) -> "StateValues":
+        values = array("d")
+        with open(path, "rb") as f:
+            values.fromfile(f, STATE_COUNT)
+        return cls(values, start_mask)
+
+
+def solve(processes: int | None = None, start_mask: int = 0) -> StateValues:
+    """Solve every state whose filled categories include start_mask.
+
+    processes defaults to the CPU count; with processes=1 the layers are
+    solved in this process.
+    """
+    layers: list[list[int]] = [[] for _ in range(len(CATEGORIES) + 1)]
+    for mask in range(FULL_MASK + 1):
+        if mask & start_mask == start_mask:
+            layers[mask.bit_count()].append(mask)
+    # Full cards have nothing left to score and stay at zero
+    pending = [layer for layer in reversed(layers[:-1]) if layer]
+
+    processes = processes or os.cpu_count() or 1
+    tables()  # build once here so forked workers inherit the tables
+
+    memory = SharedMemory(create=True, size=STATE_COUNT * 8)
+    try:
+        shared = memory.buf.cast("d")
+        try:
+            memory.buf[:] = bytes(memory.size)
+            if processes == 1:
+                for masks in pending:
+                    _solve_masks(shared, masks)
+            else:
+                with Pool(processes, _attach_worker, (memory.name,)) as pool:
+                    for masks in pending:
+                        chunk = max(1, len(masks) // (processes * 4))
+                        chunks = [masks[i : i + chunk] for i in range(0, len(masks), chunk)]
+                        pool.map(_solve_chunk, chunks)
+            values = array("d")
+            values.frombytes(memory.buf)
+        finally:
+            shared.release()
+    finally:
+        memory.close()
+        memory.unlink()
+
+    return StateValues(values, start_mask)
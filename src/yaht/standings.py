@@ -0,0 +1,114 @@
+# src/yaht/standings.py
+"""Live leaderboard for games with many players.
+
+Scores are bounded (see MAX_CARD_SCORE), so standings keep a Fenwick tree of
+how many players hold each score. Updating a score and asking for a rank or
+for the score at a rank are all O(log MAX_CARD_SCORE), whatever the number of
+players.
+"""
+
+from typing import TYPE_CHECKING, Iterable
+
+from yaht.scorecard import MAX_CARD_SCORE
+
+if TYPE_CHECKING:
+    from yaht.player import Player
+
+
+class Standings:
+    """Current score and rank of every player in a lobby."""
+
+    def __init__(self, players: Iterable["Player"] = (), max_score: int = MAX_CARD_SCORE):
+        self._max_score = max_score
+        # _tree[i] counts players over a range of scores ending at score i - 1
+        self._tree = [0] * (max_score + 2)
+        self._top_bit = 1 << (max_score + 1).bit_length() - 1
+        self._scores: dict["Player", int] = {}
+        # Players at each score, insertion ordered
+        self._buckets: dict[int, dict["Player", None]] = {}
+        for player in players:
+            self.add(player, 0)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, player: object) -> bool:
+        return player in self._scores
+
+    def add(self, player: "Player", score: int) -> None:
+        if player in self._scores:
+            raise ValueError(f"{player.name} is already in the standings")
+        self._insert(player, score)
+
+    def remove(self, player: "Player") -> None:
+        score = self._scores.pop(player)
+        self._count(score, -1)
+        bucket = self._buckets[score]
+        del bucket[player]
+        if not bucket:
+            del self._buckets[score]
+
+    def update(self, player: "Player", score: int) -> None:
+        """Record player's new score."""
+        if self._scores[player] != score:
+            self._check_score(score)
+            self.remove(player)
+            self._insert(player, score)
+
+    def score(self, player: "Player") -> int:
+        return self._scores[player]
+
+    def rank(self, player: "Player") -> int:
+        """1 plus the number of players with a higher score, so ties share a rank."""
+        return len(self._scores) - self._at_most(self._scores[player]) + 1
+
+    def score_at_rank(self, rank: int) -> int:
+        """Score of the rank-th best player, counting tied players separately."""
+        if not 1 <= rank <= len(self._scores):
+            raise IndexError(f"Rank {rank} out of range for {len(self._scores)} players")
+
+        # Descend to the lowest score with more than (players - rank) at or below it
+        wanted = len(self._scores) - rank + 1
+        position = 0
+        step = self._top_bit
+        while step:
+            following = position + step
+            if following < len(self._tree) and self._tree[following] < wanted:
+                position = following
+                wanted -= self._tree[following]
+            step >>= 1
+        return position
+
+    def leaders(self, count: int) -> list[tuple["Player", int]]:
+        """Top count (player, score) pairs, best first; ties in the order reached."""
+        leaders: list[tuple["Player", int]] = []
+        while len(leaders) < min(count, len(self._scores)):
+            score = self.score_at_rank(len(leaders) + 1)
+            for player in self._buckets[score]:
+                leaders.append((player, score))
+        return leaders[:count]
+
+    def _check_score(self, score: int) -> None:
+        if not 0 <= score <= self._max_score:
+            raise ValueError(f"Score {score} outside 0-{self._max_score}")
+
+    def _insert(self, player: "Player", score: int) -> None:
+        self._check_score(score)
+        self._scores[player] = score
+        self._buckets.setdefault(score, {})[player] = None
+        self._count(score, 1)
+
+    def _count(self, score: int, delta: int) -> None:
+        i = score + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _at_most(self, score: int) -> int:
+        """Number of players with score or less."""
+        total = 0
+        i = score + 1
+        while i:
+            total += self._tree[i]
+            i -= i & -i
+        return total
@@ -0,0 +1,204 @@
+# src/yaht/tracing.py
+"""Opt-in counters and timing around the scorecheck rules.
+
+Tracing swaps is_combo_scoreable, calculate_combo_score, legal_categories and
+the joker-rule check, in scorecheck and in every yaht module that imported them, for
+counting wrappers, and swaps the originals back when it stops. Untraced code
+therefore runs the plain functions with no flag checks.
+
+Use the tracing() context manager, or set the YAHT_TRACE environment
+variable to trace the whole process and print a report to stderr at exit.
+"""
+
+import atexit
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter_ns
+from typing import Callable, Iterator
+
+from yaht import scorecheck
+from yaht.category import CATEGORIES, Category
+
+ENV_VAR = "YAHT_TRACE"
+
+_SCOREABLE = "is_combo_scoreable"
+_SCORE = "calculate_combo_score"
+_JOKER = "_is_scoreable_joker_rules"
+_LEGAL = "legal_categories"
+
+
+@dataclass
+class ScoreTrace:
+    """Counts and timings gathered while tracing; hits are checks that returned True."""
+
+    scoreable_hits: Counter[Category] = field(default_factory=Counter)
+    scoreable_misses: Counter[Category] = field(default_factory=Counter)
+    joker_hits: Counter[Category] = field(default_factory=Counter)
+    joker_misses: Counter[Category] = field(default_factory=Counter)
+    scores: Counter[Category] = field(default_factory=Counter)
+    # Per traced function name
+    calls: Counter[str] = field(default_factory=Counter)
+    nanoseconds: Counter[str] = field(default_factory=Counter)
+    # Guards the counters when traced code runs on several threads
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def report(self) -> str:
+        lines = [
+            f"{'category':<16}{'hits':>10}{'misses':>10}{'joker hit':>11}"
+            f"{'joker miss':>12}{'scored':>10}"
+        ]
+        for category in CATEGORIES:
+            lines.append(
+                f"{category.name:<16}{self.scoreable_hits[category]:>10}"
+                f"{self.scoreable_misses[category]:>10}{self.joker_hits[category]:>11}"
+                f"{self.joker_misses[category]:>12}{self.scores[category]:>10}"
+            )
+        lines.append("")
+        lines.append(f"{'function':<28}{'calls':>10}{'total ms':>12}{'ns/call':>10}")
+        for name, calls in self.calls.items():
+            total = self.nanoseconds[name]
+            lines.append(f"{name:<28}{calls:>10}{total / 1e6:>12.2f}{total // calls:>10}")
+        return "\n".join(lines)
+
+
+_active: ScoreTrace | None = None
+_originals: dict[str, Callable] = {}
+_wrappers: dict[str, Callable] = {}
+
+
+def start() -> ScoreTrace:
+    """Start tracing and return the trace that will collect the counts."""
+    global _active
+    if _active is not None:
+        raise RuntimeError("Scoring is already being traced")
+
+    trace = ScoreTrace()
+    # Build the roll tables untraced, so their scoring is not counted
+    scorecheck._roll_tables()
+    _originals.update(
+        {name: getattr(scorecheck, name) for name in (_SCOREABLE, _SCORE, _JOKER, _LEGAL)}
+    )
+    _wrappers.update(
+        {
+            _SCOREABLE: _trace_scoreable(trace, _originals[_SCOREABLE]),
+            _SCORE: _trace_score(trace, _originals[_SCORE]),
+            _JOKER: _trace_joker(trace, _originals[_JOKER]),
+            _LEGAL: _trace_legal(trace, _originals[_LEGAL]),
+        }
+    )
+    _swap(_originals, _wrappers)
+    _active = trace
+    return trace
+
+
+def stop() -> ScoreTrace:
+    """Stop tracing, restore the original functions and return the finished trace."""
+    global _active
+    if _active is None:
+        raise RuntimeError("Scoring is not being traced")
+
+    # Also catches modules first imported while tracing was on
+    _swap(_wrappers, _originals)
+    trace, _active = _active, None
+    _originals.clear()
+    _wrappers.clear()
+    return trace
+
+
+@contextmanager
+def tracing() -> Iterator[ScoreTrace]:
+    """Trace scoring for the duration of the with block."""
+    trace = start()
+    try:
+        yield trace
+    finally:
+        stop()
+
+
+def start_from_environment() -> None:
+    """Trace the whole process and print the report to stderr at exit."""
+    trace = start()
+    atexit.register(lambda: print(trace.report(), file=sys.stderr))
+
+
+def _swap(current: dict[str, Callable], replacements: dict[str, Callable]) -> None:
+    for module_name, module in list(sys.modules.items()):
+        if module_name != "yaht" and not module_name.startswith("yaht."):
+            continue
+        for name, function in current.items():
+            if getattr(module, name, None) is function:
+                setattr(module, name, replacements[name])
+
+
+def _trace_scoreable(trace: ScoreTrace, original: Callable) -> Callable:
+    @wraps(original)
+    def is_combo_scoreable(category, roll, card, zero_scoreable=False):
+        start_ns = perf_counter_ns()
+        result = original(category, roll, card, zero_scoreable)
+        elapsed = perf_counter_ns() - start_ns
+        with trace.lock:
+            trace.nanoseconds[_SCOREABLE] += elapsed
+            trace.calls[_SCOREABLE] += 1
+            (trace.scoreable_hits if result else trace.scoreable_misses)[category] += 1
+        return result
+
+    return is_combo_scoreable
+
+
+def _trace_score(trace: ScoreTrace, original: Callable) -> Callable:
+    @wraps(original)
+    def calculate_combo_score(category, roll):
+        start_ns = perf_counter_ns()
+        result = original(category, roll)
+        elapsed = perf_counter_ns() - start_ns
+        with trace.lock:
+            trace.nanoseconds[_SCORE] += elapsed
+            trace.calls[_SCORE] += 1
+            trace.scores[category] += 1
+        return result
+
+    return calculate_combo_score
+
+
+def _trace_joker(trace: ScoreTrace, original: Callable) -> Callable:
+    @wraps(original)
+    def _is_scoreable_joker_rules(category, roll, card):
+        start_ns = perf_counter_ns()
+        result = original(category, roll, card)
+        elapsed = perf_counter_ns() - start_ns
+        with trace.lock:
+            trace.nanoseconds[_JOKER] += elapsed
+            trace.calls[_JOKER] += 1
+            (trace.joker_hits if result else trace.joker_misses)[category] += 1
+        return result
+
+    return _is_scoreable_joker_rules
+
+
+def _trace_legal(trace: ScoreTrace, original: Callable) -> Callable:
+    @wraps(original)
+    def legal_categories(roll, card, filled=None):
+        start_ns = perf_counter_ns()
+        result = original(roll, card, filled)
+        elapsed = perf_counter_ns() - start_ns
+        if filled is None:
+            filled = scorecheck.filled_mask(card)
+        joker = Category.YAHTZEE in roll and filled & Category.YAHTZEE.bit
+        with trace.lock:
+            trace.nanoseconds[_LEGAL] += elapsed
+            trace.calls[_LEGAL] += 1
+            # One check per open category, as is_combo_scoreable would count them
+            for category in CATEGORIES:
+                if filled & category.bit:
+                    continue
+                hit = result >> category.index & 1
+                (trace.scoreable_hits if hit else trace.scoreable_misses)[category] += 1
+                if joker:
+                    (trace.joker_hits if hit else trace.joker_misses)[category] += 1
+        return result
+
+    return legal_categories
@@ -0,0 +1,89 @@
+import pickle
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
+
+from yaht.cache import SCORE_STAGE, DecisionCache, decision_key
+from yaht.category import Category
+from yaht.dicetypes import DiceRoll
+from yaht.game import Game
+from yaht.player import BasicBotPlayer
+from yaht.scorecard import Scorecard
+
+
+class TestDecisionCache(unittest.TestCase):
+    def test_hit_and_miss_counts(self):
+        cache = DecisionCache()
+        self.assertIsNone(cache.get(7))
+        cache.put(7, 3)
+        self.assertEqual(cache.get(7), 3)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_evicts_least_recently_used(self):
+        cache = DecisionCache(max_size=2)
+        cache.put(1, 1)
+        cache.put(2, 2)
+        cache.get(1)
+        cache.put(3, 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(1), 1)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            DecisionCache(max_size=0)
+
+    def test_shared_between_threads(self):
+        cache = DecisionCache(max_size=50)
+
+        def lookups(offset: int) -> None:
+            for key in range(offset, offset + 2000):
+                if cache.get(key % 100) is None:
+                    cache.put(key % 100, key)
+
+        with ThreadPoolExecutor(4) as pool:
+            list(pool.map(lookups, range(0, 8000, 2000)))
+        self.assertEqual(cache.hits + cache.misses, 8000)
+        self.assertEqual(len(cache), 50)
+
+    def test_pickles_without_lock(self):
+        cache = DecisionCache()
+        cache.put(1, 2)
+        restored = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(restored.get(1), 2)
+        restored.put(3, 4)
+
+
+class TestDecisionKey(unittest.TestCase):
+    def test_key_ignores_dice_order(self):
+        card = Scorecard()
+        self.assertEqual(
+            decision_key(DiceRoll([6, 1, 2, 2, 3]), card, 2),
+            decision_key(DiceRoll([1, 2, 2, 3, 6]), card, 2),
+        )
+
+    def test_key_distinguishes_card_and_stage(self):
+        card = Scorecard()
+        roll = DiceRoll([5, 5, 5, 5, 5])
+        empty_key = decision_key(roll, card, SCORE_STAGE)
+        self.assertNotEqual(empty_key, decision_key(roll, card, 1))
+
+        card.set_category_score(Category.YAHTZEE, roll)
+        self.assertNotEqual(empty_key, decision_key(roll, card, SCORE_STAGE))
+
+
+class TestCachedBasicBot(unittest.TestCase):
+    def test_cached_games_match_uncached_games(self):
+        cache = DecisionCache()
+        for seed in (1, 2, 3, 1):
+            plain = Game([BasicBotPlayer()], Random(seed))
+            cached = Game([BasicBotPlayer(cache=cache)], Random(seed))
+            plain.play_game()
+            cached.play_game()
+            self.assertEqual(cached.get_detailed_results(), plain.get_detailed_results())
+        self.assertGreater(cache.hits, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from yaht.category import (
+    CATEGORIES,
+    FULL_MASK,
+    LOWER_MASK,
+    UPPER_MASK,
+    Category,
+    Section,
+)
+
+
+class TestCategoryMetadata(unittest.TestCase):
+    def test_index_and_bit_follow_enum_order(self):
+        for position, category in enumerate(Category):
+            self.assertEqual(category.index, position)
+            self.assertEqual(category.bit, 1 << position)
+            self.assertIs(CATEGORIES[category.index], category)
+
+    def test_section_masks(self):
+        self.assertEqual(UPPER_MASK, 0b111111)
+        self.assertEqual(LOWER_MASK & UPPER_MASK, 0)
+        self.assertEqual(LOWER_MASK | UPPER_MASK, FULL_MASK)
+        self.assertTrue(LOWER_MASK & Category.YAHTZEE.bit)
+
+    def test_section_lists(self):
+        self.assertEqual(len(Category.get_upper_categories()), 6)
+        self.assertEqual(len(Category.get_lower_categories()), 7)
+        for category in Category.get_lower_categories():
+            self.assertIs(category.section, Section.LOWER)
+            self.assertIsNone(category.die_number)
+
+    def test_section_lists_are_fresh(self):
+        upper = Category.get_upper_categories()
+        upper.append(Category.CHANCE)
+        self.assertEqual(len(Category.get_upper_categories()), 6)
+        self.assertIsInstance(Category.get_lower_categories(), list)
+
+    def test_from_number(self):
+        self.assertIs(Category.from_number(4), Category.FOURS)
+        self.assertEqual(Category.FOURS.die_number, 4)
+        with self.assertRaises(KeyError):
+            Category.from_number(7)
+
+
+if __name__ == "__main__":
+    unittest.main()
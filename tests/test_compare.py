@@ -0,0 +1,54 @@
+import unittest
+
+from yaht.category import Category
+from yaht.compare import compare, play_pairs
+from yaht.game import PlayerGameState
+from yaht.player import BasicBotPlayer
+from yaht.simulation import play_common_dice_game
+
+
+class FirstOpenPlayer:
+    """Rolls once and fills the first open category."""
+
+    name = "FirstOpen"
+
+    def take_turn(self, state: PlayerGameState) -> Category:
+        state.dice_cup.roll_dice()
+        return state.card.get_unscored_categories()[0]
+
+
+class TestCommonDice(unittest.TestCase):
+    def test_same_seed_same_game(self):
+        bot = BasicBotPlayer()
+        self.assertEqual(play_common_dice_game(bot, 9), play_common_dice_game(bot, 9))
+
+    def test_identical_strategies_never_differ(self):
+        self.assertEqual(play_pairs(BasicBotPlayer(), BasicBotPlayer(), range(20)), [0] * 20)
+
+
+class TestCompare(unittest.TestCase):
+    def test_stops_early_on_clear_difference(self):
+        result = compare(
+            BasicBotPlayer(), FirstOpenPlayer(), min_games=20, batch_size=20, processes=1
+        )
+        self.assertTrue(result.significant)
+        self.assertEqual(result.games, 20)
+        self.assertGreater(result.confidence_interval[0], 0)
+
+    def test_identical_strategies_use_whole_budget(self):
+        result = compare(
+            BasicBotPlayer(), BasicBotPlayer(), max_games=30, batch_size=20, processes=1
+        )
+        self.assertEqual(result.games, 30)
+        self.assertFalse(result.significant)
+        self.assertEqual(result.mean_difference, 0.0)
+
+    def test_process_pool_matches_serial_run(self):
+        kwargs = dict(max_games=60, min_games=60, batch_size=15, seed=3)
+        serial = compare(BasicBotPlayer(), FirstOpenPlayer(), processes=1, **kwargs)
+        pooled = compare(BasicBotPlayer(), FirstOpenPlayer(), processes=2, **kwargs)
+        self.assertEqual(pooled, serial)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 
 # tests/test_dicecup.py
+from random import Random
 from unittest.mock import patch
 
 from yaht.category import Category
@@ -52,6 +53,37 @@ class TestDiceCup(unittest.TestCase):
         self.assertIsNone(DiceCup().current_role)
 
 
+class TestRollMany(unittest.TestCase):
+    def test_shape_and_values(self):
+        dice = DiceCup().roll_many(300)
+        self.assertEqual(dice.shape, (300, 5))
+        self.assertEqual(set(dice.tobytes()), {1, 2, 3, 4, 5, 6})
+
+    def test_seeded_batches_repeat(self):
+        first = DiceCup(Random(8)).roll_many(50)
+        second = DiceCup(Random(8)).roll_many(50)
+        self.assertEqual(first.tolist(), second.tolist())
+
+    def test_keep_masks_reroll_only_unkept_dice(self):
+        cup = DiceCup(Random(2))
+        before = cup.roll_many(200).tolist()
+        after = cup.roll_many(200, [0b00101, 0b11111] * 100).tolist()
+        for row, (old, new) in enumerate(zip(before, after)):
+            kept = (0, 2) if row % 2 == 0 else range(5)
+            for die in kept:
+                self.assertEqual(new[die], old[die])
+        changed = sum(old[1] != new[1] for old, new in zip(before[::2], after[::2]))
+        self.assertGreater(changed, 50)
+
+    def test_keep_masks_need_matching_batch(self):
+        cup = DiceCup()
+        with self.assertRaises(ValueError):
+            cup.roll_many(2, [0, 0])
+        cup.roll_many(2)
+        with self.assertRaises(ValueError):
+            cup.roll_many(3, [0, 0, 0])
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,61 @@
+import unittest
+
+from yaht.category import Category
+from yaht.dicetypes import DiceRoll
+from yaht.differential import (
+    check_games,
+    check_scoring,
+    differential,
+    reference_score,
+    representative_cards,
+    scoring_cases,
+)
+from yaht.packing import unpack_card
+from yaht.scorecheck import calculate_combo_score
+
+
+def joker_blind_score(case):
+    """Scores rolls that fit a category at face value, ignoring joker rules."""
+    packed, numbers, category = case
+    card = unpack_card(packed)
+    roll = DiceRoll(list(numbers))
+    if Category.YAHTZEE in roll and card.category_scores[Category.YAHTZEE] == 50:
+        card.yahtzee_bonus_count += 1
+    fits = category in roll
+    card.category_scores[category] = calculate_combo_score(category, roll) if fits else 0
+    return card.category_scores[category], card.yahtzee_bonus_count, card.get_card_score()
+
+
+class TestDifferential(unittest.TestCase):
+    def test_cards_cover_joker_and_bonus_states(self):
+        cards = [unpack_card(packed) for packed in representative_cards()]
+        yahtzees = {card.category_scores[Category.YAHTZEE] for card in cards}
+        self.assertEqual(yahtzees, {None, 0, 50})
+        self.assertTrue(any(card.get_card_score() >= 63 + 35 for card in cards))
+
+    def test_optimized_scoring_matches_reference(self):
+        for result in check_scoring(representative_cards()[::12]):
+            with self.subTest(result.name):
+                self.assertTrue(result.identical, result.mismatches)
+                self.assertGreater(result.cases, 10_000)
+
+    def test_fast_path_games_match_reference(self):
+        result = check_games(range(8))
+        self.assertTrue(result.identical)
+        self.assertEqual(result.cases, 8)
+
+    def test_catches_joker_rule_bug(self):
+        cards = [
+            packed
+            for packed in representative_cards()
+            if unpack_card(packed).category_scores[Category.YAHTZEE] == 50
+        ]
+        cases = scoring_cases(cards[:3])
+        result = differential("joker blind", cases, reference_score, joker_blind_score)
+        self.assertFalse(result.identical)
+        self.assertLessEqual(len(result.mismatches), result.mismatch_count)
+        self.assertIn("MISMATCHES", result.summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
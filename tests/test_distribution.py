@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+
+from yaht.category import Category
+from yaht.dicetypes import DiceRoll
+from yaht.distribution import MAX_SCORE, DistributionTable, build_distribution_table
+from yaht.policy import OptimalPolicy, turn_outcomes
+from yaht.scorecard import Scorecard
+from yaht.solver import card_state, solve
+
+OPEN = (Category.CHANCE, Category.YAHTZEE)
+
+
+def nearly_full_card() -> Scorecard:
+    card = Scorecard()
+    for category in Category:
+        if category not in OPEN:
+            card.zero_category(category, DiceRoll([1, 2, 3, 4, 6]))
+    card.category_scores[Category.SIXES] = 24
+    return card
+
+
+class TestScoreDistribution(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.card = nearly_full_card()
+        start = card_state(cls.card) >> 7
+        cls.values = solve(processes=1, start_mask=start)
+        cls.policy = OptimalPolicy(cls.values)
+        cls.table = build_distribution_table(cls.policy, start_mask=start)
+
+    def test_turn_outcomes_sum_to_one(self):
+        outcomes = turn_outcomes(self.policy, card_state(self.card))
+        self.assertAlmostEqual(sum(outcomes.values()), 1.0)
+
+    def test_mean_matches_solver_value(self):
+        histogram = self.table.remaining_distribution(self.card)
+        self.assertEqual(len(histogram), MAX_SCORE + 1)
+        self.assertAlmostEqual(sum(histogram), 1.0, places=5)
+        mean = sum(score * p for score, p in enumerate(histogram))
+        self.assertAlmostEqual(mean, self.values[card_state(self.card)], places=3)
+
+    def test_final_distribution_is_shifted_by_current_score(self):
+        remaining = self.table.remaining_distribution(self.card)
+        final = self.table.final_distribution(self.card)
+        self.assertEqual(final[24:], remaining[: MAX_SCORE + 1 - 24])
+        self.assertEqual(sum(final[:29]), 0.0)
+
+    def test_chance_to_beat(self):
+        self.assertAlmostEqual(self.table.chance_to_beat(self.card, 0), 1.0, places=5)
+        self.assertGreater(self.table.chance_to_beat(self.card, 60), 0.0)
+        self.assertEqual(self.table.chance_to_beat(self.card, 24 + 180), 0.0)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "dist.bin")
+            self.table.save(path)
+            loaded = DistributionTable.load(path)
+        self.assertEqual(len(loaded), len(self.table))
+        self.assertEqual(
+            loaded.remaining_distribution(self.card),
+            self.table.remaining_distribution(self.card),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from random import Random
+
+from yaht.category import CATEGORIES, FULL_MASK
+from yaht.dicetypes import DiceRoll
+from yaht.env import ACTION_COUNT, CATEGORY_ACTION, VectorEnv
+from yaht.scorecard import Scorecard
+
+
+def _random_legal(rng, legal):
+    return rng.choice([a for a in range(ACTION_COUNT) if legal >> a & 1])
+
+
+class TestVectorEnv(unittest.TestCase):
+    def setUp(self):
+        self.env = VectorEnv(4, seed=1)
+        self.observation = self.env.reset()
+
+    def test_reset(self):
+        self.assertEqual(len(self.observation.dice), 20)
+        self.assertTrue(all(1 <= die <= 6 for die in self.observation.dice))
+        self.assertEqual(list(self.observation.rolls_left), [2] * 4)
+        self.assertEqual(list(self.observation.filled_mask), [0] * 4)
+        for legal in self.env.legal_actions:
+            self.assertEqual(legal >> CATEGORY_ACTION, FULL_MASK)
+            self.assertFalse(legal >> 31 & 1)
+            self.assertTrue(legal & 1)
+
+    def test_keep_mask_rerolls_other_dice(self):
+        before = list(self.observation.dice)
+        self.env.step([0b11110, 0b00001, CATEGORY_ACTION, 0])
+        dice = self.observation.dice
+        self.assertEqual(list(dice[1:5]), before[1:5])
+        self.assertEqual(dice[5], before[5])
+        self.assertEqual(list(self.observation.rolls_left), [1, 1, 2, 1])
+        self.assertEqual(self.observation.filled_mask[2], 1)
+
+    def test_no_rerolls_once_out_of_rolls(self):
+        self.env.step([0] * 4)
+        self.env.step([0] * 4)
+        self.assertEqual(list(self.observation.rolls_left), [0] * 4)
+        for legal in self.env.legal_actions:
+            self.assertEqual(legal, FULL_MASK << CATEGORY_ACTION)
+        with self.assertRaises(ValueError):
+            self.env.step([0] + [CATEGORY_ACTION] * 3)
+
+    def test_filled_category_is_illegal(self):
+        self.env.step([CATEGORY_ACTION] * 4)
+        with self.assertRaises(ValueError):
+            self.env.step([CATEGORY_ACTION] * 4)
+        with self.assertRaises(ValueError):
+            self.env.step([CATEGORY_ACTION + 1] * 3)
+
+    def test_rewards_follow_scorecard_rules(self):
+        env = VectorEnv(8, seed=4)
+        observation = env.reset()
+        rng = Random(2)
+        cards = [Scorecard() for _ in range(env.n)]
+        finished = 0
+        while finished < env.n:
+            actions = [_random_legal(rng, legal) for legal in env.legal_actions]
+            dice = list(observation.dice)
+            _, rewards, dones = env.step(actions)
+            for i, action in enumerate(actions):
+                if action < CATEGORY_ACTION:
+                    continue
+                card = cards[i]
+                before = card.get_card_score()
+                roll = DiceRoll(dice[5 * i : 5 * i + 5])
+                card.score_category(CATEGORIES[action - CATEGORY_ACTION], roll)
+                self.assertEqual(rewards[i], card.get_card_score() - before)
+                if dones[i]:
+                    self.assertFalse(card.get_unscored_categories())
+                    self.assertEqual(env.scores[i], 0)
+                    cards[i] = Scorecard()
+                    finished += 1
+                else:
+                    self.assertEqual(env.scores[i], card.get_card_score())
+
+    def test_same_seed_same_dice(self):
+        other = VectorEnv(4, seed=1)
+        self.assertEqual(other.reset().dice, self.observation.dice)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from random import Random
+
+from yaht.category import Category
+from yaht.dicetypes import DiceRoll
+from yaht.equity import estimate, rollout_pairs
+from yaht.game import Game
+from yaht.packing import pack_card
+from yaht.player import BasicBotPlayer
+from yaht.scorecard import Scorecard
+from yaht.simulation import AntitheticRandom
+
+
+def late_card() -> Scorecard:
+    """A card with only YAHTZEE and CHANCE open."""
+    card = Scorecard()
+    for category in Category:
+        if category not in (Category.YAHTZEE, Category.CHANCE):
+            card.zero_category(category, DiceRoll([1, 2, 3, 4, 6]))
+    return card
+
+
+class TestAntitheticDice(unittest.TestCase):
+    def test_faces_mirror_base_generator(self):
+        base, mirrored = Random(4), AntitheticRandom(4)
+        for _ in range(50):
+            self.assertEqual(mirrored.randint(1, 6), 7 - base.randint(1, 6))
+
+    def test_pair_games_start_from_card(self):
+        pairs = rollout_pairs(BasicBotPlayer(), pack_card(late_card()), range(10))
+        for score, mirrored in pairs:
+            self.assertLessEqual(score, 80)
+            self.assertLessEqual(mirrored, 80)
+
+
+class TestFromScorecards(unittest.TestCase):
+    def test_full_cards_are_already_over(self):
+        card = late_card()
+        card.zero_category(Category.YAHTZEE, DiceRoll([1, 2, 3, 4, 6]))
+        card.zero_category(Category.CHANCE, DiceRoll([1, 2, 3, 4, 6]))
+        self.assertTrue(Game.from_scorecards([BasicBotPlayer()], [card]).is_over)
+
+    def test_card_count_must_match_players(self):
+        with self.assertRaises(ValueError):
+            Game.from_scorecards([BasicBotPlayer()], [Scorecard(), Scorecard()])
+
+
+class TestEstimate(unittest.TestCase):
+    def test_same_seed_same_estimate(self):
+        first = estimate([late_card()], BasicBotPlayer(), 20, processes=1, seed=5)
+        second = estimate([late_card()], BasicBotPlayer(), 20, processes=1, seed=5)
+        self.assertEqual(first, second)
+        self.assertEqual(first[0].rollouts, 20)
+
+    def test_exact_control_removes_all_error_for_baseline_policy(self):
+        (equity,) = estimate(
+            [late_card()], BasicBotPlayer(), 20, baseline_means=[21.5], processes=1
+        )
+        self.assertAlmostEqual(equity.mean, 21.5)
+        self.assertAlmostEqual(equity.control_coefficient, 1.0)
+        self.assertAlmostEqual(equity.standard_error, 0.0)
+        self.assertGreater(equity.variance, 0.0)
+
+    def test_process_pool_matches_serial_run(self):
+        cards = [Scorecard(), late_card()]
+        kwargs = dict(n=8, baseline_rollouts=8, batch_size=3, seed=2)
+        serial = estimate(cards, BasicBotPlayer(), processes=1, **kwargs)
+        pooled = estimate(cards, BasicBotPlayer(), processes=2, **kwargs)
+        self.assertEqual(pooled, serial)
+
+    def test_rejects_too_few_rollouts(self):
+        with self.assertRaises(ValueError):
+            estimate([late_card()], BasicBotPlayer(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
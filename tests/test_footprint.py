@@ -0,0 +1,58 @@
+import sys
+import unittest
+from random import Random
+
+from yaht.footprint import deep_sizeof, game_footprint
+from yaht.game import Game
+from yaht.player import BasicBotPlayer
+from yaht.scorecard import Scorecard
+
+GAME_BUDGET = 2048
+
+
+class TestDeepSizeof(unittest.TestCase):
+    def test_counts_shared_objects_once(self):
+        item = bytearray(100)
+        pair = [item, item]
+        self.assertEqual(deep_sizeof(pair), sys.getsizeof(pair) + sys.getsizeof(item))
+        self.assertEqual(deep_sizeof(pair, exclude=[item]), sys.getsizeof(pair))
+
+    def test_skips_interned_values(self):
+        values = [None, True, 7, ()]
+        self.assertEqual(deep_sizeof(values), sys.getsizeof(values))
+
+
+class TestGameFootprint(unittest.TestCase):
+    def setUp(self):
+        self.players = [BasicBotPlayer(f"Bot{i}") for i in range(4)]
+
+    def test_finished_four_player_game_within_budget(self):
+        for fast_path in (False, True):
+            game = Game(self.players, Random(2), fast_path=fast_path)
+            game.play_game()
+            self.assertLess(game_footprint(game), GAME_BUDGET)
+
+    def test_game_with_its_own_generator_within_budget(self):
+        game = Game(self.players)
+        game.play_game()
+        self.assertLess(game_footprint(game), GAME_BUDGET)
+        restored = Game.restore(self.players, game.snapshot())
+        self.assertLess(game_footprint(restored), GAME_BUDGET)
+        self.assertEqual(restored.snapshot(), game.snapshot())
+
+    def test_counts_generator_the_game_made(self):
+        game = Game(self.players)
+        self.assertGreater(game_footprint(game), game_footprint(Game(self.players, Random(2))))
+
+    def test_game_in_progress_within_budget(self):
+        game = Game(self.players, Random(2))
+        for _ in range(21):
+            game.play_turn()
+        self.assertLess(game_footprint(game), GAME_BUDGET + 1024)
+
+    def test_scorecard_is_compact(self):
+        self.assertLess(deep_sizeof(Scorecard()), 256)
+
+
+if __name__ == "__main__":
+    unittest.main()
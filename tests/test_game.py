@@ -0,0 +1,200 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
+
+from yaht.category import Category
+from yaht.game import Game
+from yaht.player import BasicBotPlayer, SpeculativePlayer
+from yaht.scorecard import Scorecard
+
+
+class TestFastPath(unittest.TestCase):
+    def setUp(self):
+        self.players = [BasicBotPlayer("A"), BasicBotPlayer("B")]
+
+    def play(self, seed: int, fast_path: bool) -> Game:
+        game = Game(self.players, Random(seed), fast_path=fast_path)
+        game.play_game()
+        return game
+
+    def test_matches_reference_engine(self):
+        for seed in range(25):
+            with self.subTest(seed=seed):
+                reference = self.play(seed, fast_path=False)
+                fast = self.play(seed, fast_path=True)
+                self.assertEqual(fast.snapshot(), reference.snapshot())
+                self.assertEqual(fast.get_detailed_results(), reference.get_detailed_results())
+
+    def test_reuses_turn_state(self):
+        game = Game(self.players, Random(1), fast_path=True)
+        game.play_turn()
+        game.play_turn()
+        state = game._turn_states[self.players[0]]
+        cup = state.dice_cup
+        game.play_turn()
+        self.assertIs(game._turn_states[self.players[0]], state)
+        self.assertIs(state.dice_cup, cup)
+        self.assertEqual(
+            state.card.category_scores, game._scorecards[self.players[0]].category_scores
+        )
+
+    def test_view_writes_do_not_reach_the_card(self):
+        game = Game(self.players, Random(1), fast_path=True)
+        state = game.begin_turn()
+        state.card.category_scores[Category.CHANCE] = 30
+        card = game._scorecards[self.players[0]]
+        self.assertIsNone(card.category_scores[Category.CHANCE])
+        self.assertIsNot(state.card.category_scores, card.category_scores)
+
+    def test_restored_game_continues_identically(self):
+        reference = Game(self.players, Random(7))
+        for _ in range(9):
+            reference.play_turn()
+        fast = Game.restore(self.players, reference.snapshot(), fast_path=True)
+        reference.play_game()
+        fast.play_game()
+        self.assertEqual(fast.snapshot(), reference.snapshot())
+
+
+class TestTurnTracking(unittest.TestCase):
+    def setUp(self):
+        self.players = [BasicBotPlayer("A"), BasicBotPlayer("B"), BasicBotPlayer("C")]
+        self.game = Game(self.players, Random(3))
+
+    def test_counts_turns_and_rounds(self):
+        self.assertEqual(self.game.remaining_turns, 39)
+        for _ in range(4):
+            self.game.play_turn()
+        self.assertIs(self.game.current_player, self.players[1])
+        self.assertEqual(self.game.round_number, 2)
+        self.assertEqual(self.game.turns_played, 4)
+        self.assertEqual(self.game.remaining_turns, 35)
+
+        self.game.play_game()
+        self.assertEqual(self.game.turns_played, 39)
+        self.assertIsNone(self.game.current_player)
+        self.assertEqual(self.game.round_number, 14)
+
+    def test_eliminated_player_is_skipped(self):
+        self.game.play_turn()
+        self.game.eliminate_player(self.players[1])
+        self.assertIs(self.game.current_player, self.players[2])
+        self.assertEqual(self.game.remaining_turns, 25)
+
+        self.game.play_game()
+        self.assertEqual(self.game.turns_played, 26)
+        self.assertEqual(self.game.active_players, [self.players[0], self.players[2]])
+        self.assertNotIn(self.players[1], self.game.winning_players)
+
+        summary = self.game.get_game_summary().splitlines()
+        self.assertEqual(summary[-3], f"-  B: {self.game.get_scores()[1]} points (eliminated)")
+        self.assertTrue(summary[1].startswith("1. "))
+        self.assertNotIn("B:", summary[1] + summary[2])
+
+    def test_eliminating_current_player_passes_turn(self):
+        self.game.eliminate_player(self.players[0])
+        self.assertIs(self.game.current_player, self.players[1])
+        self.game.eliminate_player(self.players[1])
+        self.game.eliminate_player(self.players[2])
+        self.assertTrue(self.game.is_over)
+        self.assertEqual(self.game.winning_players, [])
+        summary = self.game.get_game_summary()
+        self.assertTrue(summary.endswith("No winner: every player was eliminated."))
+        self.assertNotIn("Tie between", summary)
+
+    def test_snapshot_keeps_eliminated_players(self):
+        self.game.play_turn()
+        self.game.eliminate_player(self.players[2])
+        restored = Game.restore(self.players, self.game.snapshot())
+        self.assertEqual(restored.active_players, self.players[:2])
+        self.assertEqual(restored.remaining_turns, self.game.remaining_turns)
+        self.game.play_game()
+        restored.play_game()
+        self.assertEqual(restored.snapshot(), self.game.snapshot())
+
+
+class TestSplitTurns(unittest.TestCase):
+    def test_end_turn_needs_begun_turn(self):
+        game = Game([BasicBotPlayer()], Random(1))
+        with self.assertRaises(ValueError):
+            game.end_turn(Category.CHANCE)
+
+    def test_end_turn_needs_a_roll(self):
+        game = Game([BasicBotPlayer()], Random(1))
+        game.begin_turn()
+        with self.assertRaises(ValueError):
+            game.end_turn(Category.CHANCE)
+
+    def test_split_turn_matches_play_turn(self):
+        players = [BasicBotPlayer("A"), BasicBotPlayer("B")]
+        for fast_path in (False, True):
+            split = Game(players, Random(4), fast_path=fast_path)
+            whole = Game(players, Random(4), fast_path=fast_path)
+            while not split.is_over:
+                player = split.current_player
+                split.end_turn(player.take_turn(split.begin_turn()))
+                whole.play_turn()
+            self.assertTrue(whole.is_over)
+            self.assertEqual(split.snapshot(), whole.snapshot())
+
+
+class CountingBot(BasicBotPlayer):
+    """BasicBot counting the reroll decisions it is asked for."""
+
+    def __init__(self, name: str = "Counting"):
+        super().__init__(name)
+        self.reroll_calls = 0
+
+    def choose_reroll(self, roll, card, rolls_left):
+        self.reroll_calls += 1
+        return super().choose_reroll(roll, card, rolls_left)
+
+
+class TestSpeculativePlayer(unittest.TestCase):
+    def test_matches_unprepared_player(self):
+        with ThreadPoolExecutor(2) as executor:
+            for fast_path in (False, True):
+                with self.subTest(fast_path=fast_path):
+                    speculative = [
+                        SpeculativePlayer(BasicBotPlayer("A"), executor),
+                        SpeculativePlayer(BasicBotPlayer("B"), executor),
+                    ]
+                    plain = [BasicBotPlayer("A"), BasicBotPlayer("B")]
+                    games = []
+                    for players in (speculative, plain):
+                        games.append(Game(players, Random(12), fast_path=fast_path))
+                        games[-1].play_game()
+                    self.assertEqual(games[0].snapshot(), games[1].snapshot())
+
+    def test_opening_decision_comes_from_prepared_cache(self):
+        bot = CountingBot()
+        player = SpeculativePlayer(bot)
+        game = Game([BasicBotPlayer("Other"), player], Random(3))
+        game.play_turn()
+        prepared = bot.reroll_calls
+        self.assertEqual(prepared, 252)
+
+        player.take_turn(game.begin_turn())
+        # Only the second reroll, if any, is decided during the turn
+        self.assertLessEqual(bot.reroll_calls - prepared, 1)
+
+    def test_stale_preparation_is_not_used(self):
+        bot = CountingBot()
+        player = SpeculativePlayer(bot)
+        player.prepare_turn(Scorecard().view)
+        card = Scorecard()
+        card.category_scores[Category.CHANCE] = 20
+        game = Game.from_scorecards([player], [card], Random(5))
+        prepared = bot.reroll_calls
+        game.play_turn()
+        self.assertGreater(bot.reroll_calls, prepared)
+
+    def test_prepares_after_own_turn(self):
+        bot = CountingBot()
+        game = Game([SpeculativePlayer(bot)], Random(8))
+        game.play_turn()
+        self.assertGreaterEqual(bot.reroll_calls, 252)
+
+
+if __name__ == "__main__":
+    unittest.main()
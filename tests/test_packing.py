@@ -0,0 +1,78 @@
+import unittest
+
+from yaht.category import Category
+from yaht.dicetypes import CANONICAL_ROLLS, DiceRoll, roll_index
+from yaht.packing import (
+    FULL_MASK,
+    pack_card,
+    pack_categories,
+    pack_dice,
+    roll_from_index,
+    solver_state,
+    unpack_card,
+    unpack_categories,
+    unpack_dice,
+)
+from yaht.scorecard import Scorecard
+from yaht.solver import card_state
+
+
+class TestDicePacking(unittest.TestCase):
+    def test_dice_round_trip_keeps_order(self):
+        packed = pack_dice([6, 1, 5, 2, 4])
+        self.assertLess(packed, 1 << 15)
+        self.assertEqual(unpack_dice(packed), [6, 1, 5, 2, 4])
+
+    def test_canonical_index_round_trip(self):
+        self.assertEqual(len(CANONICAL_ROLLS), 252)
+        for index in (0, 100, 251):
+            self.assertEqual(roll_index(roll_from_index(index)), index)
+        self.assertEqual(roll_index([3, 1, 1, 2, 3]), roll_index([1, 1, 2, 3, 3]))
+
+
+class TestCategoryPacking(unittest.TestCase):
+    def test_mask_round_trip(self):
+        categories = [Category.ACES, Category.YAHTZEE, Category.CHANCE]
+        mask = pack_categories(categories)
+        self.assertEqual(mask, 1 | 1 << 11 | 1 << 12)
+        self.assertEqual(unpack_categories(mask), categories)
+        self.assertEqual(pack_categories(Category), FULL_MASK)
+
+
+class TestCardPacking(unittest.TestCase):
+    def test_full_card_round_trip(self):
+        card = Scorecard()
+        card.set_category_score(Category.YAHTZEE, DiceRoll([6, 6, 6, 6, 6]))
+        card.set_category_score(Category.SIXES, DiceRoll([6, 6, 6, 6, 6]))
+        card.set_category_score(Category.CHANCE, DiceRoll([6, 6, 6, 6, 6]))
+        card.set_category_score(Category.FULL_HOUSE, DiceRoll([2, 2, 3, 3, 3]))
+        card.set_category_score(Category.THREE_OF_A_KIND, DiceRoll([4, 4, 4, 5, 6]))
+        card.zero_category(Category.LARGE_STRAIGHT, DiceRoll([1, 1, 2, 3, 4]))
+        card.set_category_score(Category.TWOS, DiceRoll([2, 2, 1, 3, 4]))
+
+        packed = pack_card(card)
+        self.assertLess(packed, 1 << 64)
+        restored = unpack_card(packed)
+        self.assertEqual(restored.category_scores, card.category_scores)
+        self.assertEqual(restored.yahtzee_bonus_count, 2)
+        self.assertEqual(restored.get_card_score(), card.get_card_score())
+
+    def test_empty_card_packs_to_zero(self):
+        self.assertEqual(pack_card(Scorecard()), 0)
+
+    def test_unrepresentable_score_rejected(self):
+        card = Scorecard()
+        card.category_scores[Category.FOURS] = 7
+        with self.assertRaises(ValueError):
+            pack_card(card)
+
+    def test_solver_state_matches_card_state(self):
+        card = Scorecard()
+        card.set_category_score(Category.YAHTZEE, DiceRoll([5, 5, 5, 5, 5]))
+        card.set_category_score(Category.FIVES, DiceRoll([5, 5, 5, 5, 5]))
+        card.set_category_score(Category.SIXES, DiceRoll([6, 6, 6, 6, 6]))
+        self.assertEqual(solver_state(pack_card(card)), card_state(card))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from statistics import fmean, variance
+
+from yaht.cache import KEEP_ROLLING
+from yaht.category import Category
+from yaht.dicetypes import DiceRoll, roll_index
+from yaht.distribution import build_distribution_table
+from yaht.player import BasicBotPlayer
+from yaht.policy import OptimalPolicy, PlayerPolicy, evaluate_policy
+from yaht.scorecard import Scorecard
+from yaht.simulation import play_common_dice_game
+from yaht.solver import card_state, solve
+
+OPEN = (Category.SIXES, Category.CHANCE, Category.YAHTZEE)
+
+
+def late_card() -> Scorecard:
+    card = Scorecard()
+    for category in Category:
+        if category not in OPEN:
+            card.zero_category(category, DiceRoll([1, 2, 3, 4, 6]))
+    card.category_scores[Category.FIVES] = 20
+    return card
+
+
+def _moments(histogram: list[float]) -> tuple[float, float]:
+    mean = sum(score * p for score, p in enumerate(histogram))
+    return mean, sum((score - mean) ** 2 * p for score, p in enumerate(histogram))
+
+
+class TestEvaluatePolicy(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.card = late_card()
+        cls.state = card_state(cls.card)
+        cls.values = solve(processes=1, start_mask=cls.state >> 7)
+
+    def test_optimal_policy_matches_solver(self):
+        evaluation = evaluate_policy(OptimalPolicy(self.values), self.state)
+        self.assertAlmostEqual(evaluation.mean, self.values[self.state], places=6)
+        self.assertGreater(evaluation.variance, 0.0)
+
+    def test_basic_bot_matches_distribution(self):
+        policy = PlayerPolicy(BasicBotPlayer())
+        evaluation = evaluate_policy(policy, self.state)
+        table = build_distribution_table(policy, start_mask=self.state >> 7)
+        mean, var = _moments(table.remaining_distribution(self.card))
+        self.assertAlmostEqual(evaluation.mean, mean, places=3)
+        self.assertAlmostEqual(evaluation.variance, var, places=1)
+        self.assertLess(evaluation.mean, self.values[self.state])
+
+    def test_basic_bot_matches_simulation(self):
+        evaluation = evaluate_policy(PlayerPolicy(BasicBotPlayer()), self.state)
+        start = self.card.get_card_score()
+        remaining = [
+            play_common_dice_game(BasicBotPlayer(), seed, late_card()) - start
+            for seed in range(2000)
+        ]
+        error = (variance(remaining) / len(remaining)) ** 0.5
+        self.assertAlmostEqual(fmean(remaining), evaluation.mean, delta=4 * error)
+        self.assertAlmostEqual(
+            variance(remaining), evaluation.variance, delta=0.2 * evaluation.variance
+        )
+
+    def test_player_policy_makes_the_players_decisions(self):
+        bot = BasicBotPlayer()
+        policy = PlayerPolicy(bot)
+        for numbers in ([2, 5, 5, 5, 6], [3, 3, 6, 6, 6], [1, 1, 2, 4, 4]):
+            roll = DiceRoll(numbers)
+            indices, keep_rolling = bot.choose_reroll(roll, self.card.view, 2)
+            decision = policy.choose_reroll(self.state, roll_index(numbers), 2)
+            self.assertEqual(decision & 0b11111, sum(1 << i for i in indices))
+            self.assertEqual(bool(decision & KEEP_ROLLING), keep_rolling)
+            self.assertEqual(
+                policy.choose_category(self.state, roll_index(numbers)),
+                bot.choose_category(roll, self.card.view).index,
+            )
+
+    def test_full_card(self):
+        card = Scorecard()
+        for category in Category:
+            card.zero_category(category, DiceRoll([1, 2, 3, 4, 6]))
+        evaluation = evaluate_policy(PlayerPolicy(BasicBotPlayer()), card_state(card))
+        self.assertEqual((evaluation.mean, evaluation.variance), (0.0, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
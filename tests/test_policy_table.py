@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+
+from yaht.cache import KEEP_ROLLING
+from yaht.category import FULL_MASK, Category
+from yaht.dicetypes import DiceRoll
+from yaht.packing import pack_card, unpack_card
+from yaht.policy import OptimalPolicy
+from yaht.policy_table import PolicyTable, PolicyTablePlayer, write_policy_table
+from yaht.scorecard import Scorecard
+from yaht.simulation import play_common_dice_game
+from yaht.solver import card_state, layer_states, solve
+
+OPEN = (Category.SIXES, Category.FULL_HOUSE, Category.YAHTZEE)
+
+
+def late_card() -> Scorecard:
+    card = Scorecard()
+    for category in Category:
+        if category not in OPEN:
+            card.zero_category(category, DiceRoll([1, 2, 3, 4, 6]))
+    return card
+
+
+class TestPolicyTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "policy.tbl")
+        cls.start = card_state(late_card()) >> 7
+        cls.policy = OptimalPolicy(solve(processes=1, start_mask=cls.start))
+        write_policy_table(cls.path, cls.policy, cls.start)
+        cls.table = PolicyTable(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.table.close()
+        cls.tmp.cleanup()
+
+    def test_decisions_match_policy(self):
+        masks = (self.start, self.start | Category.SIXES.bit)
+        states = [state for mask in masks for state in layer_states(mask)]
+        for state in states:
+            for roll in range(0, 252, 5):
+                self.assertEqual(
+                    self.table.choose_reroll(state, roll, 2),
+                    self.policy.choose_reroll(state, roll, 2),
+                )
+                self.assertEqual(
+                    self.table.choose_reroll(state, roll, 1),
+                    self.policy.choose_reroll(state, roll, 1) & 0b11111 | KEEP_ROLLING,
+                )
+                self.assertEqual(
+                    self.table.choose_category(state, roll),
+                    self.policy.choose_category(state, roll),
+                )
+
+    def test_smaller_than_raw_decisions(self):
+        masks = [m for m in range(FULL_MASK) if m & self.start == self.start]
+        self.assertEqual(len(self.table), sum(len(layer_states(m)) for m in masks))
+        self.assertLess(os.path.getsize(self.path), len(self.table) * 252)
+
+    def test_unknown_state(self):
+        self.assertNotIn(0, self.table)
+        with self.assertRaises(KeyError):
+            self.table.choose_category(0, 0)
+
+    def test_player_finishes_game(self):
+        player = PolicyTablePlayer(self.table)
+        packed = pack_card(late_card())
+        scores = [
+            play_common_dice_game(player, seed, unpack_card(packed)) for seed in range(30)
+        ]
+        self.assertGreater(sum(scores) / len(scores), 25)
+
+    def test_rejects_other_files(self):
+        other = os.path.join(self.tmp.name, "other.bin")
+        with open(other, "wb") as f:
+            f.write(bytes(64))
+        with self.assertRaises(ValueError):
+            PolicyTable(other)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,9 +7,10 @@ from yaht.exceptions import (
     CategoryAlreadyScored,
     DiceCountError,
     DieValueError,
+    HistoryEmptyError,
     InvalidCategoryError,
 )
-from yaht.scorecard import Scorecard
+from yaht.scorecard import CategoryScores, Scorecard
 from yaht.scorecheck import calculate_combo_score, is_combo_scoreable
 
 
@@ -90,6 +91,85 @@ class TestBonuses(BaseScorecardTest):
         with self.assertRaises(CategoryAlreadyScored):
             self.card.zero_category(Category.CHANCE, DiceRoll([1, 2, 3, 4, 5]))
 
+    def test_score_category_scores_or_zeroes(self):
+        self.card.score_category(Category.YAHTZEE, DiceRoll([4, 4, 4, 4, 4]))
+        self.card.score_category(Category.FULL_HOUSE, DiceRoll([1, 2, 3, 4, 5]))
+        # Joker roll forced into its upper box, then a bonus-earning zero
+        self.card.score_category(Category.FOURS, DiceRoll([4, 4, 4, 4, 4]))
+        self.card.score_category(Category.SIXES, DiceRoll([2, 2, 2, 2, 2]))
+        self.assertEqual(self.card.category_scores[Category.FULL_HOUSE], 0)
+        self.assertEqual(self.card.category_scores[Category.FOURS], 20)
+        self.assertEqual(self.card.category_scores[Category.SIXES], 0)
+        self.assertEqual(self.card.yahtzee_bonus_count, 2)
+
+        with self.assertRaises(CategoryAlreadyScored):
+            self.card.score_category(Category.SIXES, DiceRoll([6, 6, 6, 1, 2]))
+
+
+class TestUndoRedo(BaseScorecardTest):
+    def test_undo_restores_scores_and_bonus(self):
+        self.card.apply(Category.YAHTZEE, DiceRoll([5, 5, 5, 5, 5]))
+        before = (dict(self.card.category_scores), self.card.yahtzee_bonus_count)
+        total = self.card.get_card_score()
+
+        self.card.apply(Category.FIVES, DiceRoll([5, 5, 5, 5, 5]))
+        self.card.apply(Category.CHANCE, DiceRoll([2, 2, 2, 2, 2]))
+        self.assertEqual(self.card.yahtzee_bonus_count, 2)
+
+        self.assertIs(self.card.undo(), Category.CHANCE)
+        self.assertIs(self.card.undo(), Category.FIVES)
+        self.assertEqual((self.card.category_scores, self.card.yahtzee_bonus_count), before)
+        self.assertEqual(self.card.get_card_score(), total)
+        self.assertEqual(self.card.undo_depth, 1)
+
+    def test_redo_reapplies_undone_moves(self):
+        self.card.apply(Category.YAHTZEE, DiceRoll([3, 3, 3, 3, 3]))
+        self.card.apply(Category.FULL_HOUSE, DiceRoll([3, 3, 3, 3, 3]))
+        expected = (dict(self.card.category_scores), self.card.yahtzee_bonus_count)
+        self.card.undo()
+        self.card.undo()
+        self.assertIs(self.card.redo(), Category.YAHTZEE)
+        self.assertIs(self.card.redo(), Category.FULL_HOUSE)
+        self.assertEqual((self.card.category_scores, self.card.yahtzee_bonus_count), expected)
+
+    def test_apply_clears_redo_and_empty_history_raises(self):
+        with self.assertRaises(HistoryEmptyError):
+            self.card.undo()
+        self.card.apply(Category.ACES, DiceRoll([1, 1, 2, 3, 4]))
+        self.card.undo()
+        self.card.apply(Category.TWOS, DiceRoll([1, 1, 2, 3, 4]))
+        with self.assertRaises(HistoryEmptyError):
+            self.card.redo()
+
+    def test_failed_apply_records_nothing(self):
+        self.card.apply(Category.ACES, DiceRoll([1, 1, 2, 3, 4]))
+        with self.assertRaises(CategoryAlreadyScored):
+            self.card.apply(Category.ACES, DiceRoll([1, 1, 2, 3, 4]))
+        self.assertEqual(self.card.undo_depth, 1)
+
+
+class TestCategoryScores(BaseScorecardTest):
+    def test_behaves_like_dict_of_categories(self):
+        scores = self.card.category_scores
+        self.assertEqual(list(scores), list(Category))
+        self.assertEqual(scores, {category: None for category in Category})
+        scores[Category.SIXES] = 24
+        self.assertEqual(scores[Category.SIXES], 24)
+        self.assertEqual(scores.get(Category.SIXES), 24)
+        self.assertIn(Category.SIXES, scores)
+        self.assertNotIn("SIXES", scores)
+        with self.assertRaises(KeyError):
+            scores[cast(Category, "SIXES")]
+        with self.assertRaises(TypeError):
+            del scores[Category.SIXES]
+
+    def test_copy_is_independent(self):
+        scores = CategoryScores({Category.CHANCE: 20})
+        copied = scores.copy()
+        copied[Category.CHANCE] = None
+        self.assertEqual(scores[Category.CHANCE], 20)
+        self.assertIsNone(copied[Category.CHANCE])
+
 
 class TestScoringModule(BaseScorecardTest):
     def test_invalid_category(self):
@@ -1,9 +1,17 @@
 import unittest
 
-from yaht.category import Category
-from yaht.dicetypes import DiceRoll
+from yaht.category import CATEGORIES, Category
+from yaht.dicetypes import CANONICAL_ROLLS, DiceRoll
+from yaht.differential import representative_cards
+from yaht.packing import unpack_card
 from yaht.scorecard import Scorecard
-from yaht.scorecheck import is_combo_scoreable
+from yaht.scorecheck import (
+    calculate_combo_score,
+    category_scores_for,
+    filled_mask,
+    is_combo_scoreable,
+    legal_categories,
+)
 
 
 class TestIsPlayable(unittest.TestCase):
@@ -147,5 +155,51 @@ class TestIsPlayable(unittest.TestCase):
         self.assertIs(is_combo_scoreable(Category.THREE_OF_A_KIND, combo, self.card), False)
 
 
+class TestLegalCategories(unittest.TestCase):
+    def test_matches_is_combo_scoreable(self):
+        for packed in representative_cards(random_masks=4):
+            card = unpack_card(packed)
+            for numbers in CANONICAL_ROLLS:
+                roll = DiceRoll(list(numbers))
+                expected = sum(
+                    c.bit for c in CATEGORIES if is_combo_scoreable(c, roll, card)
+                )
+                self.assertEqual(legal_categories(roll, card), expected, (packed, numbers))
+
+    def test_given_filled_mask_matches_card(self):
+        card = Scorecard()
+        card.set_category_score(Category.YAHTZEE, DiceRoll([3, 3, 3, 3, 3]))
+        filled = filled_mask(card)
+        self.assertEqual(filled, Category.YAHTZEE.bit)
+        for numbers in CANONICAL_ROLLS:
+            roll = DiceRoll(list(numbers))
+            self.assertEqual(legal_categories(roll, card, filled), legal_categories(roll, card))
+            self.assertEqual(
+                category_scores_for(roll, card, filled), category_scores_for(roll, card)
+            )
+
+    def test_category_scores(self):
+        card = Scorecard()
+        card.set_category_score(Category.YAHTZEE, DiceRoll([3, 3, 3, 3, 3]))
+        card.set_category_score(Category.FIVES, DiceRoll([5, 5, 1, 2, 3]))
+
+        scores = category_scores_for(DiceRoll([1, 2, 3, 4, 4]), card)
+        self.assertIsNone(scores[Category.YAHTZEE.index])
+        self.assertIsNone(scores[Category.FIVES.index])
+        self.assertEqual(scores[Category.FOURS.index], 8)
+        self.assertEqual(scores[Category.SMALL_STRAIGHT.index], 30)
+        self.assertEqual(scores[Category.FULL_HOUSE.index], 0)
+        self.assertEqual(scores[Category.CHANCE.index], 14)
+
+        # Joker rules with FIVES filled: any lower box at full value, upper boxes zeroed
+        joker = DiceRoll([5, 5, 5, 5, 5])
+        scores = category_scores_for(joker, card)
+        self.assertEqual(scores[Category.LARGE_STRAIGHT.index], 40)
+        self.assertEqual(scores[Category.SIXES.index], 0)
+        self.assertEqual(
+            scores[Category.CHANCE.index], calculate_combo_score(Category.CHANCE, joker)
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
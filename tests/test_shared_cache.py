@@ -0,0 +1,95 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+
+from yaht.game import Game
+from yaht.player import BasicBotPlayer
+from yaht.shared_cache import WAYS, SharedDecisionCache
+
+_worker_cache: SharedDecisionCache | None = None
+
+
+def _attach(cache: SharedDecisionCache) -> None:
+    global _worker_cache
+    _worker_cache = cache
+
+
+def _fill(first: int) -> int:
+    assert _worker_cache is not None
+    for key in range(first, first + 50):
+        if _worker_cache.get(key) is None:
+            _worker_cache.put(key, key * 2)
+    return len(_worker_cache)
+
+
+class TestSharedDecisionCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = SharedDecisionCache(max_size=1024, stripes=4)
+        self.addCleanup(self.cache.__exit__)
+
+    def test_hit_and_miss_counts(self):
+        self.assertIsNone(self.cache.get(7))
+        self.cache.put(7, 3)
+        self.assertEqual(self.cache.get(7), 3)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(self.cache.hit_rate, 0.5)
+
+    def test_put_replaces_existing_decision(self):
+        self.cache.put(0, 1)
+        self.cache.put(0, 2)
+        self.assertEqual(self.cache.get(0), 2)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_size_is_bounded(self):
+        for key in range(5000):
+            self.cache.put(key, key)
+        self.assertLessEqual(len(self.cache), self.cache.max_size)
+
+    def test_evicts_unreferenced_entry_first(self):
+        cache = SharedDecisionCache(max_size=WAYS, stripes=1)
+        self.addCleanup(cache.__exit__)
+        for key in range(WAYS):
+            cache.put(key, key)
+        cache.get(0)
+        cache.put(WAYS, WAYS)
+        self.assertEqual(cache.get(0), 0)
+        self.assertIsNone(cache.get(1))
+        self.assertEqual(cache.get(WAYS), WAYS)
+
+    def test_rejects_values_too_wide(self):
+        with self.assertRaises(ValueError):
+            self.cache.put(1, 1 << 32)
+        with self.assertRaises(ValueError):
+            self.cache.put(-1, 0)
+
+    def test_rejects_out_of_range_key_lookups(self):
+        for key in (-1, 1 << 64):
+            with self.subTest(key=key), self.assertRaises(ValueError):
+                self.cache.get(key)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            SharedDecisionCache(max_size=0)
+
+    def test_shared_between_processes(self):
+        with ProcessPoolExecutor(2, initializer=_attach, initargs=(self.cache,)) as pool:
+            list(pool.map(_fill, [0, 25, 50]))
+        self.assertEqual(self.cache.get(30), 60)
+        self.assertEqual(self.cache.hits + self.cache.misses, 151)
+        self.assertGreater(self.cache.hits, 0)
+
+    def test_cached_games_match_uncached_games(self):
+        cache = SharedDecisionCache()
+        self.addCleanup(cache.__exit__)
+        for seed in (1, 2, 1):
+            plain = Game([BasicBotPlayer()], Random(seed))
+            cached = Game([BasicBotPlayer(cache=cache)], Random(seed))
+            plain.play_game()
+            cached.play_game()
+            self.assertEqual(cached.get_detailed_results(), plain.get_detailed_results())
+        self.assertGreater(cache.hits, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
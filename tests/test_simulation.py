@@ -0,0 +1,184 @@
+import threading
+import unittest
+from array import array
+from random import Random
+
+from yaht.cache import KEEP_ROLLING, DecisionCache
+from yaht.category import Category
+from yaht.dicetypes import CANONICAL_ROLLS, DiceRoll, thread_rng
+from yaht.exceptions import DiceRollCountError
+from yaht.game import Game
+from yaht.packing import pack_card, solver_state, unpack_card
+from yaht.player import BasicBotPlayer, SteppedPlayer
+from yaht.policy import PolicyBatchPlayer
+from yaht.scorecard import Scorecard
+from yaht.simulation import (
+    BatchStats,
+    run_games_threaded,
+    run_interleaved_games,
+    run_lockstep_games,
+)
+
+
+def _roll(index: int) -> DiceRoll:
+    return DiceRoll(list(CANONICAL_ROLLS[index]))
+
+
+class BatchBasicBot:
+    """BasicBotPlayer's decisions through the BatchPlayer protocol."""
+
+    def __init__(self, name: str = "BatchBot"):
+        self.name = name
+        self.bot = BasicBotPlayer()
+        self.calls = 0
+
+    def choose_rerolls(self, rolls, cards, rolls_left):
+        self.calls += 1
+        decisions = array("B")
+        for roll, card, left in zip(rolls, cards, rolls_left):
+            indices, keep_rolling = self.bot.choose_reroll(
+                _roll(roll), unpack_card(card), left
+            )
+            positions = sum(1 << i for i in indices)
+            decisions.append(positions | (KEEP_ROLLING if keep_rolling else 0))
+        return decisions
+
+    def choose_categories(self, rolls, cards):
+        self.calls += 1
+        return array(
+            "B",
+            [
+                self.bot.choose_category(_roll(roll), unpack_card(card)).index
+                for roll, card in zip(rolls, cards)
+            ],
+        )
+
+
+class TestThreadedRunner(unittest.TestCase):
+    def test_result_independent_of_thread_count(self):
+        players = [BasicBotPlayer("A"), BasicBotPlayer("B")]
+        serial = run_games_threaded(players, 24, seed=3, threads=1)
+        threaded = run_games_threaded(players, 24, seed=3, threads=4)
+        self.assertEqual(threaded, serial)
+        self.assertEqual(serial.games, 24)
+        self.assertGreaterEqual(sum(serial.wins), 24)
+
+    def test_shared_cached_player(self):
+        uncached = run_games_threaded([BasicBotPlayer()], 16, seed=8, threads=1)
+        shared = BasicBotPlayer(cache=DecisionCache())
+        cached = run_games_threaded([shared], 16, seed=8, threads=4)
+        self.assertEqual(cached, uncached)
+        self.assertGreater(shared.cache.hits, 0)
+
+    def test_no_games(self):
+        self.assertEqual(run_games_threaded([BasicBotPlayer()], 0), BatchStats.empty(1))
+
+
+class TestLockstepRunner(unittest.TestCase):
+    def test_matches_threaded_runner(self):
+        players = [BatchBasicBot("A"), BasicBotPlayer("B")]
+        lockstep = run_lockstep_games(players, 12, seed=5)
+        expected = run_games_threaded([BasicBotPlayer("A"), players[1]], 12, seed=5, threads=1)
+        self.assertEqual(lockstep, expected)
+
+    def test_decisions_are_batched_across_games(self):
+        player = BatchBasicBot()
+        run_lockstep_games([player], 20, seed=1)
+        # At most two reroll calls and one category call per turn
+        self.assertLessEqual(player.calls, 13 * 3)
+
+    def test_game_plays_batch_player(self):
+        batch = Game([BatchBasicBot()], Random(9))
+        batch.play_game()
+        basic = Game([BasicBotPlayer()], Random(9))
+        basic.play_game()
+        self.assertEqual(batch.snapshot(), basic.snapshot())
+
+
+class AlwaysRerolling:
+    name = "AlwaysRerolling"
+
+    def turn_steps(self, card):
+        while True:
+            yield 0
+
+
+class TestInterleavedRunner(unittest.TestCase):
+    def test_reproducible_for_seed(self):
+        players = [SteppedPlayer(BasicBotPlayer("A")), BasicBotPlayer("B")]
+        first = run_interleaved_games(players, 10, seed=2)
+        self.assertEqual(run_interleaved_games(players, 10, seed=2), first)
+        self.assertEqual(first.games, 10)
+        self.assertNotEqual(run_interleaved_games(players, 10, seed=3), first)
+
+    def test_plays_like_the_wrapped_player(self):
+        stepped = run_interleaved_games([SteppedPlayer(BasicBotPlayer())], 200, seed=6)
+        basic = run_games_threaded([BasicBotPlayer()], 200, seed=6, threads=1)
+        self.assertAlmostEqual(stepped.mean_scores()[0], basic.mean_scores()[0], delta=15)
+
+    def test_fourth_roll_rejected(self):
+        with self.assertRaises(DiceRollCountError):
+            run_interleaved_games([AlwaysRerolling()], 3, seed=0)
+
+    def test_game_plays_generator_player(self):
+        stepped = Game([SteppedPlayer(BasicBotPlayer())], Random(9))
+        stepped.play_game()
+        basic = Game([BasicBotPlayer()], Random(9))
+        basic.play_game()
+        self.assertEqual(stepped.snapshot(), basic.snapshot())
+
+
+class RecordingPolicy:
+    def __init__(self):
+        self.requests = []
+
+    def choose_reroll(self, state, roll, rolls_left):
+        self.requests.append((state, roll, rolls_left))
+        return 0
+
+    def choose_category(self, state, roll):
+        self.requests.append((state, roll))
+        return Category.CHANCE.index
+
+
+class TestPolicyBatchPlayer(unittest.TestCase):
+    def test_maps_policy_over_solver_states(self):
+        card = Scorecard()
+        card.set_category_score(Category.FOURS, DiceRoll([4, 4, 4, 1, 2]))
+        packed = pack_card(card)
+        policy = RecordingPolicy()
+        player = PolicyBatchPlayer(policy)
+
+        rerolls = player.choose_rerolls(
+            array("H", [3, 7]), array("Q", [0, packed]), array("B", [2, 1])
+        )
+        categories = player.choose_categories(array("H", [5]), array("Q", [packed]))
+        self.assertEqual(list(rerolls), [0, 0])
+        self.assertEqual(list(categories), [Category.CHANCE.index])
+        state = solver_state(packed)
+        self.assertEqual(policy.requests, [(0, 3, 2), (state, 7, 1), (state, 5)])
+
+
+class TestThreadRng(unittest.TestCase):
+    def test_each_thread_has_its_own_generator(self):
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(thread_rng()))
+        thread.start()
+        thread.join()
+        self.assertIs(thread_rng(), thread_rng())
+        self.assertIsNot(seen[0], thread_rng())
+
+
+class TestBatchStats(unittest.TestCase):
+    def test_merge_matches_recording_together(self):
+        together = BatchStats.empty(2)
+        first, second = BatchStats.empty(2), BatchStats.empty(2)
+        for scores, stats in (([100, 90], first), ([80, 120], second), ([70, 70], second)):
+            together.record(scores)
+            stats.record(scores)
+        first.merge(second)
+        self.assertEqual(first, together)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+from random import Random
+
+from yaht.category import Category
+from yaht.dicetypes import DiceCup, DiceRoll
+from yaht.game import Game
+from yaht.player import BasicBotPlayer
+from yaht.scorecard import Scorecard
+from yaht.simulation import run_games
+from yaht.snapshot import (
+    DICE_CUP_SIZE,
+    SCORECARD_SIZE,
+    pack_dice_cup,
+    pack_rng,
+    pack_scorecard,
+    unpack_dice_cup,
+    unpack_rng,
+    unpack_scorecard,
+)
+
+
+class TestPacking(unittest.TestCase):
+    def test_scorecard_round_trip(self):
+        card = Scorecard()
+        card.set_category_score(Category.YAHTZEE, DiceRoll([6, 6, 6, 6, 6]))
+        card.set_category_score(Category.SIXES, DiceRoll([6, 6, 6, 6, 6]))
+        card.zero_category(Category.LARGE_STRAIGHT, DiceRoll([1, 1, 2, 3, 4]))
+
+        restored = unpack_scorecard(pack_scorecard(card))
+        self.assertEqual(restored.category_scores, card.category_scores)
+        self.assertEqual(restored.yahtzee_bonus_count, 1)
+        self.assertEqual(restored.get_card_score(), card.get_card_score())
+
+    def test_dice_cup_round_trip(self):
+        cup = DiceCup(Random(3))
+        cup.roll_dice()
+        cup.roll_dice([0, 2])
+
+        restored = unpack_dice_cup(pack_dice_cup(cup))
+        self.assertEqual(restored.current_role.numbers, cup.current_role.numbers)
+        self.assertEqual(restored.roll_count, 2)
+
+    def test_unrolled_dice_cup_round_trip(self):
+        restored = unpack_dice_cup(pack_dice_cup(DiceCup()))
+        self.assertIsNone(restored.current_role)
+        self.assertEqual(restored.roll_count, 0)
+
+    def test_rng_round_trip(self):
+        rng = Random(11)
+        rng.random()
+        rng.gauss()
+        restored, size = unpack_rng(pack_rng(rng))
+        self.assertEqual(size, len(pack_rng(rng)))
+        self.assertEqual(restored.random(), rng.random())
+        self.assertEqual(restored.gauss(), rng.gauss())
+
+
+class TestGameSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.players = [BasicBotPlayer("A"), BasicBotPlayer("B")]
+
+    def test_resumed_game_matches_uninterrupted_game(self):
+        game = Game(self.players, Random(42))
+        for _ in range(9):
+            game.play_turn()
+        data = game.snapshot()
+
+        game.play_game()
+        resumed = Game.restore(self.players, data)
+        resumed.play_game()
+
+        self.assertTrue(resumed.is_over)
+        self.assertEqual(resumed.get_detailed_results(), game.get_detailed_results())
+
+    def test_snapshot_size_per_player(self):
+        one = len(Game(self.players[:1]).snapshot())
+        two = len(Game(self.players).snapshot())
+        self.assertEqual(two - one, SCORECARD_SIZE + DICE_CUP_SIZE)
+        self.assertLess(SCORECARD_SIZE + DICE_CUP_SIZE, 32)
+
+    def test_restore_rejects_wrong_player_count(self):
+        data = Game(self.players).snapshot()
+        with self.assertRaises(ValueError):
+            Game.restore(self.players[:1], data)
+
+
+class TestBatchCheckpoint(unittest.TestCase):
+    def test_resumed_batch_matches_uninterrupted_batch(self):
+        players = [BasicBotPlayer("A"), BasicBotPlayer("B")]
+        expected = run_games(players, 6, seed=5)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "batch.ckpt")
+            run_games(players, 4, seed=5, checkpoint_path=path, checkpoint_every=2)
+            resumed = run_games(players, 6, seed=5, checkpoint_path=path, checkpoint_every=2)
+
+        self.assertEqual(resumed, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from array import array
+
+from yaht.category import Category
+from yaht.dicetypes import DiceRoll, roll_index
+from yaht.scorecard import Scorecard
+from yaht.solver import (
+    CATEGORIES,
+    FULL_MASK,
+    STATE_COUNT,
+    card_state,
+    final_roll_values,
+    score_move,
+    solve,
+    state_index,
+    state_value,
+)
+
+
+def bit(category: Category) -> int:
+    return 1 << CATEGORIES.index(category)
+
+
+class TestStateValue(unittest.TestCase):
+    def setUp(self):
+        self.values = array("d", bytes(8 * STATE_COUNT))
+
+    def test_chance_only(self):
+        state = state_index(FULL_MASK ^ bit(Category.CHANCE), 63, False)
+        self.assertAlmostEqual(state_value(self.values, state), 70 / 3)
+
+    def test_yahtzee_only(self):
+        # Probability of five of a kind within three rolls is 0.0460...
+        state = state_index(FULL_MASK ^ bit(Category.YAHTZEE), 63, False)
+        self.assertAlmostEqual(state_value(self.values, state) / 50, 0.0460286, places=7)
+
+
+class TestScoreMove(unittest.TestCase):
+    def test_matches_scorecard_under_joker_rules(self):
+        card = Scorecard()
+        card.set_category_score(Category.YAHTZEE, DiceRoll([2, 2, 2, 2, 2]))
+        card.set_category_score(Category.FOURS, DiceRoll([4, 4, 1, 2, 3]))
+        roll = DiceRoll([4, 4, 4, 4, 4])
+        state = card_state(card)
+        before = card.get_card_score()
+
+        points, next_state = score_move(
+            state, roll_index(roll), CATEGORIES.index(Category.LARGE_STRAIGHT)
+        )
+        card.set_category_score(Category.LARGE_STRAIGHT, roll)
+
+        self.assertEqual(points, card.get_card_score() - before)
+        self.assertEqual(next_state, card_state(card))
+
+    def test_upper_bonus_earned_on_crossing(self):
+        state = state_index(bit(Category.ACES), 60, False)
+        points, next_state = score_move(
+            state, roll_index([6, 6, 1, 2, 3]), CATEGORIES.index(Category.SIXES)
+        )
+        self.assertEqual(points, 12 + 35)
+        self.assertEqual(next_state & 63, 63)
+
+    def test_filled_category_rejected(self):
+        with self.assertRaises(ValueError):
+            score_move(state_index(bit(Category.ACES), 0, False), 0, 0)
+
+
+class TestSolve(unittest.TestCase):
+    def test_parallel_solve_matches_serial_solve(self):
+        start = FULL_MASK ^ bit(Category.CHANCE) ^ bit(Category.YAHTZEE)
+        serial = solve(processes=1, start_mask=start)
+        parallel = solve(processes=2, start_mask=start)
+
+        for upper in (0, 40, 63):
+            for flag in (False, True):
+                state = state_index(start, upper, flag)
+                self.assertEqual(parallel[state], serial[state])
+        self.assertGreater(serial.expected_score, 70 / 3)
+
+    def test_yahtzee_scored_in_open_yahtzee_sets_bonus_flag(self):
+        start = FULL_MASK ^ bit(Category.CHANCE) ^ bit(Category.YAHTZEE)
+        values = solve(processes=1, start_mask=start)
+        state = state_index(start, 63, False)
+        sixes = roll_index([6, 6, 6, 6, 6])
+
+        points, next_state = score_move(state, sixes, CATEGORIES.index(Category.YAHTZEE))
+        self.assertEqual(points, 50)
+        self.assertEqual(next_state, state_index(start | bit(Category.YAHTZEE), 63, True))
+
+        # Chance is left with Yahtzee bonuses live
+        without_flag = state_index(start | bit(Category.YAHTZEE), 63, False)
+        self.assertGreater(values[next_state], values[without_flag])
+        in_chance = 30 + values[state_index(start | bit(Category.CHANCE), 63, False)]
+        self.assertEqual(
+            final_roll_values(values, state)[sixes], max(50 + values[next_state], in_chance)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from random import Random
+
+from yaht.game import Game
+from yaht.player import BasicBotPlayer
+from yaht.standings import Standings
+
+
+class TestStandings(unittest.TestCase):
+    def setUp(self):
+        self.players = [BasicBotPlayer(name) for name in "ABCDE"]
+        self.standings = Standings(self.players)
+        for player, score in zip(self.players, (40, 75, 40, 0, 120)):
+            self.standings.update(player, score)
+
+    def test_ranks_share_ties(self):
+        ranks = [self.standings.rank(player) for player in self.players]
+        self.assertEqual(ranks, [3, 2, 3, 5, 1])
+
+    def test_score_at_rank(self):
+        scores = [self.standings.score_at_rank(rank) for rank in range(1, 6)]
+        self.assertEqual(scores, [120, 75, 40, 40, 0])
+        with self.assertRaises(IndexError):
+            self.standings.score_at_rank(6)
+
+    def test_leaders(self):
+        a, b, c, _, e = self.players
+        self.assertEqual(self.standings.leaders(4), [(e, 120), (b, 75), (a, 40), (c, 40)])
+        self.assertEqual(self.standings.leaders(3), [(e, 120), (b, 75), (a, 40)])
+
+    def test_update_and_remove(self):
+        a, b, _, d, e = self.players
+        self.standings.update(d, 200)
+        self.standings.remove(e)
+        self.assertEqual(len(self.standings), 4)
+        self.assertNotIn(e, self.standings)
+        self.assertEqual(self.standings.rank(d), 1)
+        self.assertEqual(self.standings.rank(a), 3)
+        self.assertEqual(self.standings.leaders(2), [(d, 200), (b, 75)])
+
+    def test_rejects_out_of_range_scores(self):
+        with self.assertRaises(ValueError):
+            self.standings.update(self.players[0], 1576)
+
+    def test_rejected_update_keeps_player(self):
+        a = self.players[0]
+        with self.assertRaises(ValueError):
+            self.standings.update(a, 5000)
+        self.assertIn(a, self.standings)
+        self.assertEqual(len(self.standings), 5)
+        self.assertEqual(self.standings.score(a), 40)
+        self.assertEqual(self.standings.rank(a), 3)
+
+
+class TestLiveStandingsGame(unittest.TestCase):
+    def test_ranks_follow_card_scores(self):
+        players = [BasicBotPlayer(f"P{i}") for i in range(30)]
+        game = Game(players, Random(6), live_standings=True)
+        reference = Game(players, Random(6))
+        for _ in range(100):
+            game.play_turn()
+            reference.play_turn()
+        game.eliminate_player(players[3])
+        reference.eliminate_player(players[3])
+
+        assert game.standings is not None
+        self.assertEqual(len(game.standings), 29)
+        for player in game.active_players:
+            self.assertEqual(game.rank(player), reference.rank(player))
+
+        game.play_game()
+        reference.play_game()
+        winner = game.standings.leaders(1)[0][0]
+        self.assertIn(winner, reference.winning_players)
+        self.assertEqual(game.get_final_scores(), reference.get_final_scores())
+
+
+if __name__ == "__main__":
+    unittest.main()
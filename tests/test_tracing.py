@@ -0,0 +1,75 @@
+import unittest
+from random import Random
+
+from yaht import player, scorecard, scorecheck, tracing
+from yaht.category import Category
+from yaht.dicetypes import DiceRoll
+from yaht.game import Game
+from yaht.player import BasicBotPlayer
+from yaht.scorecard import Scorecard
+
+
+class TestTracing(unittest.TestCase):
+    def test_counts_hits_misses_and_joker_checks(self):
+        card = Scorecard()
+        with tracing.tracing() as trace:
+            card.set_category_score(Category.YAHTZEE, DiceRoll([2, 2, 2, 2, 2]))
+            self.assertFalse(
+                scorecheck.is_combo_scoreable(Category.CHANCE, DiceRoll([2, 2, 2, 2, 2]), card)
+            )
+            card.score_category(Category.FULL_HOUSE, DiceRoll([1, 2, 3, 4, 6]))
+
+        self.assertEqual(trace.scoreable_hits[Category.YAHTZEE], 1)
+        self.assertEqual(trace.scoreable_misses[Category.CHANCE], 1)
+        self.assertEqual(trace.scoreable_misses[Category.FULL_HOUSE], 1)
+        self.assertEqual(trace.joker_misses[Category.CHANCE], 1)
+        self.assertEqual(trace.scores, {Category.YAHTZEE: 1})
+        # Scorecard checks playability through legal_categories
+        self.assertEqual(trace.calls["is_combo_scoreable"], 1)
+        self.assertEqual(trace.calls["legal_categories"], 2)
+        self.assertGreater(trace.nanoseconds["legal_categories"], 0)
+        self.assertIn("FULL_HOUSE", trace.report())
+
+    def test_counts_legal_category_lookups(self):
+        card = Scorecard()
+        card.set_category_score(Category.YAHTZEE, DiceRoll([3, 3, 3, 3, 3]))
+        with tracing.tracing() as trace:
+            legal = scorecheck.legal_categories(DiceRoll([3, 3, 3, 3, 3]), card)
+        self.assertEqual(legal, Category.THREES.bit)
+        self.assertEqual(trace.scoreable_hits, {Category.THREES: 1})
+        self.assertEqual(trace.joker_hits, {Category.THREES: 1})
+        self.assertEqual(sum(trace.scoreable_misses.values()), 11)
+        self.assertEqual(sum(trace.joker_misses.values()), 11)
+        self.assertNotIn(Category.YAHTZEE, trace.scoreable_misses)
+
+    def test_restores_original_functions(self):
+        original = scorecheck.legal_categories
+        with tracing.tracing():
+            self.assertIsNot(scorecard.legal_categories, original)
+            self.assertIsNot(player.legal_categories, original)
+        self.assertIs(scorecard.legal_categories, original)
+        self.assertIs(player.legal_categories, original)
+        self.assertIs(scorecheck.legal_categories, original)
+
+    def test_traced_game_plays_identically(self):
+        players = [BasicBotPlayer()]
+        plain = Game(players, Random(4))
+        plain.play_game()
+        with tracing.tracing() as trace:
+            traced = Game(players, Random(4))
+            traced.play_game()
+        self.assertEqual(traced.snapshot(), plain.snapshot())
+        self.assertGreater(sum(trace.scoreable_hits.values()), 13)
+        # Once for each of the bot's choices and once for each move scored
+        self.assertEqual(trace.calls["legal_categories"], 26)
+
+    def test_cannot_nest(self):
+        with tracing.tracing():
+            with self.assertRaises(RuntimeError):
+                tracing.start()
+        with self.assertRaises(RuntimeError):
+            tracing.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()